@@ -39,3 +39,4 @@ class ExitErrorCodes(IntEnum):
     VMSLOGGER_SUBPROCESS_STARTUP = auto()
     WRONG_COMMAND_LINE_ARGUMENTS = auto()
     WRONG_QT_API = auto()
+    VMSLOGGER_MISSING_MODULE = auto()
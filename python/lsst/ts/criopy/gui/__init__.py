@@ -32,6 +32,7 @@ from .custom_labels import (
     Hz,
     InterlockOffLabel,
     KiloWatt,
+    LabelUpdateCounters,
     Liter,
     LiterMinute,
     LogEventWarning,
@@ -55,11 +56,15 @@ from .custom_labels import (
     Volt,
     WarningButton,
     WarningLabel,
+    flush_labels,
+    label_update_counters,
 )
 from .data_form_widget import DataFormButton, DataFormWidget
+from .decimation import min_max_decimate, replace_points
 from .formators import Formator
 from .histogram import Histogram
 from .logging_widget import LoggingWidget
+from .render_executor import RenderExecutor
 from .status_box import StatusBox, StatusWidget
 from .time_chart import TimeChart, TimeChartView, UserSelectedTimeChart
 from .topic_status_label import FieldButton, TopicStatusLabel
@@ -71,3 +76,4 @@ from .value_grid import (
     ValueGrid,
     WarningGrid,
 )
+from .value_table_model import ValueTableModel
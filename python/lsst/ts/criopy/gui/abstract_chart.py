@@ -19,8 +19,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.If not, see < https:  // www.gnu.org/licenses/>.
 
-import asyncio
-import concurrent
 import typing
 
 from PySide6.QtCharts import QAbstractAxis, QAbstractSeries, QChart
@@ -28,6 +26,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QGraphicsItem
 
 from ..time_cache import TimeCache
+from .render_executor import RenderExecutor
 
 __all__ = ["AbstractChart"]
 
@@ -63,9 +62,6 @@ class AbstractChart(QChart):
         self._next_update = [0.0] * axis_num
         self.update_interval = update_interval
 
-        self.update_task: asyncio.Future | concurrent.futures.Future = asyncio.Future()
-        self.update_task.set_result(None)
-
     def find_axis(self, title_text: str, axis_type: Qt.Orientation = Qt.Vertical) -> QAbstractAxis | None:
         """
         Locate axis.
@@ -146,7 +142,7 @@ class AbstractChart(QChart):
         # (paint,..) before manipulating axes. Lock would work as well, but as
         # we really care just about latest diagram repaint, better cancel what
         # shall anyway not make to the screen.
-        self.update_task.cancel()
+        RenderExecutor.instance().cancel(self)
         QApplication.instance().processEvents()
 
         for a in self.axes():
@@ -21,6 +21,7 @@
 __all__ = ["DataItem", "DataItemState"]
 
 import math
+import typing
 from enum import Enum
 
 from PySide6.QtWidgets import QGraphicsItem
@@ -42,13 +43,26 @@ class DataItemState(Enum):
 
 
 class DataItem(QGraphicsItem):
+    """Mirror item displaying data. Items are drawn with device coordinate
+    caching - a cached pixmap is used until the item calls update(), or the
+    view zoom changes.
+
+    Parameters
+    ----------
+    state : `DataItemState`
+        Item state.
+    """
+
     def __init__(self, state: DataItemState):
         super().__init__()
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         # actuator data
         self._data: float = math.nan
         self._state = state
         self._color_scale: None | GaugeScale = None
+        # (state, color, text) drawn by the last paint, see set_data
+        self._displayed: tuple[DataItemState, typing.Any, str] | None = None
 
     def update_data(self, data: float, state: DataItemState) -> None:
         """Updates actuator data.
@@ -67,8 +81,38 @@ class DataItem(QGraphicsItem):
         if self._data != data or self._state != state:
             self._data = data
             self._state = state
+            self._displayed = None
             self.update()
 
+    def set_data(self, data: float, state: DataItemState, color: typing.Any) -> bool:
+        """Sets actuator data without triggering redraw. Used for bulk updates,
+        where the caller issues a single update for all changed items.
+
+        Parameters
+        ----------
+        data : `float`
+             New data associated with the actuator.
+        state : `DataItemState`
+             New actuator state value.
+        color : `typing.Any`
+             Color key of the data. Usually color index returned by the scale
+             color_indices method.
+
+        Returns
+        -------
+        changed : `bool`
+            True if the displayed state, color or formatted value changed, and
+            the item needs to be redrawn.
+        """
+        self._data = data
+        self._state = state
+        text = "" if state == DataItemState.INACTIVE else self.format_value(data)
+        displayed = (state, color, text)
+        if displayed == self._displayed:
+            return False
+        self._displayed = displayed
+        return True
+
     def get_value(self) -> str:
         """Returns current value, string formatted to scale.
 
@@ -20,9 +20,10 @@
 
 import enum
 import math
+import typing
 
-from PySide6.QtCore import QPointF, QRect, Qt
-from PySide6.QtGui import QGuiApplication, QPainter, QPalette, QPen
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QBrush, QColor, QGuiApplication, QPainter, QPalette, QPen, QPixmap, QTransform
 from PySide6.QtWidgets import QStyleOptionGraphicsItem, QWidget
 
 from lsst.ts.xml.tables.m1m3 import ForceActuatorData
@@ -49,6 +50,12 @@ class ForceActuatorItem(DataItem):
     Force Actuator can be selected - then it is drawn with highlighting,
     showing it is the selected actuator.
 
+    Actuator drawing is cached. As any DataItem, it's repainted only after its
+    value, state or selection changes, or when the view zoom changes. The
+    actuator glyph (circle with value) is rendered
+    into a pixmap shared by all actuators displaying the same state, color
+    and text, only the actuator ID is drawn for each actuator.
+
     Parameters
     ----------
     actuator : `ForceActuatorData`
@@ -57,8 +64,17 @@ class ForceActuatorItem(DataItem):
         Force Actuator state.
     kind : `FASelection`
         FA kind - normal, selected or neighbour of selected.
+
+    Attributes
+    ----------
+    GLYPH_CACHE_SIZE : `int`
+        Maximal number of cached glyphs. The cache is cleared when full.
     """
 
+    GLYPH_CACHE_SIZE = 512
+
+    _glyphs: dict[tuple[typing.Any, ...], QPixmap] = {}
+
     def __init__(
         self,
         actuator: ForceActuatorData,
@@ -77,6 +93,12 @@ class ForceActuatorItem(DataItem):
         # properly actuator on display in e.g. mm (where X and Y ranges are
         # ~-4400 .. +4400).
         self._scale_factor = 25
+        self._bounds = QRectF(
+            self._center.x() - 11 * self._scale_factor,
+            self._center.y() - 11 * self._scale_factor,
+            22 * self._scale_factor,
+            22 * self._scale_factor,
+        )
 
     def setKind(self, kind: FASelection) -> None:
         """Set actuator kind (selection status).
@@ -127,14 +149,10 @@ class ForceActuatorItem(DataItem):
         self._color_scale = scale
         self.update()
 
-    def boundingRect(self) -> QRect:
-        """Returns rectangle occupied by drawing. Overridden method."""
-        return QRect(
-            self._center.x() - 10 * self._scale_factor,
-            self._center.y() - 10 * self._scale_factor,
-            20 * self._scale_factor,
-            20 * self._scale_factor,
-        )
+    def boundingRect(self) -> QRectF:
+        """Returns rectangle occupied by drawing, including outline of the
+        selected actuator neighbours. Overridden method."""
+        return self._bounds
 
     def get_value(self) -> str:
         """Returns current value, string formated to scale.
@@ -163,45 +181,27 @@ class ForceActuatorItem(DataItem):
             return str(v)
         return self._color_scale.format_value(v)
 
-    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget) -> None:
-        """Paint actuator. Overridden method."""
-        # if scale isn't set, don't draw
-        if self._color_scale is None:
-            return
-
-        palette = QGuiApplication.palette()
-        if not self.isEnabled():
-            palette.setCurrentColorGroup(QPalette.Inactive)
-
-        # basic font to write text
-        font = painter.font()
-        font.setPixelSize(6.5 * self._scale_factor)
-        font.setItalic(True)
-
-        def draw_actuator_id() -> None:
-            painter.setFont(font)
-            painter.drawText(
-                self._center.x() - 10 * self._scale_factor,
-                self._center.y() - 10 * self._scale_factor,
-                20 * self._scale_factor,
-                10 * self._scale_factor,
-                int(Qt.AlignBottom) | int(Qt.AlignHCenter),
-                str(self.actuator.actuator_id),
-            )
-
+    def _paint_glyph(self, painter: QPainter, brush: QBrush | None, text_color: QColor, text: str) -> None:
+        """Paints actuator circle and value."""
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         # paint grayed circle for actuators not providing the selected value
         if self._state == DataItemState.INACTIVE:
             painter.setPen(QPen(Qt.gray, self._scale_factor, Qt.DotLine))
             painter.drawEllipse(self._center, 10 * self._scale_factor, 10 * self._scale_factor)
-            draw_actuator_id()
             return
         lineStyle = Qt.SolidLine if self.isEnabled() else Qt.DotLine
         # draw rectangle around selected actuator
         if self._kind == FASelection.SELECTED:
             painter.setPen(QPen(Qt.black, self._scale_factor, lineStyle))
-            painter.drawRect(self.boundingRect())
+            painter.drawRect(
+                QRectF(
+                    self._center.x() - 10 * self._scale_factor,
+                    self._center.y() - 10 * self._scale_factor,
+                    20 * self._scale_factor,
+                    20 * self._scale_factor,
+                )
+            )
         elif self._kind == FASelection.NEAR_NEIGHBOR:
             painter.setPen(QPen(Qt.darkBlue, self._scale_factor * 2, lineStyle))
         elif self._kind == FASelection.FAR_NEIGHBOR:
@@ -209,29 +209,21 @@ class ForceActuatorItem(DataItem):
         else:
             painter.setPen(QPen(Qt.red, self._scale_factor, lineStyle))
 
-        # draw actuator with warning in red color
-        if self._state == DataItemState.WARNING:
-            painter.setBrush(Colors.ERROR)
-        else:
-            assert self._data is not None
-            brush = self._color_scale.get_brush(self._data)
-            painter.setBrush(brush)
+        assert brush is not None
+        painter.setBrush(brush)
         # draw actuator, write value
         painter.drawEllipse(self._center, 10 * self._scale_factor, 10 * self._scale_factor)
 
-        painter.setPen(palette.buttonText().color())
-
-        draw_actuator_id()
-
-        vstr = self.get_value()
-        if len(vstr) > 6:
+        font = painter.font()
+        if len(text) > 6:
             font.setPixelSize(3.5 * self._scale_factor)
-        elif len(vstr) > 3:
+        elif len(text) > 3:
             font.setPixelSize(4.5 * self._scale_factor)
-
-        font.setItalic(False)
+        else:
+            font.setPixelSize(6.5 * self._scale_factor)
         font.setBold(True)
         painter.setFont(font)
+        painter.setPen(text_color)
         # draw value
         painter.drawText(
             self._center.x() - 10 * self._scale_factor,
@@ -239,5 +231,105 @@ class ForceActuatorItem(DataItem):
             20 * self._scale_factor,
             10 * self._scale_factor,
             int(Qt.AlignTop) | int(Qt.AlignHCenter),
-            vstr,
+            text,
+        )
+
+    def _glyph(
+        self,
+        key: tuple[typing.Any, ...],
+        transform: QTransform,
+        device_ratio: float,
+        brush: QBrush | None,
+        text_color: QColor,
+        text: str,
+    ) -> QPixmap:
+        """Returns cached glyph pixmap, renders it if not cached."""
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            return glyph
+
+        if len(self._glyphs) >= self.GLYPH_CACHE_SIZE:
+            self._glyphs.clear()
+
+        bounds = self._bounds
+        size = transform.mapRect(bounds).size() * device_ratio
+        glyph = QPixmap(math.ceil(abs(size.width())), math.ceil(abs(size.height())))
+        glyph.setDevicePixelRatio(device_ratio)
+        glyph.fill(Qt.transparent)
+
+        glyph_painter = QPainter(glyph)
+        glyph_painter.scale(transform.m11(), transform.m22())
+        glyph_painter.translate(-bounds.x(), -bounds.y())
+        self._paint_glyph(glyph_painter, brush, text_color, text)
+        glyph_painter.end()
+
+        self._glyphs[key] = glyph
+        return glyph
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget) -> None:
+        """Paint actuator. Overridden method."""
+        # if scale isn't set, don't draw
+        if self._color_scale is None:
+            return
+
+        palette = QGuiApplication.palette()
+        if not self.isEnabled():
+            palette.setCurrentColorGroup(QPalette.Inactive)
+        text_color = palette.buttonText().color()
+
+        if self._state == DataItemState.INACTIVE:
+            brush = None
+            text = ""
+            brush_key = None
+        else:
+            if self._state == DataItemState.WARNING:
+                # draw actuator with warning in red color
+                brush = QBrush(Colors.ERROR)
+            else:
+                assert self._data is not None
+                brush = QBrush(self._color_scale.get_brush(self._data))
+            text = self.get_value()
+            brush_key = (brush.color().rgba(), brush.style())
+
+        transform = painter.worldTransform()
+        if transform.type().value > QTransform.TxScale.value:
+            # glyph pixmaps cannot be rotated or sheared
+            self._paint_glyph(painter, brush, text_color, text)
+        else:
+            device_ratio = painter.device().devicePixelRatioF()
+            key = (
+                self._state,
+                self._kind,
+                self.isEnabled(),
+                brush_key,
+                text_color.rgba(),
+                text,
+                transform.m11(),
+                transform.m22(),
+                device_ratio,
+            )
+            glyph = self._glyph(key, transform, device_ratio, brush, text_color, text)
+            top_left = transform.map(self._bounds.topLeft())
+            painter.save()
+            painter.resetTransform()
+            painter.drawPixmap(QPointF(round(top_left.x()), round(top_left.y())), glyph)
+            painter.restore()
+
+        # basic font to write text
+        font = painter.font()
+        font.setPixelSize(6.5 * self._scale_factor)
+        font.setItalic(True)
+        font.setBold(False)
+        painter.setFont(font)
+        if self._state == DataItemState.INACTIVE:
+            painter.setPen(QPen(Qt.gray, self._scale_factor, Qt.DotLine))
+        else:
+            painter.setPen(text_color)
+        painter.drawText(
+            self._center.x() - 10 * self._scale_factor,
+            self._center.y() - 10 * self._scale_factor,
+            20 * self._scale_factor,
+            10 * self._scale_factor,
+            int(Qt.AlignBottom) | int(Qt.AlignHCenter),
+            str(self.actuator.actuator_id),
         )
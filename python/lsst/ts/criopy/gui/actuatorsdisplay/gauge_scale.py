@@ -22,7 +22,7 @@
 import astropy.units as u
 import numpy as np
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPaintEvent
+from PySide6.QtGui import QBrush, QColor, QPainter, QPaintEvent, QPixmap, QResizeEvent
 from PySide6.QtWidgets import QWidget
 
 from .. import Formator
@@ -31,12 +31,24 @@ from .. import Formator
 class GaugeScale(QWidget):
     """Draws gauge with color scale.
 
+    Values are mapped to LUT_SIZE colors. Brushes for those colors are created
+    once, get_brush returns the cached brushes. The gauge gradient is drawn
+    into a pixmap, which is redrawn only when the gauge is resized or its
+    range changes.
+
     Parameters
     ----------
     fmt: `str`
         Value formatter. Can specify how many decimal places will be visible.
+
+    Attributes
+    ----------
+    LUT_SIZE : `int`
+        Number of distinct colors values are mapped to.
     """
 
+    LUT_SIZE = 256
+
     def __init__(self, fmt: str = ".02f", unit: u.Unit | None = None):
         super().__init__()
         self._min: float = np.nan
@@ -45,6 +57,11 @@ class GaugeScale(QWidget):
         self._default_fmt = fmt
         self.set_format(fmt, unit)
 
+        self._lut = [QBrush(self.get_color(i / (self.LUT_SIZE - 1))) for i in range(self.LUT_SIZE)]
+        self._invalid_brush = QBrush(Qt.gray, Qt.Dense5Pattern)
+        self._empty_range_brush = QBrush(Qt.red, Qt.DiagCrossPattern)
+        self._gradient: QPixmap | None = None
+
         self.setMinimumSize(100, 100)
         self.setMaximumWidth(200)
 
@@ -59,8 +76,11 @@ class GaugeScale(QWidget):
         max_range : `float`
                Maximal data range.
         """
+        if self._min == min_range and self._max == max_range:
+            return
         self._min = min_range
         self._max = max_range
+        self._gradient = None
         self.update()
 
     def set_format(self, fmt: str | None, unit: u.Unit | None = None) -> None:
@@ -99,12 +119,38 @@ class GaugeScale(QWidget):
             QBrush representing the value on scale.
         """
         if not (np.isfinite(value)):
-            return QBrush(Qt.gray, Qt.Dense5Pattern)
+            return self._invalid_brush
         if self._min == self._max:
-            return QBrush(Qt.red, Qt.DiagCrossPattern)
+            return self._empty_range_brush
         # draw using value as index into possible colors in HSV model
         hue = 1 - (value - self._min) / (self._max - self._min)
-        return self.get_color(hue)
+        return self._lut[round(min(max(hue, 0), 1) * (self.LUT_SIZE - 1))]
+
+    def color_indices(self, values: np.ndarray) -> np.ndarray:
+        """Maps values to color indices. Values with the same index are drawn
+        with the same color.
+
+        Parameters
+        ----------
+        values : `np.ndarray`
+            Values to map.
+
+        Returns
+        -------
+        indices : `np.ndarray`
+            Integer indices in 0 .. LUT_SIZE - 1 range. -1 for non-finite
+            values. All finite values are mapped to 0 if the range is empty.
+        """
+        values = np.asarray(values, dtype=float)
+        finite = np.isfinite(values)
+        indices = np.full(values.shape, -1, dtype=int)
+        if self._min == self._max:
+            indices[finite] = 0
+            return indices
+
+        hue = 1 - (values[finite] - self._min) / (self._max - self._min)
+        indices[finite] = np.rint(np.clip(hue, 0, 1) * (self.LUT_SIZE - 1))
+        return indices
 
     def get_color(self, hue: float) -> QColor:
         """Returns color from "hue" (0-1 range).
@@ -121,16 +167,37 @@ class GaugeScale(QWidget):
         """
         return QColor.fromHsvF(hue * 0.7, min(1, 1.5 - hue), 1)
 
+    def paint_gradient(self, painter: QPainter, width: int, height: int) -> None:
+        """Paints gauge gradient. Called only when the cached gradient pixmap
+        needs to be redrawn. Can be overridden in subclasses.
+
+        Parameters
+        ----------
+        painter : `QPainter`
+            Painter drawing to the gradient pixmap.
+        width : `int`
+            Gradient width.
+        height : `int`
+            Gradient height.
+        """
+        for x in range(0, height):
+            painter.setPen(self.get_color(x / height))
+            painter.drawLine(0, x, width, x)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self._gradient = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event: QPaintEvent) -> None:
-        """Overridden method. Paint gauge as series of lines, and adds text
-        labels."""
+        """Overridden method. Paint gauge from the cached gradient pixmap,
+        and adds text labels."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         swidth = max(self.width() - 100, 20)
         sheight = self.height()
         if self._min == self._max:
-            painter.setBrush(QBrush(Qt.red, Qt.DiagCrossPattern))
+            painter.setBrush(self._empty_range_brush)
             painter.drawRect(0, 0, swidth, sheight)
             painter.setPen(Qt.black)
             if self._min is not None:
@@ -144,9 +211,12 @@ class GaugeScale(QWidget):
                 )
             return
 
-        for x in range(0, sheight):
-            painter.setPen(self.get_color(x / sheight))
-            painter.drawLine(0, x, swidth, x)
+        if self._gradient is None:
+            self._gradient = QPixmap(swidth, sheight)
+            gradient_painter = QPainter(self._gradient)
+            self.paint_gradient(gradient_painter, swidth, sheight)
+            gradient_painter.end()
+        painter.drawPixmap(0, 0, self._gradient)
 
         painter.setPen(Qt.black)
         painter.drawText(
@@ -23,6 +23,7 @@
 from collections import defaultdict
 from math import sqrt
 
+import numpy as np
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QPen
 from PySide6.QtWidgets import QGraphicsScene
@@ -139,6 +140,7 @@ class Mirror(QGraphicsScene):
         self.fa: list[ForceActuatorItem] = []
         self.fcu: list[FCUItem] = []
         self.scanners: list[ScannerItem] = []
+        self._color_scale: GaugeScale | None = None
 
         if support:
             for fa in FATable:
@@ -205,6 +207,7 @@ class Mirror(QGraphicsScene):
         scale : `GaugeScale`
             Data scale.
         """
+        self._color_scale = scale
         for fa in self.fa:
             fa.set_color_scale(scale)
 
@@ -234,6 +237,43 @@ class Mirror(QGraphicsScene):
         """
         self.fa[index].update_data(data, state)
 
+    def update_force_actuators(
+        self, indices: np.ndarray, values: np.ndarray, states: np.ndarray
+    ) -> list[int]:
+        """Updates values and states of multiple actuators. Only actuators
+        whose displayed value, color or state changed are redrawn. Colors are
+        compared as scale color indices, so value changes not visible on the
+        display don't trigger redraw.
+
+        Parameters
+        ----------
+        indices : `np.ndarray`
+            Force Actuator indices.
+        values : `np.ndarray`
+            New actuator values.
+        states : `np.ndarray`
+            New actuator states, DataItemState values.
+
+        Returns
+        -------
+        changed : `[int]`
+            Indices of changed actuators.
+        """
+        color_indices = getattr(self._color_scale, "color_indices", None)
+        colors = values.tolist() if color_indices is None else color_indices(values).tolist()
+
+        changed = []
+        for index, value, state, color in zip(indices.tolist(), values.tolist(), states.tolist(), colors):
+            state = DataItemState(state)
+            fa = self.fa[index]
+            if fa.set_data(None if state == DataItemState.INACTIVE else value, state, color):
+                # item updates are collected and processed by the scene in a
+                # single repaint
+                fa.update()
+                changed.append(index)
+
+        return changed
+
     def get_scanner(self, tc: ThermocoupleData) -> ScannerItem | None:
         """Returns scanner belonging to the given thermocouple.
 
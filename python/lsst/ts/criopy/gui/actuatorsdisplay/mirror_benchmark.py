@@ -0,0 +1,145 @@
+# This file is part of M1M3 SS GUI.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+__all__ = ["RepaintResult", "benchmark_repaint"]
+
+import time
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QGraphicsItem
+
+from .data_item import DataItemState
+from .gauge_scale import GaugeScale
+from .mirror_view import MirrorView
+
+
+@dataclass
+class RepaintResult:
+    """Mirror repaint benchmark results. All times are in milliseconds per
+    frame."""
+
+    cached: bool
+    """True if items were drawn with device coordinate caching."""
+    full: float
+    """Repaint of the whole view."""
+    update: float
+    """Update of changed actuators values, followed by the view repaint."""
+    pan: float
+    """View scrolled by a pixel and repainted."""
+    render: float
+    """Scene rendered into an image."""
+
+    def __str__(self) -> str:
+        return (
+            f"{'cached' if self.cached else 'uncached'}: full {self.full:.2f} ms,"
+            f" update {self.update:.2f} ms, pan {self.pan:.2f} ms, render {self.render:.2f} ms"
+        )
+
+
+def benchmark_repaint(
+    frames: int = 50,
+    changed: int = 10,
+    width: int = 1000,
+    height: int = 800,
+    cached: bool = True,
+) -> RepaintResult:
+    """Measures repaint times of mirror view with force actuators. Requires
+    QApplication, which can use the offscreen platform.
+
+    Parameters
+    ----------
+    frames : `int`, optional
+        Number of measured repaints. Defaults to 50.
+    changed : `int`, optional
+        Number of actuators changing value in each update frame. Defaults to
+        10.
+    width : `int`, optional
+        View width (pixels). Defaults to 1000.
+    height : `int`, optional
+        View height (pixels). Defaults to 800.
+    cached : `bool`, optional
+        If False, disable items caching. Defaults to True.
+
+    Returns
+    -------
+    result : `RepaintResult`
+        Benchmark results.
+    """
+    view = MirrorView(True, False, False)
+    view.resize(width, height)
+    view.update_scale()
+
+    mirror = view.scene()
+    if not cached:
+        for item in mirror.items():
+            item.setCacheMode(QGraphicsItem.NoCache)
+
+    count = len(mirror.fa)
+    indices = np.arange(count)
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-1000, 1000, count)
+    states = np.full(count, DataItemState.ACTIVE.value)
+
+    scale = GaugeScale()
+    scale.set_range(-1000, 1000)
+    view.set_color_scale(scale)
+    view.update_force_actuators(indices, values, states)
+    view.show()
+    QCoreApplication.processEvents()
+
+    def measure(frame: typing.Callable[[int], None]) -> float:
+        frame(0)
+        start = time.perf_counter()
+        for i in range(1, frames + 1):
+            frame(i)
+        return (time.perf_counter() - start) * 1000 / frames
+
+    def full(i: int) -> None:
+        view.viewport().repaint()
+
+    def update(i: int) -> None:
+        changed_indices = rng.choice(count, changed, replace=False)
+        values[changed_indices] = rng.uniform(-1000, 1000, changed)
+        view.update_force_actuators(indices, values, states)
+        QCoreApplication.processEvents()
+
+    def pan(i: int) -> None:
+        scroll = view.horizontalScrollBar()
+        scroll.setValue(scroll.value() + (1 if i % 2 else -1))
+        view.viewport().repaint()
+
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+
+    def render(i: int) -> None:
+        painter = QPainter(image)
+        mirror.render(painter)
+        painter.end()
+
+    result = RepaintResult(
+        cached=cached, full=measure(full), update=measure(update), pan=measure(pan), render=measure(render)
+    )
+    view.close()
+    return result
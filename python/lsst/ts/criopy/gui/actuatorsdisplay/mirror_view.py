@@ -172,6 +172,25 @@ class MirrorView(QGraphicsView):
         if self._selected_actuator.actuator.actuator_id == fa.actuator_id:
             self.selectionChanged.emit(self._selected_actuator if self._selected_actuator.active else None)
 
+    def update_force_actuators(self, indices: np.ndarray, values: np.ndarray, states: np.ndarray) -> None:
+        """Update values and states of multiple actuators. Only actuators
+        with changed displayed value, color or state are redrawn.
+
+        Parameters
+        ----------
+        indices : `np.ndarray`
+            Force Actuator indices.
+        values : `np.ndarray`
+            New actuator values. Ignored for inactive actuators.
+        states : `np.ndarray`
+            New actuator states, DataItemState values.
+        """
+        self._mirror.update_force_actuators(indices, values, states)
+        if not (isinstance(self._selected_actuator, ForceActuatorItem)):
+            return
+        if np.any(indices == self._selected_actuator.actuator.index):
+            self.selectionChanged.emit(self._selected_actuator if self._selected_actuator.active else None)
+
     def update_fcu(self, fcu: FCUData, value: float, state: DataItemState) -> None:
         """Update FCU's value and state.
 
@@ -87,6 +87,7 @@ class MirrorWidget(QWidget):
         self._warning.hide()
 
         self.setLayout(layout)
+        self.set_color_scale()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         self.mirror_view.resetTransform()
@@ -136,7 +137,7 @@ class MirrorWidget(QWidget):
         if hasattr(self._curent_gauge, "set_format"):
             self._curent_gauge.set_format(field.fmt, field.unit)
 
-    def set_range(self, min_value: float, max_value: float) -> None:
+    def set_range(self, min_value: float, max_value: float, redraw: bool = True) -> None:
         """Sets range used for color scaling.
 
         Parameters
@@ -145,10 +146,16 @@ class MirrorWidget(QWidget):
            Minimal value.
         max_value : `float`
            Maximal value.
+        redraw : `bool`, optional
+           Redraw all mirror items with the new range. Can be False if
+           actuators are updated with MirrorView.update_force_actuators right
+           after, as that redraws actuators whose color changed. Defaults to
+           True.
         """
         if self._curent_gauge in [self._gauge, self._integer]:
             self._curent_gauge.set_range(min_value, max_value)
-        self.set_color_scale()
+        if redraw:
+            self.set_color_scale()
 
     def set_color_scale(self) -> None:
         self.mirror_view.set_color_scale(self._curent_gauge)
@@ -100,6 +100,7 @@ class ScannerItem(DataItem):
                 self._values[i] = value
                 self._data = np.mean(self._values)
                 self._state = state
+                self.update()
                 return
         raise RuntimeError(f"Cannot find thermocouple {tc_name} in scanner {self.name}!")
 
@@ -18,6 +18,7 @@
 # this program.If not, see <https://www.gnu.org/licenses/>.
 
 import typing
+from dataclasses import dataclass
 from datetime import datetime
 
 import astropy.units as u
@@ -89,6 +90,9 @@ __all__ = [
     "LogEventWarning",
     "SimulationStatus",
     "DockWindow",
+    "LabelUpdateCounters",
+    "flush_labels",
+    "label_update_counters",
 ]
 
 
@@ -135,8 +139,161 @@ class ColoredButton(QPushButton):
         self.setColor(color)
 
 
-class DataLabel(QLabel):
-    """Displays data from (SAL originated) signal.
+class _LabelTextBatch:
+    """Applies labels texts changes in batches, once per frame. Only the last
+    text set to a label during a frame is applied."""
+
+    FLUSH_INTERVAL = 40
+    """Interval (milliseconds) between batch applications."""
+
+    def __init__(self) -> None:
+        self._pending: dict[QLabel, str] = {}
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.FLUSH_INTERVAL)
+        self._timer.timeout.connect(self.flush)
+
+    def set_text(self, label: QLabel, text: str) -> None:
+        if not self._pending:
+            self._timer.start()
+        self._pending[label] = text
+
+    def discard(self, label: QLabel) -> None:
+        self._pending.pop(label, None)
+
+    def flush(self) -> None:
+        pending = self._pending
+        self._pending = {}
+        for label, text in pending.items():
+            try:
+                QLabel.setText(label, text)
+            except RuntimeError:
+                # label was deleted before the batch was applied
+                pass
+
+
+_label_text_batch: _LabelTextBatch | None = None
+
+
+def _batch() -> _LabelTextBatch:
+    global _label_text_batch
+    if _label_text_batch is None:
+        _label_text_batch = _LabelTextBatch()
+    return _label_text_batch
+
+
+def flush_labels() -> None:
+    """Applies pending labels texts immediately."""
+    _batch().flush()
+
+
+_UNSET = object()
+
+
+class _TextCache:
+    """Value and text last displayed by a label. Kept outside of the label, as
+    setting attributes of Qt objects is slow."""
+
+    __slots__ = ("value", "text", "applied", "suppressed")
+
+    def __init__(self) -> None:
+        self.value: typing.Any = _UNSET
+        self.text = "---"
+        self.applied = 0
+        self.suppressed = 0
+
+
+class _CachedText:
+    """Mixin for labels displaying values. Remembers the last value and
+    displayed text, formats only changed values and applies only changed
+    texts. Texts are applied in batches, once per frame."""
+
+    _text_cache: _TextCache
+
+    @property
+    def applied(self) -> int:
+        """Number of updates changing the displayed text."""
+        return self._text_cache.applied
+
+    @property
+    def suppressed(self) -> int:
+        """Number of updates not changing the displayed text."""
+        return self._text_cache.suppressed
+
+    def _value_changed(self, value: typing.Any) -> bool:
+        cache = self._text_cache
+        last = cache.value
+        try:
+            same = bool(value == last) or (value != value and last != last)
+        except (TypeError, ValueError):
+            same = False
+        if same:
+            cache.suppressed += 1
+            return False
+        cache.value = value
+        return True
+
+    def _update_text(self, text: str) -> None:
+        cache = self._text_cache
+        if text == cache.text:
+            cache.suppressed += 1
+            return
+        cache.text = text
+        cache.applied += 1
+        _batch().set_text(self, text)  # type: ignore[arg-type]
+
+    def setText(self, text: str) -> None:
+        """Sets text directly, bypassing the cache. Pending batched text is
+        discarded and the next value is formatted and displayed.
+
+        Parameters
+        ----------
+        text : `str`
+            New label text.
+        """
+        cache = self._text_cache
+        cache.value = _UNSET
+        cache.text = text
+        _batch().discard(self)  # type: ignore[arg-type]
+        super().setText(text)  # type: ignore[misc]
+
+    @Slot()
+    def _reset_cache(self) -> None:
+        self._text_cache.value = _UNSET
+
+
+@dataclass
+class LabelUpdateCounters:
+    """Labels updates statistics."""
+
+    applied: int
+    """Number of updates changing the displayed text."""
+    suppressed: int
+    """Number of updates not changing the displayed text."""
+
+
+def label_update_counters(window: QWidget) -> LabelUpdateCounters:
+    """Returns updates statistics of value labels in a window.
+
+    Parameters
+    ----------
+    window : `QWidget`
+        Window with labels.
+
+    Returns
+    -------
+    counters : `LabelUpdateCounters`
+        Sum of the window labels counters.
+    """
+    labels = [label for label in window.findChildren(QLabel) if isinstance(label, _CachedText)]
+    return LabelUpdateCounters(
+        sum(label.applied for label in labels), sum(label.suppressed for label in labels)
+    )
+
+
+class DataLabel(_CachedText, QLabel):
+    """Displays data from (SAL originated) signal. Text is updated only when
+    value changes.
 
     Parameters
     ----------
@@ -152,6 +309,7 @@ class DataLabel(QLabel):
 
     def __init__(self, signal: Signal | None = None, field: str | None = None):
         super().__init__("---")
+        self._text_cache = _TextCache()
         self._field = field
         if signal is not None:
             signal.connect(self.new_data)
@@ -176,11 +334,13 @@ class DataLabel(QLabel):
         value : `bool`
             Current (=to be displayed) variable value. True means warning.
         """
-        self.setText(str(value))
+        if self._value_changed(value):
+            self._update_text(str(value))
 
 
-class UnitLabel(QLabel):
-    """Qt Label that can display and convert Astropy units.
+class UnitLabel(_CachedText, QLabel):
+    """Qt Label that can display and convert Astropy units. Values are
+    formatted and displayed only when changed.
 
     Parameters
     ----------
@@ -196,9 +356,11 @@ class UnitLabel(QLabel):
         formator: Formator | None = None,
     ):
         super().__init__("---")
+        self._text_cache = _TextCache()
         self.formator = Formator() if formator is None else formator
 
         self.resetFormat.connect(self.formator.reset_formator)
+        self.resetFormat.connect(self._reset_cache)
 
     def __copy__(self) -> "UnitLabel":
         return UnitLabel(self.formator)
@@ -212,7 +374,8 @@ class UnitLabel(QLabel):
         value : `float`
             Current (=to be displayed) variable value.
         """
-        self.setText(self.formator.format(value))
+        if self._value_changed(value):
+            self._update_text(self.formator.format(value))
 
     def setTextColor(self, color: QColor) -> None:
         """Change text color.
@@ -267,7 +430,8 @@ class DataFormatorLabel(UnitLabel):
 
     @Slot()
     def new_data(self, data: BaseMsgType) -> None:
-        self.setText(self.formator.format_data(data))  # type: ignore[attr-defined]
+        if self._value_changed(getattr(data, self.formator._field)):  # type: ignore[attr-defined]
+            self._update_text(self.formator.format_data(data))  # type: ignore[attr-defined]
 
 
 class DataUnitLabel(DataFormatorLabel):
@@ -538,8 +702,10 @@ class PressureInBar(DataUnitLabel):
         self.unit_name = "bar"
 
     def setValue(self, value: float) -> None:
+        if not self._value_changed(value):
+            return
         psi = value * u.mbar.to(u.imperial.psi)
-        self.setText(f"{value:.04f} bar ({psi:.02f} psi)")
+        self._update_text(f"{value:.04f} bar ({psi:.02f} psi)")
 
 
 class PressureInmBar(DataLabel):
@@ -548,10 +714,12 @@ class PressureInmBar(DataLabel):
         self.unit_name = "mbar"  # this is only for display
 
     def setValue(self, value: float) -> None:
+        if not self._value_changed(value):
+            return
         mbar = value * u.mbar
         bar = (mbar).to(u.bar).value
         psi = mbar.to(u.imperial.psi).value
-        self.setText(f"{bar:.04f} bar ({psi:.02f} psi)")
+        self._update_text(f"{bar:.04f} bar ({psi:.02f} psi)")
 
 
 class Hours(DataUnitLabel):
@@ -589,8 +757,10 @@ class DMS(DataUnitLabel):
         super().__init__(signal, field, fmt)
 
     def setValue(self, value: float) -> None:
+        if not self._value_changed(value):
+            return
         dms = Angle(value * u.deg).dms
-        self.setText(f"{dms.d:.0f}<b>°</b> {dms.m:02.0f}<b>'</b> {dms.s:05.02f}<b>\"</b>")
+        self._update_text(f"{dms.d:.0f}<b>°</b> {dms.m:02.0f}<b>'</b> {dms.s:05.02f}<b>\"</b>")
 
 
 class DataDegC(DataUnitLabel):
@@ -674,9 +844,9 @@ class OnOffLabel(DataLabel):
             is raised.
         """
         if value:
-            self.setText(f"<font color='{Colors.ERROR.name()}'>On</font>")
+            self._update_text(f"<font color='{Colors.ERROR.name()}'>On</font>")
         else:
-            self.setText(f"<font color='{Colors.OK.name()}'>Off</font>")
+            self._update_text(f"<font color='{Colors.OK.name()}'>Off</font>")
 
 
 class PowerOnOffLabel(DataLabel):
@@ -697,9 +867,9 @@ class PowerOnOffLabel(DataLabel):
             Current (=to be displayed) variable value. True means power is On.
         """
         if value:
-            self.setText("<font color='green'>On</font>")
+            self._update_text("<font color='green'>On</font>")
         else:
-            self.setText("<font color='gold'>Off</font>")
+            self._update_text("<font color='gold'>Off</font>")
 
 
 class ConnectedLabel(DataLabel):
@@ -733,9 +903,9 @@ class ConnectedLabel(DataLabel):
             Current (=to be displayed) variable value. True means connected.
         """
         if is_connected:
-            self.setText(f"<font color='{Colors.OK.name()}'>Connected</font>")
+            self._update_text(f"<font color='{Colors.OK.name()}'>Connected</font>")
         else:
-            self.setText(f"<font color='{Colors.ERROR.name()}'>Disconnected</font>")
+            self._update_text(f"<font color='{Colors.ERROR.name()}'>Disconnected</font>")
 
 
 class ErrorLabel(DataLabel):
@@ -769,9 +939,9 @@ class ErrorLabel(DataLabel):
             Current (=to be displayed) variable value. True means error.
         """
         if value:
-            self.setText(f"<font color='{Colors.ERROR.name()}'>ERROR</font>")
+            self._update_text(f"<font color='{Colors.ERROR.name()}'>ERROR</font>")
         else:
-            self.setText(f"<font color='{Colors.OK.name()}'>OK</font>")
+            self._update_text(f"<font color='{Colors.OK.name()}'>OK</font>")
 
 
 class WarningLabel(DataLabel):
@@ -805,9 +975,9 @@ class WarningLabel(DataLabel):
             Current (=to be displayed) variable value. True means warning.
         """
         if value:
-            self.setText(f"<font color='{Colors.ERROR.name()}'>WARNING</font>")
+            self._update_text(f"<font color='{Colors.ERROR.name()}'>WARNING</font>")
         else:
-            self.setText(f"<font color='{Colors.OK.name()}'>OK</font>")
+            self._update_text(f"<font color='{Colors.OK.name()}'>OK</font>")
 
 
 class WarningButton(ColoredButton):
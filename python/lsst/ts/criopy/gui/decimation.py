@@ -0,0 +1,87 @@
+# This file is part of cRIO UIs.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org). See the COPYRIGHT file at the top - level directory
+# of this distribution for details of code ownership.
+#
+# This program is free software : you can redistribute it and / or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from PySide6.QtCharts import QXYSeries
+
+__all__ = ["min_max_decimate", "replace_points"]
+
+
+def min_max_decimate(x: np.ndarray, y: np.ndarray, buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Decimate line for plotting. Points are split into buckets of equal
+    size; minimum and maximum of every bucket are kept, in the original
+    order. The decimated line looks the same as the original one when a
+    bucket covers a pixel. NaN values are ignored; a bucket with only NaNs
+    is represented by its first point.
+
+    Parameters
+    ----------
+    x : `numpy.ndarray`
+        X values (timestamps), monotonic.
+    y : `numpy.ndarray`
+        Y values.
+    buckets : `int`
+        Number of buckets. Usually plot width in pixels.
+
+    Returns
+    -------
+    x : `numpy.ndarray`
+        Decimated x values. At most 2 * (buckets + 1) points.
+    y : `numpy.ndarray`
+        Decimated y values.
+    """
+    n = len(y)
+    if buckets < 1 or n <= 2 * buckets:
+        return x, y
+
+    size = int(np.ceil(n / buckets))
+    m = n - n % size
+    y = np.asarray(y)
+    nans = np.isnan(y)
+    # NaNs shall be neither minimum nor maximum
+    low = np.where(nans, np.inf, y)
+    high = np.where(nans, -np.inf, y)
+
+    offsets = np.arange(0, m, size)[:, np.newaxis]
+    indices = np.stack(
+        (low[:m].reshape(-1, size).argmin(axis=1), high[:m].reshape(-1, size).argmax(axis=1)), axis=1
+    )
+    indices = (np.sort(indices, axis=1) + offsets).ravel()
+    if m < n:
+        indices = np.concatenate((indices, np.sort([m + low[m:].argmin(), m + high[m:].argmax()])))
+    return x[indices], y[indices]
+
+
+def replace_points(serie: QXYSeries, x: np.ndarray, y: np.ndarray, buckets: int = 0) -> None:
+    """Replace serie points, decimating them if buckets is provided.
+
+    Parameters
+    ----------
+    serie : `QXYSeries`
+        Serie which points shall be replaced.
+    x : `numpy.ndarray`
+        New x values.
+    y : `numpy.ndarray`
+        New y values.
+    buckets : `int`, optional
+        Number of decimation buckets, see min_max_decimate. Defaults to 0 - no
+        decimation.
+    """
+    x, y = min_max_decimate(x, y, buckets)
+    serie.replaceNp(np.ascontiguousarray(x, dtype=np.float64), np.ascontiguousarray(y, dtype=np.float64))
@@ -0,0 +1,244 @@
+# This file is part of cRIO UIs.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org). See the COPYRIGHT file at the top - level directory
+# of this distribution for details of code ownership.
+#
+# This program is free software : you can redistribute it and / or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.If not, see <https://www.gnu.org/licenses/>.
+
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+import typing
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+__all__ = ["RenderExecutor"]
+
+
+class _RenderJob:
+    """Pending calculation.
+
+    Parameters
+    ----------
+    key : `typing.Hashable`
+        Job key. Only the latest job with the same key is kept.
+    calculate : `typing.Callable[[], typing.Any]`
+        Function calculating data. Run in executor thread.
+    plot : `typing.Callable[[typing.Any], None]`
+        Function plotting calculated data. Run in Qt thread.
+    """
+
+    def __init__(
+        self,
+        key: typing.Hashable,
+        calculate: typing.Callable[[], typing.Any],
+        plot: typing.Callable[[typing.Any], None],
+    ):
+        self.key = key
+        self.calculate = calculate
+        self.plot = plot
+        self.cancelled = False
+
+
+class RenderExecutor(QObject):
+    """Process-wide executor for chart data calculations.
+
+    Widgets submit a job consisting of calculation, run in an executor thread,
+    and plot, run in Qt (GUI) thread with the calculation result. Jobs are
+    keyed, usually by widget and its part. Only the latest pending job with
+    the same key survives - older pending jobs are dropped, as their result
+    would be anyway replaced on screen by the latest one. Jobs with the same
+    key are never calculated in parallel.
+
+    Use the instance() method to access the process-wide executor.
+
+    Parameters
+    ----------
+    max_workers : `int`, optional
+        Number of executor threads. Defaults to 2.
+    max_queue : `int`, optional
+        Maximal number of pending jobs. When reached, the oldest pending job
+        is dropped. Defaults to 64.
+
+    Attributes
+    ----------
+    dropped_frames : `int`
+        Number of jobs dropped, either as replaced by a newer job with the same
+        key or because the queue was full.
+    calculated_frames : `int`
+        Number of calculated jobs.
+    last_compute_time : `float`
+        Duration of the last calculation (seconds).
+    max_compute_time : `float`
+        Maximal calculation duration (seconds).
+    total_compute_time : `float`
+        Sum of all calculations durations (seconds).
+    """
+
+    _calculated = Signal(object, object, float)
+
+    _instance: "RenderExecutor | None" = None
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 64):
+        super().__init__()
+        self.max_queue = max_queue
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="RenderExecutor"
+        )
+        self._lock = threading.Lock()
+        # jobs waiting for a thread
+        self._queued: collections.OrderedDict[typing.Hashable, _RenderJob] = collections.OrderedDict()
+        # jobs being calculated or waiting for plot
+        self._running: dict[typing.Hashable, _RenderJob] = {}
+        # jobs submitted while a job with the same key was running
+        self._waiting: dict[typing.Hashable, _RenderJob] = {}
+
+        self.dropped_frames = 0
+        self.calculated_frames = 0
+        self.last_compute_time = 0.0
+        self.max_compute_time = 0.0
+        self.total_compute_time = 0.0
+
+        self._calculated.connect(self._plot, Qt.QueuedConnection)
+
+    @classmethod
+    def instance(cls) -> "RenderExecutor":
+        """Returns process-wide executor. The executor is created on the first
+        call, which shall be made from Qt thread."""
+        if cls._instance is None:
+            cls._instance = RenderExecutor()
+        return cls._instance
+
+    def queue_depth(self) -> int:
+        """Returns number of jobs waiting for calculation."""
+        with self._lock:
+            return len(self._queued) + len(self._waiting)
+
+    def mean_compute_time(self) -> float:
+        """Returns mean calculation duration (seconds)."""
+        if self.calculated_frames == 0:
+            return 0.0
+        return self.total_compute_time / self.calculated_frames
+
+    def submit(
+        self,
+        key: typing.Hashable,
+        calculate: typing.Callable[[], typing.Any],
+        plot: typing.Callable[[typing.Any], None],
+    ) -> None:
+        """Submit a job. Shall be called from Qt thread.
+
+        Parameters
+        ----------
+        key : `typing.Hashable`
+            Job key. Pending job with the same key is replaced. Use (owner,
+            part) tuple to allow cancel(owner) calls.
+        calculate : `typing.Callable[[], typing.Any]`
+            Function calculating data. Run in executor thread, so it shall not
+            access Qt widgets.
+        plot : `typing.Callable[[typing.Any], None]`
+            Function plotting calculated data. Called in Qt thread with
+            calculate return value.
+        """
+        job = _RenderJob(key, calculate, plot)
+        with self._lock:
+            if key in self._running:
+                if key in self._waiting:
+                    self.dropped_frames += 1
+                self._waiting[key] = job
+                return
+
+            self._enqueue(job)
+
+        self._executor.submit(self._calculate)
+
+    def cancel(self, owner: typing.Any) -> None:
+        """Cancel all jobs of the owner. Results of running calculations will
+        not be plotted.
+
+        Parameters
+        ----------
+        owner : `typing.Any`
+            Job key, or the first item of job key tuple.
+        """
+
+        def owned(key: typing.Hashable) -> bool:
+            return key is owner or (isinstance(key, tuple) and len(key) > 0 and key[0] is owner)
+
+        with self._lock:
+            for jobs in (self._queued, self._waiting):
+                for key in [k for k in jobs.keys() if owned(k)]:
+                    del jobs[key]
+            for key, job in self._running.items():
+                if owned(key):
+                    job.cancelled = True
+
+    def _enqueue(self, job: _RenderJob) -> None:
+        # shall be called with the lock held
+        if job.key in self._queued:
+            self.dropped_frames += 1
+            del self._queued[job.key]
+        elif len(self._queued) >= self.max_queue:
+            self.dropped_frames += 1
+            self._queued.popitem(last=False)
+        self._queued[job.key] = job
+
+    def _calculate(self) -> None:
+        with self._lock:
+            if len(self._queued) == 0:
+                return
+            key, job = self._queued.popitem(last=False)
+            self._running[key] = job
+
+        start = time.monotonic()
+        try:
+            result = job.calculate()
+        except Exception as ex:
+            result = ex
+        self._calculated.emit(job, result, time.monotonic() - start)
+
+    @Slot()
+    def _plot(self, job: _RenderJob, result: typing.Any, compute_time: float) -> None:
+        self.calculated_frames += 1
+        self.last_compute_time = compute_time
+        self.max_compute_time = max(self.max_compute_time, compute_time)
+        self.total_compute_time += compute_time
+
+        with self._lock:
+            cancelled = job.cancelled
+            del self._running[job.key]
+            waiting = self._waiting.pop(job.key, None)
+            if waiting is not None:
+                self._enqueue(waiting)
+
+        if waiting is not None:
+            self._executor.submit(self._calculate)
+
+        if cancelled:
+            return
+
+        if isinstance(result, Exception):
+            logging.error("Exception calculating %s: %s", job.key, result, exc_info=result)
+            return
+
+        try:
+            job.plot(result)
+        except RuntimeError as ex:
+            # widget C++ object was deleted while the job was running
+            if "already deleted" not in str(ex):
+                raise
@@ -2,11 +2,12 @@ from .application import Application
 from .application_status_widget import ApplicationStatusWidget
 from .chart_widget import Axis, AxisValue, ChartWidget
 from .csc_control_widget import CSCControlWidget
+from .derived_cache import DerivedCache
 from .eui_window import EUIWindow
 from .player_widget import PlayerWidget
 from .replay_widget import ReplayWidget
 from .sal_error_code_widget import SALErrorCodeWidget
-from .sal_log import LogDock, LogWidget
+from .sal_log import LogDock, LogWidget, Messages
 from .sal_status_bar import SALStatusBar
 from .splash_screen import SplashScreen
 from .state_enabled import (
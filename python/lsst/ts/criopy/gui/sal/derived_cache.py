@@ -0,0 +1,105 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["DerivedCache"]
+
+import typing
+from collections import OrderedDict
+
+
+class DerivedCache:
+    """
+    Memoizes values calculated from topic data. The same message is usually
+    delivered to multiple widgets (graph, detail, value table,..), each
+    calling its fields get_value. With the cache, a value is calculated only
+    once per message.
+
+    Values are keyed by calculation name, message identity and message
+    private_sndStamp. Type name can't be used to distinguish topics, as all
+    replayed messages are EfdTopic instances. Cached messages are referenced
+    from the cache, so their identity isn't reused while cached. Data without
+    private_sndStamp aren't cached. Cached values are shared among all callers
+    and shall not be modified.
+
+    Parameters
+    ----------
+    size : `int`, optional
+        Maximal number of cached values. The least recently used value is
+        dropped when the cache is full. Defaults to 32.
+
+    Attributes
+    ----------
+    hits : `int`
+        Number of values served from the cache.
+    misses : `int`
+        Number of calculated values.
+    """
+
+    def __init__(self, size: int = 32):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        # values are stored together with the message, keeping its id unique
+        self._values: OrderedDict[tuple[str, int, float], tuple[typing.Any, typing.Any]] = OrderedDict()
+
+    def get(
+        self, name: str, data: typing.Any, calculate: typing.Callable[[typing.Any], typing.Any]
+    ) -> typing.Any:
+        """Returns cached value, calculates it if not cached.
+
+        Parameters
+        ----------
+        name : `str`
+            Calculation name.
+        data : `BaseMsgType`
+            Topic data.
+        calculate : `typing.Callable[[BaseMsgType], typing.Any]`
+            Calculates value from data.
+
+        Returns
+        -------
+        value : `typing.Any`
+            Value calculated from data.
+        """
+        snd_stamp = getattr(data, "private_sndStamp", None)
+        if snd_stamp is None:
+            self.misses += 1
+            return calculate(data)
+
+        key = (name, id(data), snd_stamp)
+        try:
+            _, value = self._values[key]
+            self._values.move_to_end(key)
+            self.hits += 1
+            return value
+        except KeyError:
+            pass
+
+        self.misses += 1
+        value = calculate(data)
+        self._values[key] = (data, value)
+        if len(self._values) > self.size:
+            self._values.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drops all cached values."""
+        self._values.clear()
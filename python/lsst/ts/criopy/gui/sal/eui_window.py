@@ -23,7 +23,7 @@ import typing
 from functools import partial
 
 from PySide6.QtCore import QSettings, Slot
-from PySide6.QtGui import QCloseEvent
+from PySide6.QtGui import QCloseEvent, QShowEvent
 from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
@@ -50,6 +50,10 @@ class EUIWindow(QMainWindow):
 
     A button is provided to show any page a separate window.
 
+    Pages are constructed when first selected, so the startup doesn't wait
+    for construction (and signal connection) of pages operator doesn't look
+    at.
+
     Parameters
     ----------
     name : `str`
@@ -92,7 +96,7 @@ class EUIWindow(QMainWindow):
 
         self.replay_widget: ReplayWidget | None = None
 
-        self.pages: dict[str, typing.Callable[..., QWidget]] = {}
+        self.pages: dict[str, partial[QWidget]] = {}
         self.windows: dict[str, list[QWidget]] = {}
 
         self.application_pagination = QListWidget()
@@ -121,7 +125,7 @@ class EUIWindow(QMainWindow):
         try:
             self.restoreGeometry(settings.value("geometry"))
             self.restoreState(settings.value("windowState"))
-            self._last_tab = settings.value("currentTab")
+            self._last_tab = settings.value("currentTab", "")
         except AttributeError:
             self.resize(*default_size)
 
@@ -142,12 +146,19 @@ class EUIWindow(QMainWindow):
         ----
         A class and constructor parameters are passed, as the application
         creates new object when new window is requested. This works much better
-        than any (deep) copying.
+        than any (deep) copying. The page object is created when the page is
+        selected for the first time.
         """
 
         self.pages[name] = partial(widget_class, *params)
         self.application_pagination.addItem(name)
-        self.tab_widget.addTab(widget_class(*params), name)
+
+        # page is constructed in the placeholder when first selected
+        placeholder = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        placeholder.setLayout(layout)
+        self.tab_widget.addTab(placeholder, name)
         self.windows[name] = []
 
         if self._last_tab == "" and self.application_pagination.count() == 1:
@@ -177,7 +188,7 @@ class EUIWindow(QMainWindow):
     def make_window(self, checked: bool) -> None:
         """Create new window with copy of currently selected tab."""
         name = self.application_pagination.currentItem().text()
-        widget = self.pages[name]()
+        widget = self._create_page(name)
         widget.setWindowTitle(f"{name}:{len(self.windows[name]) + 1}")
         widget.show()
         self.windows[name].append(widget)
@@ -195,8 +206,40 @@ class EUIWindow(QMainWindow):
         """
         if row < 0:
             return
+        placeholder = self.tab_widget.widget(row)
+        if placeholder.layout().count() == 0:
+            placeholder.layout().addWidget(self._create_page(self.tab_widget.tabText(row)))
         self.tab_widget.setCurrentIndex(row)
 
+    def _create_page(self, name: str) -> QWidget:
+        """Creates page widget. As the page is created after remote data were
+        received, the latest data of the page comms are re-emitted, so
+        the page displays them.
+
+        Parameters
+        ----------
+        name : `str`
+            Page name.
+
+        Returns
+        -------
+        page : `QWidget`
+            New page widget.
+        """
+        page = self.pages[name]
+        widget = page()
+        comms = [c for c in self.comms if any(c is arg for arg in page.args)]
+        for comm in comms if len(comms) > 0 else self.comms:
+            comm.reemit_remote()
+        return widget
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Selects the first page if no page was selected, e.g. when the saved
+        current page wasn't added."""
+        if self.application_pagination.currentRow() < 0 and self.application_pagination.count() > 0:
+            self.application_pagination.setCurrentRow(0)
+        super().showEvent(event)
+
     @asyncClose
     async def closeEvent(self, event: QCloseEvent) -> None:
         """Called as the window is being closed.
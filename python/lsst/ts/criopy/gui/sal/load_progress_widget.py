@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["LoadProgressWidget"]
+__all__ = ["CacheStatisticsModel", "LoadProgressWidget"]
 
 import time
 
@@ -27,7 +27,7 @@ from PySide6.QtWidgets import QHBoxLayout, QTreeView, QWidget
 
 from lsst.ts.criopy.salcomm import EfdCacheRequest
 
-from ...salcomm import Player
+from ...salcomm import EfdCache, Player
 
 
 class LoadProgressModel(QStandardItemModel):
@@ -143,10 +143,53 @@ class LoadProgressModel(QStandardItemModel):
         self.removeRows(row, 1)
 
 
+class CacheStatisticsModel(QStandardItemModel):
+    """
+    Model for QTreeView showing cached topics size and hit rate.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setHorizontalHeaderLabels(["Topic", "Rows", "Size", "Hit rate"])
+
+    def update_statistics(self, cache: EfdCache) -> None:
+        """
+        Updates statistics from the cache. Topic rows are added as needed.
+
+        Parameters
+        ----------
+        cache : `EfdCache`
+            Cache to report.
+        """
+        total = 0
+        for topic, c in cache.topics():
+            items = self.findItems(topic, column=0)
+            if len(items) == 0:
+                self.appendRow([QStandardItem(topic)] + [QStandardItem() for i in range(3)])
+                row = self.rowCount() - 1
+            else:
+                row = items[0].index().row()
+
+            accesses = c.hits + c.misses
+            self.item(row, 1).setText("---" if c.data is None else str(len(c.data)))
+            self.item(row, 2).setText(f"{c.nbytes / 1024**2:.1f} MiB")
+            self.item(row, 3).setText("---" if accesses == 0 else f"{100 * c.hits / accesses:.1f}%")
+            total += c.nbytes
+
+        self.setHorizontalHeaderLabels(
+            [
+                "Topic",
+                "Rows",
+                f"Size ({total / 1024**2:.1f} MiB, evicted {cache.evicted / 1024**2:.1f} MiB)",
+                "Hit rate",
+            ]
+        )
+
+
 class LoadProgressWidget(QWidget):
     """
     Widget showing request being executed. Contains QTreeView with requests
-    being executed.
+    being executed, and QTreeView with cached topics statistics.
     """
 
     def __init__(self) -> None:
@@ -160,8 +203,20 @@ class LoadProgressWidget(QWidget):
         for col, width in enumerate([50, 100, 200, 125, 50]):
             self.in_progress.setColumnWidth(col, width)
 
+        self.statistics = QTreeView()
+        self.statistics.setModel(CacheStatisticsModel())
+
+        self.statistics.setSortingEnabled(True)
+
+        for col, width in enumerate([200, 75, 100, 75]):
+            self.statistics.setColumnWidth(col, width)
+
+        self.player: Player | None = None
+        self._updates = 0
+
         layout = QHBoxLayout()
         layout.addWidget(self.in_progress)
+        layout.addWidget(self.statistics)
 
         self.setLayout(layout)
 
@@ -169,10 +224,15 @@ class LoadProgressWidget(QWidget):
 
     def timerEvent(self, event: QTimerEvent) -> None:
         """
-        Called to update requests elapsed times.
+        Called to update requests elapsed times, and once per second cache
+        statistics.
         """
         self.in_progress.model().update_times()
 
+        self._updates += 1
+        if self._updates % 10 == 0 and self.player is not None and self.player.cache is not None:
+            self.statistics.model().update_statistics(self.player.cache)
+
     def connect_player(self, player: Player) -> None:
         """
         Called to connect progress widget to new Player.
@@ -182,6 +242,7 @@ class LoadProgressWidget(QWidget):
         player : `Player`
             New Player responsible for request playbacks.
         """
+        self.player = player
         model = self.in_progress.model()
 
         player.requestStarted.connect(model.request_started)
@@ -190,6 +251,7 @@ class LoadProgressWidget(QWidget):
 
     def clear(self) -> None:
         """
-        Remove all requests from the list.
+        Remove all requests from the list, and cache statistics.
         """
         self.in_progress.setModel(LoadProgressModel())
+        self.statistics.setModel(CacheStatisticsModel())
@@ -0,0 +1,118 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["LogResult", "benchmark_log"]
+
+import time
+import types
+from dataclasses import dataclass
+
+from PySide6.QtCore import QCoreApplication
+
+from .sal_log import Messages
+
+
+@dataclass
+class LogResult:
+    """Log storm benchmark results."""
+
+    batched: bool
+    """True if messages were buffered and flushed once per frame."""
+    messages: int
+    """Number of received messages."""
+    rate: float
+    """Simulated message rate (messages per second)."""
+    busy: float
+    """Time (seconds) spent processing and displaying the messages."""
+    load: float
+    """Busy time divided by the simulated storm duration. Values above 1 mean
+    the GUI cannot keep up with the storm."""
+
+    def __str__(self) -> str:
+        return (
+            f"{'batched' if self.batched else 'unbatched'}: {self.messages} messages"
+            f" at {self.rate:.0f}/s, busy {self.busy:.3f} s, load {self.load * 100:.1f}%"
+        )
+
+
+def benchmark_log(
+    messages: int = 5000,
+    rate: float = 2000,
+    fps: float = 25,
+    max_lines: int = 1000,
+    batched: bool = True,
+) -> LogResult:
+    """Simulates fault storm - burst of ILC warnings - and measures time
+    needed to display the messages. Requires QApplication, which can use the
+    offscreen platform.
+
+    Parameters
+    ----------
+    messages : `int`, optional
+        Number of messages. Defaults to 5000.
+    rate : `float`, optional
+        Messages per second. Defaults to 2000.
+    fps : `float`, optional
+        Display refresh rate - messages received during a frame are flushed
+        together. Defaults to 25.
+    max_lines : `int`, optional
+        Maximal number of displayed messages. Defaults to 1000.
+    batched : `bool`, optional
+        If False, append every message into the document as it arrives.
+        Defaults to True.
+
+    Returns
+    -------
+    result : `LogResult`
+        Benchmark results.
+    """
+    view = Messages()
+    view.setMaximumBlockCount(max_lines)
+    view.resize(1000, 600)
+    view.show()
+    QCoreApplication.processEvents()
+
+    per_frame = max(1, round(rate / fps))
+    start_stamp = time.time()
+
+    def message(i: int) -> types.SimpleNamespace:
+        return types.SimpleNamespace(
+            private_sndStamp=start_stamp + i / rate,
+            level=30 + (i % 3) * 10,
+            message=f"ILC warning for FA {i % 156 + 101} <response timeout> #{i}",
+        )
+
+    start = time.perf_counter()
+    for frame_start in range(0, messages, per_frame):
+        for i in range(frame_start, min(frame_start + per_frame, messages)):
+            data = message(i)
+            if batched:
+                view.logMessage(data)
+            else:
+                view.appendHtml(view.format(data))
+                view.ensureCursorVisible()
+        if batched:
+            view.flush()
+        QCoreApplication.processEvents()
+    busy = time.perf_counter() - start
+
+    view.close()
+    return LogResult(batched=batched, messages=messages, rate=rate, busy=busy, load=busy * rate / messages)
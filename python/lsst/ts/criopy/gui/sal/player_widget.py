@@ -22,7 +22,7 @@
 __all__ = ["PlayerWidget"]
 
 from astropy.time import Time, TimeDelta
-from PySide6.QtCore import QDateTime, Qt, QTimerEvent, Slot
+from PySide6.QtCore import QDateTime, QStandardPaths, Qt, QTimerEvent, Slot
 from PySide6.QtWidgets import (
     QDateTimeEdit,
     QDoubleSpinBox,
@@ -80,6 +80,10 @@ class PlayerWidget(QWidget):
 
         self.play_time = self.start.dateTime()
 
+        # replay requested while the previous replay was running
+        self._pending_replay: QDateTime | None = None
+        self._replaying = False
+
         self.slider = QSlider(Qt.Horizontal)
 
         self.current = MSecDateTimeEdit(None)
@@ -99,6 +103,8 @@ class PlayerWidget(QWidget):
 
         play_speed_box.valueChanged.connect(self.change_play_speed)
 
+        self.stalls_label = QLabel("0")
+
         current_layout = QHBoxLayout()
         current_layout.addWidget(QLabel("Current time"))
         current_layout.addWidget(self.current)
@@ -107,6 +113,8 @@ class PlayerWidget(QWidget):
         current_layout.addWidget(self.step_size_box)
         current_layout.addWidget(QLabel("Play speed"))
         current_layout.addWidget(play_speed_box)
+        current_layout.addWidget(QLabel("Stalls"))
+        current_layout.addWidget(self.stalls_label)
 
         play_icon = self.style().standardIcon(QStyle.SP_MediaPlay)
 
@@ -221,12 +229,35 @@ class PlayerWidget(QWidget):
         self.sal.freeze(self.player.cache)
         self.setEnabled(True)
 
+    @Slot()
+    def stalled(self, stalls: int) -> None:
+        self.stalls_label.setText(str(stalls))
+
     @asyncSlot()
     async def replay(self, date_time: QDateTime) -> None:
+        """Replay data at the given time. If the previous replay is still
+        running (waiting for data), only the latest requested time is
+        replayed after it finishes."""
+        self._pending_replay = date_time
+        if self._replaying:
+            return
+
+        self._replaying = True
+        try:
+            while self._pending_replay is not None:
+                date_time = self._pending_replay
+                self._pending_replay = None
+                await self._replay(date_time)
+        finally:
+            self._replaying = False
+
+    async def _replay(self, date_time: QDateTime) -> None:
         if self.player is None:
-            self.player = Player(self.sal)
+            cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+            self.player = Player(self.sal, cache_dir=cache_dir if cache_dir else None)
             self.player.downloadStarted.connect(self.download_started)
             self.player.downloadFinished.connect(self.download_finished)
+            self.player.stalled.connect(self.stalled)
 
             self.load_progress.connect_player(self.player)
 
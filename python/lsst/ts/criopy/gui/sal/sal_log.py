@@ -19,11 +19,12 @@
 
 __all__ = ["LEVELS", "LogToolBar", "LogWidget", "LogDock", "Messages"]
 
+from collections import deque
 from datetime import datetime
 from html import escape
 
-from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QTimer, Signal, Slot
+from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
     QComboBox,
     QDockWidget,
@@ -118,6 +119,13 @@ class LogToolBar(QWidget):
 class Messages(QPlainTextEdit):
     """Displays log messages.
 
+    Messages are buffered and inserted into the document with a single
+    insertion per flush, so bursts of messages don't trigger re-layout on every
+    message. Only the most recent maximumBlockCount messages are kept, both in
+    the document and in the buffer. Messages are formatted when flushed, so
+    messages dropped from the buffer or with level below the display level
+    are never formatted.
+
     Parameters
     ----------
     comms : `[SALComm]` or `SALComm`
@@ -142,6 +150,9 @@ class Messages(QPlainTextEdit):
         "color:red; font-weight:bold;",
     ]
 
+    FLUSH_INTERVAL = 40
+    """Interval (milliseconds) between buffered messages flushes."""
+
     def __init__(self, *comms: MetaSAL):
         super().__init__()
         self.setReadOnly(True)
@@ -151,20 +162,98 @@ class Messages(QPlainTextEdit):
         font.setStyleHint(QFont.TypeWriter)
         self.setFont(font)
 
+        self._displayLevel = 0
+        self._pending: deque[BaseMsgType] = deque()
+
+        self._flushTimer = QTimer(self)
+        self._flushTimer.setSingleShot(True)
+        self._flushTimer.setInterval(self.FLUSH_INTERVAL)
+        self._flushTimer.timeout.connect(self.flush)
+
+        self.setMaximumBlockCount(1000)
+
         for comm in comms:
             comm.logMessage.connect(self.logMessage)
 
-    @Slot()
-    def logMessage(self, data: BaseMsgType) -> None:
+    def setMaximumBlockCount(self, maximum: int) -> None:
+        """Sets maximal number of displayed messages.
+
+        Parameters
+        ----------
+        maximum : `int`
+            Maximal number of messages. 0 means unlimited.
+        """
+        super().setMaximumBlockCount(maximum)
+        self._pending = deque(self._pending, maxlen=maximum if maximum > 0 else None)
+
+    def setDisplayLevel(self, index: int) -> None:
+        """Sets minimal displayed level. Already displayed messages aren't
+        affected.
+
+        Parameters
+        ----------
+        index : `int`
+            Index of the minimal displayed level in LEVELS.
+        """
+        self._displayLevel = index
+
+    def format(self, data: BaseMsgType) -> str:
+        """Formats message as HTML.
+
+        Parameters
+        ----------
+        data : `BaseMsgType`
+            logMessage data.
+
+        Returns
+        -------
+        html : `str`
+            Formatted message.
+        """
+        level = _levelToIndex(data.level)
         date = datetime.fromtimestamp(data.private_sndStamp).isoformat(sep=" ", timespec="milliseconds")
-        level = min(int(data.level / 10), 5)
-        self.appendHtml(
+        return (
             f"{date} [<b>{self.LEVELS_IDS[level]}</b>]"
             f"<span style='{self.LEVEL_TEXT_STYLE[level]}'>"
             f"{escape(data.message)}"
             "</span>"
         )
-        self.ensureCursorVisible()
+
+    @Slot()
+    def logMessage(self, data: BaseMsgType) -> None:
+        if _levelToIndex(data.level) < self._displayLevel:
+            return
+        self._pending.append(data)
+        if not self._flushTimer.isActive():
+            self._flushTimer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        """Inserts buffered messages into the document."""
+        if len(self._pending) == 0:
+            return
+
+        scrollBar = self.verticalScrollBar()
+        follow = scrollBar.value() == scrollBar.maximum()
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.setCharFormat(QTextCharFormat())
+        # paragraphs without margins produce the same blocks as appendHtml
+        cursor.insertHtml("".join(f"<p style='margin:0'>{self.format(data)}</p>" for data in self._pending))
+        cursor.endEditBlock()
+        self._pending.clear()
+
+        if follow:
+            scrollBar.setValue(scrollBar.maximum())
+
+    @Slot()
+    def clear(self) -> None:
+        self._pending.clear()
+        super().clear()
 
 
 class LogWidget(QWidget):
@@ -191,6 +280,7 @@ class LogWidget(QWidget):
 
     @asyncSlot()
     async def changeLevel(self, index: int) -> None:
+        self.messages.setDisplayLevel(index)
         await command_group(self, list(self.comms), "setLogLevel", level=index * 10)
 
 
@@ -223,4 +313,5 @@ class LogDock(DockWindow):
 
     @asyncSlot()
     async def changeLevel(self, index: int) -> None:
+        self.messages.setDisplayLevel(index)
         await command_group(self, list(self.comms), "setLogLevel", level=index * 10)
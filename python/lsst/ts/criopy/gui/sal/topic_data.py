@@ -133,7 +133,8 @@ class TopicData:
             return
 
         try:
-            getattr(comm, self.topic).connect(slot)
+            # only the current value is shown, data can be coalesced
+            comm.coalesced(self.topic).connect(slot)
         except AttributeError:
             raise RuntimeError(f"Topic {self.topic} doesn't exists")
 
@@ -154,6 +155,6 @@ class TopicData:
             return
 
         try:
-            getattr(comm, self.topic).disconnect(slot)
+            comm.coalesced(self.topic).disconnect(slot)
         except AttributeError:
             pass
@@ -21,6 +21,7 @@
 
 
 from PySide6.QtCore import Slot
+from PySide6.QtGui import QHideEvent, QShowEvent
 from PySide6.QtWidgets import (
     QGridLayout,
     QLabel,
@@ -43,6 +44,10 @@ class TopicWindow(QSplitter):
     Abstract class for widget and graphics display of selected M1M3 values.
     Children classes must implement update_values(data) method.
 
+    Selected topic is disconnected while the window is hidden, so hidden
+    windows (e.g. not selected EUI pages) don't process new data. It's
+    reconnected and the latest data are displayed when the window is shown.
+
     Parameters
     ----------
     comm : `MetaSAL`
@@ -126,6 +131,19 @@ class TopicWindow(QSplitter):
 
         self.topic_list.setCurrentRow(0)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Reconnects selected topic and displays its latest data."""
+        super().showEvent(event)
+        topic_index = self.topic_list.currentRow()
+        field_index = self.field_list.currentRow()
+        if topic_index >= 0 and field_index >= 0:
+            self.change_field(topic_index, field_index)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Disconnects selected topic, hidden window doesn't need updates."""
+        self.collection.change_topic(None, self.data_changed, self.comm)
+        super().hideEvent(event)
+
     @Slot()
     def current_topic_changed(self, topic_index: int) -> None:
         if topic_index < 0:
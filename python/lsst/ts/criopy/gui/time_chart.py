@@ -19,12 +19,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.If not, see < https:  // www.gnu.org/licenses/>.
 
-import concurrent.futures
+import functools
 import time
 import typing
 
+import numpy as np
 from PySide6.QtCharts import QChart, QChartView, QDateTimeAxis, QLineSeries, QValueAxis
-from PySide6.QtCore import QDateTime, QPointF, Qt, Signal, Slot
+from PySide6.QtCore import QDateTime, Qt, Signal, Slot
 from PySide6.QtGui import QContextMenuEvent, QPainter, QWheelEvent
 from PySide6.QtWidgets import QMenu
 
@@ -33,6 +34,8 @@ from lsst.ts.salobj import BaseMsgType
 from ..time_cache import TimeCache
 from .abstract_chart import AbstractChart
 from .custom_labels import UnitLabel
+from .decimation import min_max_decimate, replace_points
+from .render_executor import RenderExecutor
 
 __all__ = ["TimeChart", "UserSelectedTimeChart", "TimeChartView"]
 
@@ -43,7 +46,9 @@ class TimeChart(AbstractChart):
 
     Data to the graph shall be added with the append method. The class does the
     rest, creates axis/series and autoscale them as needed. Data are cached
-    before being draw.
+    before being draw. Data with more points than plot width are decimated
+    (min/max per pixel) before drawing. Decimation runs in the shared
+    RenderExecutor, points are plotted in Qt thread.
 
     Parameters
     ----------
@@ -142,17 +147,11 @@ class TimeChart(AbstractChart):
 
         # replot if needed
         if update:
-            self.update_task.cancel()
+            RenderExecutor.instance().cancel(self)
             self._next_update = [0] * len(self._caches)
 
-        if (
-            self._next_update[cache_index] < time.monotonic()
-            and self.update_task.done()
-            and self.isVisibleTo(None)
-        ):
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                self.update_task = pool.submit(self._replot, axis_index, cache)
-
+        if self._next_update[cache_index] < time.monotonic() and self.isVisibleTo(None):
+            self._submit_replot(axis_index, cache_index, cache)
             self._next_update[cache_index] = time.monotonic() + self.update_interval
 
     def replace(self, caches: list[TimeCache]) -> None:
@@ -164,54 +163,84 @@ class TimeChart(AbstractChart):
         externally supplied TimeCaches are update outside of the graph - this
         then replot data based on the current cache content.
         """
-
-        def update_all() -> None:
-            try:
-                for index, cache in enumerate(self._caches):
-                    self._replot(0, cache)
-            except Exception as ex:
-                print("Exception updating", str(ex), index, str(cache))
-
-        self.update_task.cancel()
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            self.update_task = pool.submit(update_all)
+        RenderExecutor.instance().cancel(self)
+        for index, cache in enumerate(self._caches):
+            self._submit_replot(0, index, cache)
 
         self._next_update = [time.monotonic() + self.update_interval] * len(self._caches)
 
-    def _replot(self, axis_index: int, cache: TimeCache) -> None:
-        """Updates given cache.
+    def _submit_replot(self, axis_index: int, cache_index: int, cache: TimeCache) -> None:
+        """Submit cache replot to the render executor. Only the latest replot
+        of a cache is kept, if the previous one wasn't yet calculated.
 
         Parameters
         ----------
-        cache : TimeCache
+        axis_index : `int`
+            Axis index.
+        cache_index : `int`
+            Cache index.
+        cache : `TimeCache`
             Time cache from which data shall be updated.
         """
         if self.time_axis is None:
             return
 
-        axis = self.axes(Qt.Vertical)[axis_index]
-        d_min = d_max = None
+        names = []
         for n in cache.columns()[1:]:
             serie = self.find_serie(n)
-            if serie is None or serie.isVisible() is False:
-                continue
+            if serie is not None and serie.isVisible():
+                names.append(n)
+
+        # the cache is modified in Qt thread, calculation receives a copy
+        RenderExecutor.instance().submit(
+            (self, cache_index),
+            functools.partial(
+                self._calculate, cache.snapshot(["timestamp"] + names), names, int(self.plotArea().width())
+            ),
+            functools.partial(self._plot, axis_index),
+        )
+
+    @staticmethod
+    def _calculate(
+        data: dict[str, np.ndarray], names: list[str], width: int
+    ) -> tuple[tuple[float, float], list[tuple[str, np.ndarray, np.ndarray]], float, float] | None:
+        """Calculates decimated points to plot. Run in render executor
+        thread.
 
-            if cache.empty():
-                continue
+        Parameters
+        ----------
+        data : `{str: numpy.ndarray}`
+            Snapshot of the time cache columns (TimeCache.snapshot), with
+            timestamp and visible series.
+        names : `[str]`
+            Names of visible series.
+        width : `int`
+            Plot width. Data are decimated to that number of buckets.
+
+        Returns
+        -------
+        plot_data : `tuple` or `None`
+            Time range, list of serie name with x and y values, and data
+            minimum and maximum. None if the cache is empty.
+        """
+        timestamps = data["timestamp"]
+        if len(timestamps) == 0:
+            return None
 
-            data = cache[n]
+        points = []
+        d_min = d_max = None
+        for n in names:
+            values = data[n]
             if d_min is None or d_max is None:
-                d_min = min(data)
-                d_max = max(data)
+                d_min = values.min()
+                d_max = values.max()
             else:
-                d_min = min(d_min, min(data))
-                d_max = max(d_max, max(data))
+                d_min = min(d_min, values.min())
+                d_max = max(d_max, values.max())
 
-            points = [QPointF(*i) for i in zip(cache["timestamp"], data)]
+            x, y = min_max_decimate(timestamps, values, width)
+            points.append((n, np.array(x, dtype=np.float64), np.array(y, dtype=np.float64)))
 
-            serie.replace(points)
-
-        self.time_axis.setRange(*[QDateTime().fromMSecsSinceEpoch(int(t)) for t in cache.time_range()])
         if d_min == d_max:
             if d_min == 0 or d_min is None or d_max is None:
                 d_min = -1
@@ -220,7 +249,34 @@ class TimeChart(AbstractChart):
                 d_min -= d_min * 0.05
                 d_max += d_max * 0.05
 
-        axis.setRange(d_min, d_max)
+        return (timestamps[0], timestamps[-1]), points, d_min, d_max
+
+    def _plot(
+        self,
+        axis_index: int,
+        plot_data: tuple[tuple[float, float], list[tuple[str, np.ndarray, np.ndarray]], float, float] | None,
+    ) -> None:
+        """Plot calculated points. Run in Qt thread.
+
+        Parameters
+        ----------
+        axis_index : `int`
+            Axis index.
+        plot_data : `tuple` or `None`
+            Data returned from _calculate.
+        """
+        axes = self.axes(Qt.Vertical)
+        if plot_data is None or self.time_axis is None or axis_index >= len(axes):
+            return
+
+        time_range, points, d_min, d_max = plot_data
+        for n, x, y in points:
+            serie = self.find_serie(n)
+            if serie is not None:
+                replace_points(serie, x, y)
+
+        self.time_axis.setRange(*[QDateTime().fromMSecsSinceEpoch(int(t)) for t in time_range])
+        axes[axis_index].setRange(d_min, d_max)
 
     def clear_data(self) -> None:
         """Removes all data from the chart."""
@@ -0,0 +1,264 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["ValueTableModel"]
+
+import typing
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush
+
+
+class ValueTableModel(QAbstractTableModel):
+    """
+    Table of values stored in a single NumPy array. Each value is displayed in
+    a table cell given by the cells parameter, other cells are empty.
+
+    Values are formatted in data(), so only cells requested by views (the
+    visible ones) are formatted. set_values emits a single dataChanged signal
+    for the range covering changed cells, and nothing if no value changed.
+
+    Parameters
+    ----------
+    cells : `[(int, int)]`
+        Row and column of each value.
+    rows : `int`
+        Number of table rows.
+    columns : `int`
+        Number of table columns.
+    row_headers : `[str]`, optional
+        Rows titles. Defaults to None - row numbers.
+    column_headers : `[str]`, optional
+        Columns titles. Defaults to None - column numbers.
+    fmt : `str`, optional
+        Format specification of the values. Defaults to "" - str(value).
+    empty : `str`, optional
+        Text displayed for NaN values. Defaults to "---".
+    """
+
+    def __init__(
+        self,
+        cells: list[tuple[int, int]],
+        rows: int,
+        columns: int,
+        row_headers: list[str] | None = None,
+        column_headers: list[str] | None = None,
+        fmt: str = "",
+        empty: str = "---",
+    ):
+        super().__init__()
+        self._rows = rows
+        self._columns = columns
+        self._row_headers = row_headers
+        self._column_headers = column_headers
+        self._fmt = fmt
+        self._empty = empty
+        self._editable = False
+
+        self._cells = np.array(cells, dtype=int).reshape(-1, 2)
+        self._cell_index = np.full((rows, columns), -1, dtype=int)
+        self._cell_index[self._cells[:, 0], self._cells[:, 1]] = np.arange(len(self._cells))
+
+        self._values: np.ndarray = np.full(len(self._cells), np.nan)
+        self._backgrounds: list[QBrush | None] = [None] * len(self._cells)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._columns
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> typing.Any:
+        headers = self._row_headers if orientation == Qt.Orientation.Vertical else self._column_headers
+        if headers is not None and role == Qt.ItemDataRole.DisplayRole:
+            return headers[section]
+        return super().headerData(section, orientation, role)
+
+    def value_index(self, index: QModelIndex) -> int | None:
+        """Returns index of the value displayed in a cell.
+
+        Parameters
+        ----------
+        index : `QModelIndex`
+            Cell index.
+
+        Returns
+        -------
+        value_index : `int` | None
+            Index into values array, None if no value is displayed in the
+            cell.
+        """
+        if not index.isValid():
+            return None
+        i = int(self._cell_index[index.row(), index.column()])
+        return None if i < 0 else i
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Any:
+        i = self.value_index(index)
+        if i is None:
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.format(self._values[i])
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._backgrounds[i]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if self._editable and self.value_index(index) is not None:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: typing.Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        i = self.value_index(index)
+        if i is None or role != Qt.ItemDataRole.EditRole:
+            return False
+        try:
+            self._values[i] = self._values.dtype.type(value)
+        except (TypeError, ValueError):
+            return False
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    def set_editable(self, editable: bool) -> None:
+        """Allows or disables values editing.
+
+        Parameters
+        ----------
+        editable : `bool`
+            True if values can be edited in views.
+        """
+        self._editable = editable
+
+    def format(self, value: typing.Any) -> str:
+        """Formats value for display.
+
+        Parameters
+        ----------
+        value : `typing.Any`
+            Value to format.
+
+        Returns
+        -------
+        text : `str`
+            Formatted value, or empty text for NaN.
+        """
+        if isinstance(value, (float, np.floating)) and np.isnan(value):
+            return self._empty
+        try:
+            return format(value, self._fmt)
+        except (TypeError, ValueError):
+            return str(value)
+
+    def set_format(self, fmt: str | None) -> None:
+        """Changes values format.
+
+        Parameters
+        ----------
+        fmt : `str` | None
+            Format specification. None or "" displays str(value).
+        """
+        fmt = "" if fmt is None else fmt
+        if fmt != self._fmt:
+            self._fmt = fmt
+            self._emit_range(self._cells, [Qt.ItemDataRole.DisplayRole])
+
+    def values(self) -> np.ndarray:
+        """Returns displayed values.
+
+        Returns
+        -------
+        values : `np.ndarray`
+            Values array. Shall not be modified.
+        """
+        return self._values
+
+    def set_values(self, values: typing.Iterable[typing.Any]) -> None:
+        """Sets displayed values. Emits dataChanged for the range of cells
+        with changed values.
+
+        Parameters
+        ----------
+        values : `[typing.Any]`
+            New values, one per cell.
+        """
+        new = np.array(values)
+        if new.dtype.kind in "SU":
+            # fixed width strings would truncate longer values set later
+            new = new.astype(object)
+        old = self._values
+        self._values = new
+        if new.shape != old.shape or new.dtype != old.dtype:
+            self._emit_range(self._cells, [Qt.ItemDataRole.DisplayRole])
+            return
+
+        changed = new != old
+        if new.dtype.kind in "fc":
+            changed &= ~(np.isnan(new) & np.isnan(old))
+        indices = np.flatnonzero(changed)
+        if len(indices) > 0:
+            self._emit_range(self._cells[indices], [Qt.ItemDataRole.DisplayRole])
+
+    def set_value(self, index: int, value: typing.Any) -> None:
+        """Sets a single value.
+
+        Parameters
+        ----------
+        index : `int`
+            Value index.
+        value : `typing.Any`
+            New value. Converted to values type.
+        """
+        self._values[index] = self._values.dtype.type(value)
+        self._emit_range(self._cells[index : index + 1], [Qt.ItemDataRole.DisplayRole])
+
+    def reset_backgrounds(self) -> None:
+        """Removes all custom backgrounds."""
+        self._backgrounds = [None] * len(self._cells)
+        self._emit_range(self._cells, [Qt.ItemDataRole.BackgroundRole])
+
+    def mask_background(self, mask: typing.Iterable[bool], brush: QBrush | Qt.GlobalColor) -> None:
+        """Sets background of masked values.
+
+        Parameters
+        ----------
+        mask : `[bool]`
+            True for values which background shall be set.
+        brush : `QBrush`
+            New background.
+        """
+        brush = QBrush(brush)
+        indices = [index for index, masked in enumerate(mask) if masked]
+        if len(indices) == 0:
+            return
+        for index in indices:
+            self._backgrounds[index] = brush
+        self._emit_range(self._cells[indices], [Qt.ItemDataRole.BackgroundRole])
+
+    def _emit_range(self, cells: np.ndarray, roles: list[Qt.ItemDataRole]) -> None:
+        if len(cells) == 0:
+            return
+        top, left = cells.min(axis=0)
+        bottom, right = cells.max(axis=0)
+        self.dataChanged.emit(self.index(int(top), int(left)), self.index(int(bottom), int(right)), roles)
@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.If not, see <https://www.gnu.org/licenses/>.
 
+from dataclasses import dataclass
+
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import QHeaderView, QTreeView
@@ -32,10 +34,26 @@ from .bump_test_statistics import BumpTestStatistics
 from .bump_test_status_item import BumpTestStatusItem
 
 
+@dataclass
+class _RunningTest:
+    """Routes topics data to caches of a running test."""
+
+    actuator_id: int
+    kind: BumpTestKind
+    axis: str
+    axis_index: int
+    z_index: int
+    s_index: int | None
+    applied: TimeCache
+    measured: TimeCache
+    fe: TimeCache
+
+
 class BumpTestModel(QStandardItemModel):
     """
     Collect bump test data. Progress is being stored in rows together with
-    various TimeCaches of raw data.
+    various TimeCaches of raw data. Data are routed only to the running tests,
+    with actuators indices resolved when the test is appended.
     """
 
     APPLIED_DATA = Qt.UserRole + 1
@@ -47,6 +65,8 @@ class BumpTestModel(QStandardItemModel):
         super().__init__(0, 4)
         self.setHorizontalHeaderLabels(["AccID", "Index", "Type", "Progress" + " " * 15])
 
+        self._running: list[_RunningTest] = []
+
         m1m3.appliedForces.connect(self.applied_forces)
         m1m3.forceActuatorData.connect(self.force_actuator_data)
         m1m3.forceActuatorBumpTestStatistics.connect(self.bump_test_statistics, type=Qt.QueuedConnection)
@@ -56,11 +76,11 @@ class BumpTestModel(QStandardItemModel):
     ) -> tuple[TimeCache, TimeCache, TimeCache, BumpTestStatistics]:
         time_field = [("timestamp", "f8")]
         if kind == BumpTestKind.AXIS_X:
-            axis_index = fa.x_index
+            axis, axis_index = "x", fa.x_index
         elif kind == BumpTestKind.AXIS_Y:
-            axis_index = fa.y_index
-        elif kind == BumpTestKind.AXIS_Z:
-            axis_index = fa.z_index
+            axis, axis_index = "y", fa.y_index
+        else:
+            axis, axis_index = "z", fa.z_index
 
         row = [QStandardItem(s) for s in [str(fa.actuator_id), str(axis_index), str(kind)]] + [
             BumpTestStatusItem("--")
@@ -96,6 +116,20 @@ class BumpTestModel(QStandardItemModel):
 
         self.appendRow(row)
 
+        self._running.append(
+            _RunningTest(
+                fa.actuator_id,
+                kind,
+                axis,
+                axis_index,
+                fa.z_index,
+                fa.s_index,
+                row[3].data(self.APPLIED_DATA),
+                row[3].data(self.MEASURED_DATA),
+                row[3].data(self.FE_DATA),
+            )
+        )
+
         return (
             row[3].data(self.APPLIED_DATA),
             row[3].data(self.MEASURED_DATA),
@@ -125,43 +159,32 @@ class BumpTestModel(QStandardItemModel):
     def remove(self, actuator_id: int, primary: bool) -> None:
         row = self.find_test(actuator_id, primary)
         if row is not None:
+            kind = self.item(row, 2).data()
+            for test in self._running:
+                if test.actuator_id == actuator_id and test.kind == kind:
+                    self._running.remove(test)
+                    break
             self.removeRows(row, 1)
 
     @Slot()
     def applied_forces(self, data: BaseMsgType) -> None:
-        for r in range(self.rowCount()):
-            new = [data.timestamp * 1000.0]
-            fa = self.item(r, 0).data()
-            kind = self.item(r, 2).data()
-            if kind == BumpTestKind.AXIS_X:
-                new.append(data.xForces[fa.x_index])
-            elif kind == BumpTestKind.AXIS_Y:
-                new.append(data.yForces[fa.y_index])
-            else:
-                new.append(data.zForces[fa.z_index])
-
-            self.item(r, 3).data(self.APPLIED_DATA).append(tuple(new))
+        timestamp = data.timestamp * 1000.0
+        for test in self._running:
+            forces = getattr(data, f"{test.axis}Forces")
+            test.applied.append((timestamp, forces[test.axis_index]))
 
     @Slot()
     def force_actuator_data(self, data: BaseMsgType) -> None:
-        for r in range(self.rowCount()):
-            measured = [data.timestamp * 1000.0]
-            fe = [data.timestamp * 1000.0]
-            fa = self.item(r, 0).data()
-            kind = self.item(r, 2).data()
-            if kind == BumpTestKind.AXIS_X:
-                measured.append(data.xForce[fa.x_index])
-            elif kind == BumpTestKind.AXIS_Y:
-                measured.append(data.yForce[fa.y_index])
+        timestamp = data.timestamp * 1000.0
+        for test in self._running:
+            forces = getattr(data, f"{test.axis}Force")
+            test.measured.append((timestamp, forces[test.axis_index]))
+
+            primary = data.primaryCylinderFollowingError[test.z_index]
+            if test.s_index is None:
+                test.fe.append((timestamp, primary))
             else:
-                measured.append(data.zForce[fa.z_index])
-
-            fe.append(data.primaryCylinderFollowingError[fa.z_index])
-            if fa.s_index is not None:
-                fe.append(data.secondaryCylinderFollowingError[fa.s_index])
-
-            self.item(r, 3).data(self.MEASURED_DATA).append(tuple(measured))
-            self.item(r, 3).data(self.FE_DATA).append(tuple(fe))
+                test.fe.append((timestamp, primary, data.secondaryCylinderFollowingError[test.s_index]))
 
     @Slot()
     def bump_test_statistics(self, data: BaseMsgType) -> None:
@@ -37,6 +37,10 @@ class GraphPageWidget(Widget):
 
     def __init__(self, m1m3: MetaSAL | Simulator):
         self.mirror_widget = MirrorWidget(support=True)
+        # field's data index of each force actuator, -1 if the actuator
+        # doesn't provide the field value
+        self._data_indices = np.full(len(FATable), -1)
+        self._actuators = np.arange(len(FATable))
 
         super().__init__(m1m3, self.mirror_widget)
 
@@ -47,6 +51,9 @@ class GraphPageWidget(Widget):
         """Called when data are changed."""
         if field is not None:
             self.mirror_widget.set_field(field)
+            self._data_indices = np.array(
+                [-1 if (index := fa.get_index(field.value_index)) is None else index for fa in FATable]
+            )
 
     def update_values(self, data: BaseMsgType) -> None:
         """Called when new data are available through SAL callback.
@@ -61,11 +68,6 @@ class GraphPageWidget(Widget):
         if self.field is None:
             raise RuntimeError("field is None in GraphPageWidget.update_values")
 
-        if data is None:
-            values = None
-        else:
-            values = self.field.get_value(data)
-
         def get_warning(index: int) -> DataItemState:
             return (
                 DataItemState.WARNING
@@ -75,37 +77,37 @@ class GraphPageWidget(Widget):
 
         enabled = self.comm.remote.evt_enabledForceActuators.get()
 
-        for fa in FATable:
-            index = fa.index
-            data_index = fa.get_index(self.field.value_index)
-            if values is None or data_index is None:
-                state = DataItemState.INACTIVE
-            elif enabled is not None and not enabled.forceActuatorEnabled[index]:
-                state = DataItemState.INACTIVE
-                values[data_index] = None
-            elif warning_data is not None or data_index is None:
-                state = get_warning(index)
-            else:
-                state = DataItemState.ACTIVE
+        field_values = None if data is None else self.field.get_value(data)
 
-            try:
-                value = None if (values is None or data_index is None) else values[data_index]
-            except IndexError as err:
-                print("Error", data, data_index, values, self.field)
-                raise err
+        states = np.full(len(FATable), DataItemState.INACTIVE.value)
+        if field_values is None:
+            values = np.full(len(FATable), np.nan)
+            self.mirror_widget.set_range(0, 0)
+        else:
+            active = self._data_indices >= 0
+            values = np.asarray(field_values)[np.where(active, self._data_indices, 0)]
+            if enabled is not None:
+                active &= np.asarray(enabled.forceActuatorEnabled, dtype=bool)[: len(FATable)]
 
-            self.mirror_widget.mirror_view.update_force_actuator(fa, value, state)
+            states[active] = DataItemState.ACTIVE.value
+            if warning_data is not None:
+                warning = np.logical_or(warning_data.minorFault, warning_data.majorFault)[: len(FATable)]
+                states[active & warning] = DataItemState.WARNING.value
+
+            # range is set before actuators are updated, so their colors are
+            # calculated with the new range. Only actuators with changed color
+            # or value are redrawn
+            range_values = values[active].astype(float)
+            range_values = range_values[np.isfinite(range_values)]
+            if len(range_values) == 0:
+                self.mirror_widget.set_range(0, 0, False)
+            else:
+                self.mirror_widget.set_range(range_values.min(), range_values.max(), False)
 
-        if values is None:
-            self.mirror_widget.set_range(0, 0)
-            return
+        self.mirror_widget.mirror_view.update_force_actuators(self._actuators, values, states)
 
-        # filter out None values
-        values = [v for v in values if v is not None and not (np.isnan(v))]
-        if len(values) == 0:
-            self.mirror_widget.set_range(0, 0)
-        else:
-            self.mirror_widget.set_range(min(values), max(values))
+        if field_values is None:
+            return
 
         if self.detail_widget is None:
             return
@@ -28,6 +28,7 @@ from lsst.ts.xml.tables.m1m3 import FATABLE_ZFA, FAIndex, FATable, actuator_id_t
 
 from ...gui.actuatorsdisplay import Scales
 from ...gui.sal import (
+    DerivedCache,
     EnabledDisabledField,
     TopicCollection,
     TopicData,
@@ -39,6 +40,65 @@ from ...salcomm import MetaSAL
 
 __all__ = ["Topics"]
 
+# Values calculated from the topics data are shared by all fields and widgets
+# displaying the same message.
+_derived = DerivedCache()
+
+
+def _read_only(values: typing.Any) -> np.ndarray:
+    array = np.asarray(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+def _neighbors_matrix(neighbors: typing.Callable[[typing.Any], list[int]], include_self: bool) -> np.ndarray:
+    """Returns matrix selecting actuator neighbors. Row i contains 1 at
+    columns of i-th actuator neighbors (and the actuator itself if
+    include_self is True), 0 elsewhere."""
+    matrix = np.zeros((FATABLE_ZFA, FATABLE_ZFA))
+    for row in FATable:
+        matrix[row.index, [actuator_id_to_index(n) for n in neighbors(row)]] = 1
+        if include_self:
+            matrix[row.index, row.index] = 1
+    return matrix
+
+
+_near_neighbors = _neighbors_matrix(lambda row: row.near_neighbors, False)
+_near_neighbors /= _near_neighbors.sum(axis=1, keepdims=True)
+
+_far_neighbors = _neighbors_matrix(lambda row: row.far_neighbors, True)
+_far_neighbors_counts = _far_neighbors.sum(axis=1)
+
+# FATable and x/y data indices of actuators with x/y cylinders
+_x_rows, _x_indices = np.array([(row.index, row.x_index) for row in FATable if row.x_index is not None]).T
+_y_rows, _y_indices = np.array([(row.index, row.y_index) for row in FATable if row.y_index is not None]).T
+
+
+def _near_neighbors_differences(data: BaseMsgType) -> np.ndarray:
+    z_forces = np.asarray(data.zForces, dtype=float)
+    return _read_only(z_forces - _near_neighbors @ z_forces)
+
+
+def _far_neighbors_factors(data: BaseMsgType) -> np.ndarray:
+    forces = np.zeros((FATABLE_ZFA, 3))
+    forces[_x_rows, 0] = np.asarray(data.xForces, dtype=float)[_x_indices]
+    forces[_y_rows, 1] = np.asarray(data.yForces, dtype=float)[_y_indices]
+    forces[:, 2] = data.zForces
+
+    magnitudes = np.linalg.norm(_far_neighbors @ forces, axis=1) / _far_neighbors_counts
+    average = np.linalg.norm(forces.sum(axis=0)) / FATABLE_ZFA
+    return _read_only((magnitudes - average) / average)
+
+
+def _cylinder_forces(data: BaseMsgType) -> ForceCalculator.CylinderForces:
+    return _derived.get(
+        "cylinderForces",
+        data,
+        lambda d: ForceCalculator.CylinderForces(
+            d.primaryCylinderFollowingError, d.secondaryCylinderFollowingError
+        ),
+    )
+
 
 class BumpTestField(TopicField):
     """Class displaying bump test status."""
@@ -54,9 +114,7 @@ class NearNeighborsDifferencesField(TopicField):
         super().__init__(name, None, FAIndex.Z)
 
     def get_value(self, data: BaseMsgType) -> typing.Any:
-        near_diff = ForceCalculator.SALAppliedForces(data)
-        near_diff.calculate_near_neighbors_forces()
-        return np.array(near_diff.zForces) - np.array(near_diff.near_neighbors_forces)
+        return _derived.get("nearNeighborsDifferences", data, _near_neighbors_differences)
 
 
 class FarNeighborsFactorsField(TopicField):
@@ -66,11 +124,7 @@ class FarNeighborsFactorsField(TopicField):
         super().__init__(name, None, FAIndex.Z)
 
     def get_value(self, data: BaseMsgType) -> typing.Any:
-        fn_factors = ForceCalculator.SALAppliedForces(data)
-        fn_factors.calculate_far_neighbors_magnitudes()
-        return (
-            np.array(fn_factors.far_neighbors_magnitudes) - fn_factors.global_average_force
-        ) / fn_factors.global_average_force
+        return _derived.get("farNeighborsFactors", data, _far_neighbors_factors)
 
 
 class ILCWarningField(TopicField):
@@ -98,10 +152,7 @@ class XFEForces(TopicField):
         super().__init__(name, None, FAIndex.X)
 
     def get_value(self, data: BaseMsgType) -> typing.Any:
-        forces = ForceCalculator.CylinderForces(
-            data.primaryCylinderFollowingError, data.secondaryCylinderFollowingError
-        )
-        return forces.xForces
+        return _cylinder_forces(data).xForces
 
 
 class YFEForces(TopicField):
@@ -112,10 +163,7 @@ class YFEForces(TopicField):
         super().__init__(name, None, FAIndex.Y)
 
     def get_value(self, data: BaseMsgType) -> typing.Any:
-        forces = ForceCalculator.CylinderForces(
-            data.primaryCylinderFollowingError, data.secondaryCylinderFollowingError
-        )
-        return forces.yForces
+        return _cylinder_forces(data).yForces
 
 
 class ZFEForces(TopicField):
@@ -126,10 +174,7 @@ class ZFEForces(TopicField):
         super().__init__(name, None, FAIndex.Z)
 
     def get_value(self, data: BaseMsgType) -> typing.Any:
-        forces = ForceCalculator.CylinderForces(
-            data.primaryCylinderFollowingError, data.secondaryCylinderFollowingError
-        )
-        return forces.zForces
+        return _cylinder_forces(data).zForces
 
 
 class ForceMomentData(TopicData):
@@ -143,9 +188,7 @@ class ForceMomentData(TopicData):
 
 class FEData(TopicData):
     def get_forces_moments(self, data: BaseMsgType) -> typing.Iterable[float | None]:
-        forces = ForceCalculator.CylinderForces(
-            data.primaryCylinderFollowingError, data.secondaryCylinderFollowingError
-        )
+        forces = _cylinder_forces(data)
         for d in [f"f{ax}" for ax in "xyz"] + [f"m{ax}" for ax in "xyz"] + ["forceMagnitude"]:
             try:
                 yield getattr(forces, d)
@@ -20,167 +20,69 @@
 # along with this program.If not, see < https:  // www.gnu.org/licenses/>.
 
 
-from PySide6.QtWidgets import QGridLayout, QLabel, QWidget
+import numpy as np
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
 
 from lsst.ts.salobj import BaseMsgType
-from lsst.ts.xml.tables.m1m3 import FATABLE_ZFA, FATable
+from lsst.ts.xml.tables.m1m3 import FATable
 
+from ...gui import ValueTableModel
 from ...salcomm import MetaSAL
 from .widget import Widget
 
 
-class DataWidget(QWidget):
+class DataWidget(QTableView):
+    """Table with force actuators values. Rows hold actuators with the same
+    tens (100, 110, ..), columns the last actuator ID digit. Blank rows
+    separate quadrants."""
+
     def __init__(self) -> None:
         super().__init__()
 
-        self.forceActuatorLabels = []
-        for i in range(FATABLE_ZFA):
-            self.forceActuatorLabels.append(QLabel("---"))
-
-        self.layout = QGridLayout()
-
-        row = 0
-        col = 0
-        self.layout.addWidget(QLabel("0"), row, col + 1)
-        self.layout.addWidget(QLabel("1"), row, col + 2)
-        self.layout.addWidget(QLabel("2"), row, col + 3)
-        self.layout.addWidget(QLabel("3"), row, col + 4)
-        self.layout.addWidget(QLabel("4"), row, col + 5)
-        self.layout.addWidget(QLabel("5"), row, col + 6)
-        self.layout.addWidget(QLabel("6"), row, col + 7)
-        self.layout.addWidget(QLabel("7"), row, col + 8)
-        self.layout.addWidget(QLabel("8"), row, col + 9)
-        self.layout.addWidget(QLabel("9"), row, col + 10)
-        row += 1
-
-        self.layout.addWidget(QLabel("100"), row, col)
-        for i in range(9):
-            self.layout.addWidget(self.forceActuatorLabels[i], row, col + 2 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("110"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[9 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("120"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[19 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("130"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[29 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("140"), row, col)
-        for i in range(4):
-            self.layout.addWidget(self.forceActuatorLabels[39 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel(" "), row, col)
-        row += 1
-        self.layout.addWidget(QLabel("200"), row, col)
-        for i in range(3):
-            self.layout.addWidget(self.forceActuatorLabels[43 + i], row, col + 8 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("210"), row, col)
-        for i in range(9):
-            self.layout.addWidget(self.forceActuatorLabels[46 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("220"), row, col)
-        for i in range(9):
-            self.layout.addWidget(self.forceActuatorLabels[55 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("230"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[64 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("240"), row, col)
-        for i in range(4):
-            self.layout.addWidget(self.forceActuatorLabels[74 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel(" "), row, col)
-        row += 1
-        self.layout.addWidget(QLabel("300"), row, col)
-        for i in range(9):
-            self.layout.addWidget(self.forceActuatorLabels[78 + i], row, col + 2 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("310"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[87 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("320"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[97 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("330"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[107 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("340"), row, col)
-        for i in range(4):
-            self.layout.addWidget(self.forceActuatorLabels[117 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel(" "), row, col)
-        row += 1
-        self.layout.addWidget(QLabel("400"), row, col)
-        for i in range(3):
-            self.layout.addWidget(self.forceActuatorLabels[121 + i], row, col + 8 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("410"), row, col)
-        for i in range(9):
-            self.layout.addWidget(self.forceActuatorLabels[124 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("420"), row, col)
-        for i in range(9):
-            self.layout.addWidget(self.forceActuatorLabels[133 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("430"), row, col)
-        for i in range(10):
-            self.layout.addWidget(self.forceActuatorLabels[142 + i], row, col + 1 + i)
-
-        row += 1
-        self.layout.addWidget(QLabel("440"), row, col)
-        for i in range(4):
-            self.layout.addWidget(self.forceActuatorLabels[152 + i], row, col + 1 + i)
-
-        self.setLayout(self.layout)
+        rows: dict[int, int] = {}
+        row_headers: list[str] = []
+        previous = None
+        for ten in sorted(set(row.actuator_id // 10 for row in FATable)):
+            if previous is not None and ten // 10 != previous // 10:
+                row_headers.append("")
+            rows[ten] = len(row_headers)
+            row_headers.append(str(ten * 10))
+            previous = ten
+
+        self.values_model = ValueTableModel(
+            [(rows[row.actuator_id // 10], row.actuator_id % 10) for row in FATable],
+            len(row_headers),
+            10,
+            row_headers,
+            [str(c) for c in range(10)],
+            ".1f",
+        )
+        self.setModel(self.values_model)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
 
 class ValuePageWidget(Widget):
     def __init__(self, m1m3: MetaSAL):
         self.dataWidget = DataWidget()
+        self._indices: dict[int, np.ndarray] = {}
 
         super().__init__(m1m3, self.dataWidget)
 
+    def _value_indices(self, value_index: int) -> np.ndarray:
+        """Returns indices of values displayed for actuators. -1 is returned
+        for actuators without value of the given kind."""
+        if value_index not in self._indices:
+            indices = [row.get_index(value_index) for row in FATable]
+            self._indices[value_index] = np.array([-1 if i is None else i for i in indices])
+        return self._indices[value_index]
+
     def update_values(self, data: BaseMsgType) -> None:
+        model = self.dataWidget.values_model
         if data is None or self.field is None:
-            for label in self.dataWidget.forceActuatorLabels:
-                label.setText("---")
+            model.set_values(np.full(len(FATable), np.nan))
             return
 
-        i = -1
-        values = self.field.get_value(data)
-        for row in FATable:
-            i += 1
-            index = row.get_index(self.field.value_index)
-            if index is None:
-                self.dataWidget.forceActuatorLabels[i].setText("---")
-            elif data is not None:
-                self.dataWidget.forceActuatorLabels[i].setText(f"{values[index]:.1f}")
-            else:
-                self.dataWidget.forceActuatorLabels[i].setText("")
+        values = np.asarray(self.field.get_value(data), dtype=float)
+        indices = self._value_indices(self.field.value_index)
+        model.set_values(np.where(indices >= 0, values[indices], np.nan))
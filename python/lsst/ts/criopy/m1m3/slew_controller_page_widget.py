@@ -97,9 +97,9 @@ class SlewControllerPageWidget(QWidget):
         self.forces_grid = ForcesGrid(
             [
                 PreclippedForces("<i>Pre-clipped</i>", m1m3.preclippedForces),
-                Forces("Applied", m1m3.appliedForces),
-                Forces("Measured", m1m3.forceActuatorData),
-                Forces("Hardpoints", m1m3.hardpointActuatorData),
+                Forces("Applied", m1m3.coalesced("appliedForces")),
+                Forces("Measured", m1m3.coalesced("forceActuatorData")),
+                Forces("Hardpoints", m1m3.coalesced("hardpointActuatorData")),
                 PreclippedForces(
                     "<i>Pre-clipped Acceleration</i>",
                     m1m3.preclippedAccelerationForces,
@@ -29,8 +29,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -39,6 +38,7 @@ from qasync import asyncSlot
 from lsst.ts.salobj import BaseMsgType
 from lsst.ts.xml.tables.m1m3 import FCUTable
 
+from ..gui import ValueTableModel
 from ..gui.sal import TopicWindow
 from ..salcomm import MetaSAL, command
 from .thermal_data import Thermals
@@ -55,61 +55,44 @@ class ByteSpin(QSpinBox):
         self.setRange(0, 255)
 
 
-class DataWidget(QTableWidget):
+class DataWidget(QTableView):
     """Table with ILC values. Stores ILC values."""
 
     def __init__(self) -> None:
-        super().__init__(10, 10)
-        for c in range(10):
-            self.setVerticalHeaderItem(c, QTableWidgetItem(str(c * 10)))
-        for index in range(96):
-            item = QTableWidgetItem("---")
-            self.setItem(int(index / 10), index % 10, item)
+        super().__init__()
+        self.values_model = ValueTableModel(
+            [(int(index / 10), index % 10) for index in range(96)],
+            10,
+            10,
+            [str(r * 10) for r in range(10)],
+        )
+        self.setModel(self.values_model)
         self.empty()
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
+    def setEditTriggers(self, triggers: QAbstractItemView.EditTrigger) -> None:
+        self.values_model.set_editable(triggers != QAbstractItemView.NoEditTriggers)
+        super().setEditTriggers(triggers)
+
     def empty(self) -> None:
         self.set_values(range(1, 97))
         self.reset_background()
 
     def reset_background(self) -> None:
-        d_b = self.palette().base()
-        for index in range(96):
-            self.get_item(index).setBackground(d_b)
+        self.values_model.reset_backgrounds()
 
-    def get_item(self, index: int) -> QTableWidgetItem:
-        return self.item(int(index / 10), index % 10)
-
-    def set_value(self, index: int, value: str) -> None:
-        self.get_item(index).setText(str(value))
+    def set_value(self, index: int, value: int) -> None:
+        self.values_model.set_value(index, value)
 
     def set_values(self, data: BaseMsgType, fmt: str | None = None) -> None:
-        r = 0
-        c = 0
-        for value in data:
-            item = self.item(r, c)
-            if fmt is None:
-                item.setText(str(value))
-            else:
-                item.setText(fmt.format(v=value))
-            c += 1
-            if c >= self.columnCount():
-                c = 0
-                r += 1
+        self.values_model.set_format(fmt)
+        self.values_model.set_values(data)
 
     def get_values(self) -> list[int]:
-        data: list[int] = []
-        for r in range(0, 10):
-            for c in range(0, 10):
-                index = r * 10 + c
-                if index < 96:
-                    data.append(int(self.item(r, c).text()))
-        return data
+        return [int(value) for value in self.values_model.values()]
 
     def mask_backround(self, mask: list[bool], brush: QBrush) -> None:
-        for index, masked in enumerate(mask):
-            if masked:
-                self.get_item(index).setBackground(brush)
+        self.values_model.mask_background(mask, brush)
 
 
 class CommandWidget(QWidget):
@@ -236,17 +219,17 @@ class CommandWidget(QWidget):
 
     @Slot()
     def set_constant(self) -> None:
-        self.data_widget.set_values([self.flat_demand.text()] * 96)
+        self.data_widget.set_values([self.flat_demand.value()] * 96)
 
     @Slot()
     def set_m1(self) -> None:
-        value = self.m1_demand.text()
+        value = self.m1_demand.value()
         for fcu in [fcu for fcu in FCUTable if fcu.is_m1()]:
             self.data_widget.set_value(fcu.index, value)
 
     @Slot()
     def set_m3(self) -> None:
-        value = self.m3_demand.text()
+        value = self.m3_demand.value()
         for fcu in [fcu for fcu in FCUTable if fcu.is_m3()]:
             self.data_widget.set_value(fcu.index, value)
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Benchmark EFD replay against local mock EFD.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org). See the COPYRIGHT file at the top - level directory
+# of this distribution for details of code ownership.
+#
+# This program is free software : you can redistribute it and / or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import asyncio
+import typing
+
+from astropy.time import Time
+
+from .salcomm import MOCK_TOPICS, MockEfdClient
+from .salcomm.replay_benchmark import benchmark_memory, benchmark_replay
+
+parser = argparse.ArgumentParser(
+    description="Benchmark EFD replay with local mock EFD.",
+    epilog=(
+        "Measures time to the first replayed frame, steady state frames per"
+        " second and memory growth per replayed topic count. Data are"
+        " generated with the CSC topics schemas, or read from recorded Parquet"
+        " files (--recorded)."
+    ),
+)
+parser.add_argument("csc", type=str, choices=MOCK_TOPICS.keys(), help="replayed CSC")
+parser.add_argument(
+    "-t",
+    dest="topics",
+    action="append",
+    default=[],
+    help="replayed topic. Can be specified multiple times. Default to all CSC topics.",
+)
+parser.add_argument(
+    "--start",
+    type=Time,
+    default=Time("2025-05-19T23:40:00", scale="utc"),
+    help="replay start (ISOT). Defaults to 2025-05-19T23:40:00.",
+)
+parser.add_argument("--frames", type=int, default=200, help="number of replayed frames. Defaults to 200.")
+parser.add_argument("--step", type=float, default=0.1, help="replay step (seconds of data). Defaults to 0.1.")
+parser.add_argument("--duration", type=float, default=60, help="loaded window (seconds). Defaults to 60.")
+parser.add_argument("--latency", type=float, default=0.1, help="query latency (seconds). Defaults to 0.1.")
+parser.add_argument(
+    "--bandwidth",
+    type=float,
+    default=None,
+    help="transfer speed (MB/s). Defaults to unlimited.",
+)
+parser.add_argument(
+    "--recorded",
+    type=str,
+    default=None,
+    help=(
+        "directory with recorded Parquet files, named by the full topic name"
+        " (lsst.sal.CSC.topic.parquet). Requires pyarrow."
+    ),
+)
+parser.add_argument(
+    "--memory",
+    action="store_true",
+    help="measure memory growth per replayed topic count",
+)
+
+
+async def main(args: typing.Any) -> None:
+    topics = args.topics if len(args.topics) > 0 else list(MOCK_TOPICS[args.csc].keys())
+
+    def client() -> MockEfdClient:
+        kwargs = {
+            "latency": args.latency,
+            "bandwidth": None if args.bandwidth is None else args.bandwidth * 1e6,
+        }
+        if args.recorded is not None:
+            return MockEfdClient.from_parquet(args.recorded, **kwargs)
+        return MockEfdClient(**kwargs)
+
+    replay_kwargs = {"frames": args.frames, "step": args.step, "duration": args.duration}
+
+    print(await benchmark_replay(args.csc, topics, client(), args.start, **replay_kwargs))
+
+    if args.memory:
+        for result in await benchmark_memory(args.csc, topics, client, args.start, **replay_kwargs):
+            print(result)
+
+
+def run() -> None:
+    asyncio.run(main(parser.parse_args()))
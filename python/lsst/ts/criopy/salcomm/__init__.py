@@ -1,5 +1,9 @@
 from .efd_cache import EfdCache
 from .efd_cache_request import EfdCacheRequest
+from .efd_disk_cache import EfdDiskCache
+from .efd_fetcher import EfdFetcher
 from .functions import command, command_group, warning
 from .meta_sal import MetaSAL, create
+from .mock_efd_client import MOCK_TOPICS, MockEfdClient
 from .player import Player
+from .signal_coalescer import SignalCoalescer
@@ -22,13 +22,16 @@
 __all__ = ["EfdCache"]
 
 import logging
-from typing import TYPE_CHECKING, Iterable
+import os
+from typing import TYPE_CHECKING, Any, Iterable
 
 from astropy.time import Time, TimeDelta
 from lsst_efd_client import EfdClient
 
 from .efd_cache_request import EfdCacheRequest
-from .efd_topic_cache import EfdTopicCache
+from .efd_disk_cache import EfdDiskCache
+from .efd_fetcher import EfdFetcher
+from .efd_topic_cache import EfdTopicCache, time_ns
 
 if TYPE_CHECKING:
     from .meta_sal import MetaSAL
@@ -52,6 +55,22 @@ class EfdCache:
         Maximum cache size in seconds. When data further from the current cache
         start or end are requested, the cache content will be deleted. Default
         to 600 seconds = 10 minutes.
+    num_tasks : `int`, optional
+        Maximal number of parallel EFD queries, shared by all requests.
+        Defaults to 10.
+    cache_dir : `str`, optional
+        Directory for persistent cache of the EFD data. Data are stored in
+        efd subdirectory, and are loaded from there instead of querying EFD
+        for intervals already retrieved. Requires pyarrow. Defaults to None -
+        no persistent cache.
+    efd_client : `EfdClient`, optional
+        EFD client. Anything providing select_time_series coroutine, e.g.
+        MockEfdClient, can be used. Defaults to None - EfdClient connected to
+        efd is created.
+    memory_budget : `int`, optional
+        Maximal memory (bytes) used by cached data. When exceeded, data
+        furthest from the playback position are evicted. Defaults to 1 GiB.
+        None means unlimited.
 
     Attributes
     ----------
@@ -59,6 +78,12 @@ class EfdCache:
         SAL remote name. Used in query to query the right data.
     efd_client : `EfdClient`
         EFD access client.
+    fetcher : `EfdFetcher`
+        Bounded concurrency, retrying EFD queries.
+    disk_cache : `EfdDiskCache | None`
+        Persistent cache. None if not used.
+    evicted : `int`
+        Memory (bytes) freed by evicting data.
     """
 
     def __init__(
@@ -67,13 +92,26 @@ class EfdCache:
         efd: str,
         max_span: float = 600,
         num_tasks: int = 10,
+        cache_dir: str | None = None,
+        efd_client: Any = None,
+        memory_budget: int | None = 1024**3,
     ):
         super().__init__()
         self.name = sal.remote.salinfo.name
         self.efd = efd
 
-        self.efd_client = EfdClient(self.efd)
+        self.efd_client = EfdClient(self.efd) if efd_client is None else efd_client
+        self.fetcher = EfdFetcher(self.efd_client, num_tasks)
         self.max_span = TimeDelta(max_span, format="sec")
+        self.memory_budget = memory_budget
+        self.evicted = 0
+
+        self.disk_cache: EfdDiskCache | None = None
+        if cache_dir is not None:
+            try:
+                self.disk_cache = EfdDiskCache(os.path.join(cache_dir, efd))
+            except ImportError as er:
+                logging.warning("Persistent EFD cache disabled, pyarrow is not available: %s", str(er))
 
         self.telemetry = {t: EfdTopicCache() for t in sal.telemetry()}
         self.events = {e: EfdTopicCache() for e in sal.events()}
@@ -118,7 +156,7 @@ class EfdCache:
 
     async def load(self, request: EfdCacheRequest) -> None:
         try:
-            await request.load(self.efd_client)
+            await request.load(self.fetcher, self.disk_cache)
         except ValueError as er:
             logging.warning(
                 "Event %s is not in the efd - will be ignored: %s.",
@@ -134,6 +172,111 @@ class EfdCache:
                 str(ex),
             )
 
+    def topics(self) -> Iterable[tuple[str, EfdTopicCache]]:
+        """Returns all cached topics.
+
+        Returns
+        -------
+        topics : `[(str, EfdTopicCache)]`
+            Topic names, as stored in EFD (events with logevent_ prefix), and
+            their caches.
+        """
+        yield from self.telemetry.items()
+        for e, c in self.events.items():
+            yield "logevent_" + e, c
+
+    @property
+    def nbytes(self) -> int:
+        """Memory (bytes) used by all cached data."""
+        return sum(c.nbytes for _, c in self.topics())
+
+    def set_current_ns(self, timepoint: int, direction: int = 1, keep: TimeDelta | None = None) -> None:
+        """Sets current timepoint of all topics. Records hits and misses,
+        and evicts data if over the memory budget.
+
+        Parameters
+        ----------
+        timepoint : `int`
+            Nanoseconds since Unix epoch.
+        direction : `int`, optional
+            Playback direction, 1 forward, -1 backward. Defaults to 1.
+        keep : `TimeDelta`, optional
+            Interval around the timepoint which is never evicted. Defaults to
+            None - 10 seconds.
+        """
+        for _, c in self.topics():
+            c.record_access(timepoint)
+            c.set_current_ns(timepoint)
+
+        self.evict(timepoint, direction, 10_000_000_000 if keep is None else round(keep.sec * 1e9))
+
+    def evict(self, timepoint: int, direction: int, keep: int) -> int:
+        """Evicts data when cached data exceed the memory budget, until they
+        take three quarters of the budget. Data furthest from the playback
+        position are evicted first, and data already replayed (behind the
+        position) before data ahead of it. Topics being loaded are skipped.
+
+        Parameters
+        ----------
+        timepoint : `int`
+            Playback position, nanoseconds since Unix epoch.
+        direction : `int`
+            Playback direction, 1 forward, -1 backward.
+        keep : `int`
+            Nanoseconds around the timepoint which are never evicted.
+
+        Returns
+        -------
+        evicted : `int`
+            Memory (bytes) freed.
+        """
+        if self.memory_budget is None:
+            return 0
+
+        total = self.nbytes
+        if total <= self.memory_budget:
+            return 0
+
+        # evict below the budget, so eviction doesn't run on every call
+        target = self.memory_budget * 3 // 4
+        freed = 0
+        while total > target:
+            # (weighted distance, cache, behind) of the range to evict
+            worst: tuple[float, EfdTopicCache, bool] | None = None
+            for _, c in self.topics():
+                if c.empty or c.lock.locked() or c.start is None or c.end is None:
+                    continue
+                if not c.covers(timepoint):
+                    worst = (float("inf"), c, True)
+                    break
+                behind = timepoint - time_ns(c.start) if direction > 0 else time_ns(c.end) - timepoint
+                ahead = time_ns(c.end) - timepoint if direction > 0 else timepoint - time_ns(c.start)
+                for distance, is_behind in ((behind * 2, True), (ahead, False)):
+                    if distance > keep * (2 if is_behind else 1) and (worst is None or distance > worst[0]):
+                        worst = (distance, c, is_behind)
+
+            if worst is None:
+                break
+
+            distance, c, is_behind = worst
+            before = c.nbytes
+            if distance == float("inf"):
+                c.clear()
+            else:
+                # evict the furthest half, but not the kept interval
+                span = max(int(distance / (4 if is_behind else 2)), keep)
+                if (direction > 0) == is_behind:
+                    c.trim(timepoint - span, time_ns(c.end))
+                else:
+                    c.trim(time_ns(c.start), timepoint + span)
+            freed += before - c.nbytes
+            total -= before - c.nbytes
+
+        if freed > 0:
+            self.evicted += freed
+            logging.debug("Evicted %d bytes, %d bytes cached.", freed, total)
+        return freed
+
     async def cleanup(self) -> None:
         """
         Called after data are loaded to clean any bad topic. EFD doesn't create
@@ -21,13 +21,14 @@
 
 __all__ = ["EfdCacheRequest"]
 
-import logging
+import asyncio
 from dataclasses import dataclass
-from time import monotonic
 
+import pandas as pd
 from astropy.time import Time, TimeDelta
-from lsst_efd_client import EfdClient
 
+from .efd_disk_cache import EfdDiskCache
+from .efd_fetcher import EfdFetcher
 from .efd_topic_cache import EfdTopicCache
 
 
@@ -62,66 +63,92 @@ class EfdCacheRequest:
     def is_event(self) -> bool:
         return self.topic.startswith("logevent_")
 
-    async def load(self, efd_client: EfdClient) -> None:
+    def forward(self) -> bool:
+        """Returns True if data shall be loaded from the request start,
+        False if from the request end (the request extends the cache
+        backward)."""
+        return self.cache.start is None or self.end != self.cache.start
+
+    def adjoins(self) -> bool:
+        """Returns True if the request extends the cache. Loading a request
+        which doesn't adjoin the cache clears the cached data."""
+        return (
+            self.cache.start is None
+            or self.cache.end is None
+            or self.start == self.cache.end
+            or self.end == self.cache.start
+        )
+
+    def chunks(self, chunk: TimeDelta) -> list[tuple[Time, Time]]:
+        """Split request into chunks.
+
+        Parameters
+        ----------
+        chunk : `TimeDelta`
+            Chunk duration.
+
+        Returns
+        -------
+        chunks : `[(Time, Time)]`
+            Chunks start and end times. Chunks are ordered in the loading
+            direction - from the request start if the cache shall be extended
+            forward, or from the request end if the cache shall be extended
+            backward.
+        """
+        ret = []
+        if self.forward():
+            i_start = self.start
+            while i_start < self.end:
+                i_end = min(i_start + chunk, self.end)
+                ret.append((i_start, i_end))
+                i_start = i_end
+        else:
+            i_end = self.end
+            while i_end > self.start:
+                i_start = max(i_end - chunk, self.start)
+                ret.append((i_start, i_end))
+                i_end = i_start
+        return ret
+
+    async def load(self, fetcher: EfdFetcher, disk_cache: EfdDiskCache | None = None) -> None:
         """
         Fill cache specified in request with data obtained from the EFD.
+        Chunks are queried in parallel, limited by the fetcher semaphore.
 
         Parameters
         ----------
-        request : `EfdCacheRequest`
-           Request data.
+        fetcher : `EfdFetcher`
+           Fetcher used to query data.
+        disk_cache : `EfdDiskCache`, optional
+           Persistent cache. If provided, only intervals missing in the
+           persistent cache are queried from the EFD and stored there, and
+           data are read from the persistent cache. Defaults to None.
         """
 
-        async def chunk(start: Time, end: Time) -> None:
-            logging.debug(
-                "Fetching %s - %s to %s.",
-                self.topic,
-                start.isot,
-                end.isot,
-            )
-            query_start = monotonic()
-            data = await efd_client.select_time_series(
-                f"lsst.sal.{self.csc_name}.{self.topic}",
-                "*, private_sndStamp",
-                start,
-                end,
-            )
-            duration = monotonic() - query_start
-            self.cache.merge(data)
-            data_len = len(data.index)
-            logging.info(
-                "Fetched %d rows from %s in %.3f seconds - %.2f rows/second.",
-                data_len,
-                self.topic,
-                duration,
-                data_len / duration,
-            )
-            self.cache.update(start, end)
-
-        async def load_interval(interval: TimeDelta) -> None:
-            if interval.sec > 0:
-                if self.cache.end is not None and self.cache.end != self.start:
-                    self.cache.clear()
+        async def chunk(start: Time, end: Time) -> pd.DataFrame:
+            if disk_cache is None:
+                return await fetcher.select(self.csc_name, self.topic, start, end)
 
-                i_start = i_end = self.start
-                i_end += interval
-                while i_start < self.end:
-                    i_end = min(i_start + interval, self.end)
-                    await chunk(i_start, i_end)
-                    i_start = i_end
-            else:
-                if self.cache.start is not None and self.cache.start != self.end:
-                    self.cache.clear()
-
-                i_start = i_end = self.end
-                i_start += interval
-                while i_start != self.start:
-                    i_start = max(i_end + interval, self.start)
-                    await chunk(i_start, i_end)
-                    i_end = i_start
+            for m_start, m_end in disk_cache.missing(self.csc_name, self.topic, start, end):
+                data = await fetcher.select(self.csc_name, self.topic, m_start, m_end)
+                await asyncio.to_thread(disk_cache.write, self.csc_name, self.topic, m_start, m_end, data)
+            return await asyncio.to_thread(disk_cache.read, self.csc_name, self.topic, start, end)
 
         async with self.cache.lock:
-            if self.cache.start is None or self.end == self.cache.start:
-                await load_interval(self.max_chunk)
-            else:
-                await load_interval(-self.max_chunk)
+            chunks = self.chunks(fetcher.chunk_duration(self.topic, self.max_chunk))
+
+            if self.forward():
+                if self.cache.end is not None and self.cache.end != self.start:
+                    self.cache.clear()
+            elif self.cache.start is not None and self.cache.start != self.end:
+                self.cache.clear()
+
+            tasks = [asyncio.create_task(chunk(start, end)) for start, end in chunks]
+            try:
+                # merge in loading direction, as data arrive
+                for (start, end), task in zip(chunks, tasks):
+                    self.cache.merge(await task)
+                    self.cache.update(start, end)
+            finally:
+                for task in tasks:
+                    task.cancel()
@@ -0,0 +1,285 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["EfdDiskCache"]
+
+import json
+import os
+import tempfile
+import threading
+import time
+import typing
+
+import pandas as pd
+from astropy.time import Time
+
+
+def _timestamp(t: Time) -> pd.Timestamp:
+    """Converts astropy Time to UTC pandas Timestamp. Uses the same ISOT
+    representation as EFD queries, so boundaries match exactly."""
+    return pd.Timestamp(t.utc.isot, tz="UTC")
+
+
+def _time(ns: int) -> Time:
+    """Converts nanoseconds since Unix epoch to astropy Time."""
+    return Time(pd.Timestamp(ns, tz="UTC").strftime("%Y-%m-%dT%H:%M:%S.%f"), scale="utc")
+
+
+def _replace(filename: str, write: typing.Callable[[str], None]) -> None:
+    """Writes file under a unique temporary name and then atomically replaces
+    filename with it, so readers never see partially written file."""
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(filename))
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class EfdDiskCache:
+    """
+    Persistent, on-disk cache of EFD query results. Data are stored in Parquet
+    files, a file per CSC, topic and interval queried from the EFD, in the
+    directory/csc/topic/start-end.parquet hierarchy (start and end are
+    nanoseconds since Unix epoch). Files are written once and never rewritten;
+    reads load only rows within the requested interval from the files
+    overlapping it. Time intervals already retrieved from the EFD are recorded
+    in coverage.json file in the topic directory. Requires pyarrow.
+
+    Data newer than ingest_lag aren't recorded as retrieved, as they may not
+    be ingested into the EFD yet. Such intervals are queried again.
+
+    Writes can be called from multiple threads; writes of the same topic are
+    serialized.
+
+    Parameters
+    ----------
+    directory : `str`
+        Cache root directory. Created if it doesn't exist.
+    ingest_lag : `float`, optional
+        Seconds before the current time, after which queried intervals aren't
+        recorded as retrieved. Defaults to 300.
+
+    Raises
+    ------
+    ImportError
+        When pyarrow isn't available.
+    """
+
+    def __init__(self, directory: str, ingest_lag: float = 300):
+        import pyarrow.parquet as pq
+
+        self._pq = pq
+        self.directory = directory
+        self.ingest_lag = ingest_lag
+        os.makedirs(directory, exist_ok=True)
+        self._coverage: dict[tuple[str, str], list[list[int]]] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _topic_dir(self, csc_name: str, topic: str) -> str:
+        return os.path.join(self.directory, csc_name, topic)
+
+    def _files(self, csc_name: str, topic: str, s: int, e: int) -> list[str]:
+        """Returns sorted data files overlapping s-e interval."""
+        try:
+            names = os.listdir(self._topic_dir(csc_name, topic))
+        except FileNotFoundError:
+            return []
+
+        files = []
+        for name in names:
+            root, extension = os.path.splitext(name)
+            if extension != ".parquet":
+                continue
+            f_start, f_end = (int(n) for n in root.split("-"))
+            if f_start <= e and f_end >= s:
+                files.append((f_start, f_end, name))
+
+        return [os.path.join(self._topic_dir(csc_name, topic), f[2]) for f in sorted(files)]
+
+    def coverage(self, csc_name: str, topic: str) -> list[list[int]]:
+        """Returns intervals retrieved from the EFD.
+
+        Parameters
+        ----------
+        csc_name : `str`
+            CSC name.
+        topic : `str`
+            Topic name, as stored in EFD.
+
+        Returns
+        -------
+        coverage : `[[int, int]]`
+            Sorted, non-overlapping intervals. Start and end are nanoseconds
+            since Unix epoch.
+        """
+        key = (csc_name, topic)
+        if key not in self._coverage:
+            try:
+                with open(os.path.join(self._topic_dir(csc_name, topic), "coverage.json")) as f:
+                    self._coverage[key] = json.load(f)
+            except FileNotFoundError:
+                self._coverage[key] = []
+        return self._coverage[key]
+
+    def missing(self, csc_name: str, topic: str, start: Time, end: Time) -> list[tuple[Time, Time]]:
+        """Returns intervals not yet retrieved from the EFD.
+
+        Parameters
+        ----------
+        csc_name : `str`
+            CSC name.
+        topic : `str`
+            Topic name, as stored in EFD.
+        start : `Time`
+            Requested interval start.
+        end : `Time`
+            Requested interval end.
+
+        Returns
+        -------
+        missing : `[(Time, Time)]`
+            Intervals which shall be retrieved from the EFD and stored with
+            the write method.
+        """
+        s = _timestamp(start).value
+        e = _timestamp(end).value
+
+        ret = []
+        for c_start, c_end in self.coverage(csc_name, topic):
+            if c_end <= s:
+                continue
+            if c_start >= e:
+                break
+            if c_start > s:
+                ret.append((s, c_start))
+            s = max(s, c_end)
+            if s >= e:
+                break
+
+        if s < e:
+            ret.append((s, e))
+
+        # keep requested boundaries, so no rounding errors are introduced
+        return [
+            (
+                start if m_start == _timestamp(start).value else _time(m_start),
+                end if m_end == _timestamp(end).value else _time(m_end),
+            )
+            for m_start, m_end in ret
+        ]
+
+    def read(self, csc_name: str, topic: str, start: Time, end: Time) -> pd.DataFrame:
+        """Reads cached data.
+
+        Parameters
+        ----------
+        csc_name : `str`
+            CSC name.
+        topic : `str`
+            Topic name, as stored in EFD.
+        start : `Time`
+            Interval start (inclusive).
+        end : `Time`
+            Interval end (inclusive).
+
+        Returns
+        -------
+        data : `pd.DataFrame`
+            Cached rows within the interval, indexed by time. Empty if nothing
+            is cached.
+        """
+        s = _timestamp(start)
+        e = _timestamp(end)
+
+        frames = []
+        for filename in self._files(csc_name, topic, s.value, e.value):
+            index = self._pq.read_schema(filename).pandas_metadata["index_columns"][0]
+            frames.append(pd.read_parquet(filename, filters=[(index, ">=", s), (index, "<=", e)]))
+
+        if len(frames) == 0:
+            return pd.DataFrame()
+
+        if len(frames) == 1:
+            return frames[0]
+
+        # files of re-queried intervals overlap
+        data = pd.concat(frames, sort=True)
+        return data.loc[~data.index.duplicated(keep="last")].sort_index()
+
+    def write(self, csc_name: str, topic: str, start: Time, end: Time, data: pd.DataFrame) -> None:
+        """Stores data retrieved from the EFD, and records the interval as
+        covered.
+
+        Parameters
+        ----------
+        csc_name : `str`
+            CSC name.
+        topic : `str`
+            Topic name, as stored in EFD.
+        start : `Time`
+            Start of the interval queried from the EFD.
+        end : `Time`
+            End of the interval queried from the EFD.
+        data : `pd.DataFrame`
+            Data retrieved from the EFD. Index shall be UTC timestamps.
+        """
+        with self._locks_lock:
+            lock = self._locks.setdefault((csc_name, topic), threading.Lock())
+
+        # coverage is read, merged and rewritten
+        with lock:
+            self._write(csc_name, topic, start, end, data)
+
+    def _write(self, csc_name: str, topic: str, start: Time, end: Time, data: pd.DataFrame) -> None:
+        topic_dir = self._topic_dir(csc_name, topic)
+        os.makedirs(topic_dir, exist_ok=True)
+
+        s = _timestamp(start).value
+        e = _timestamp(end).value
+
+        if not data.empty:
+            _replace(os.path.join(topic_dir, f"{s}-{e}.parquet"), data.sort_index().to_parquet)
+
+        # recent data may not be ingested yet
+        e = min(e, time.time_ns() - int(self.ingest_lag * 1_000_000_000))
+        if e <= s:
+            return
+
+        # new list, so missing() called from other thread sees either the
+        # old or the new coverage
+        coverage = sorted(self.coverage(csc_name, topic) + [[s, e]])
+        merged = [list(coverage[0])]
+        for c_start, c_end in coverage[1:]:
+            if c_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], c_end)
+            else:
+                merged.append([c_start, c_end])
+
+        def dump(filename: str) -> None:
+            with open(filename, "w") as f:
+                json.dump(merged, f)
+
+        _replace(os.path.join(topic_dir, "coverage.json"), dump)
+        self._coverage[(csc_name, topic)] = merged
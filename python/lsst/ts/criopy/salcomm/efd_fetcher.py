@@ -0,0 +1,204 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["EfdFetcher"]
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any
+
+import pandas as pd
+from astropy.time import Time, TimeDelta
+
+
+class EfdFetcher:
+    """
+    Bounded concurrency EFD queries. All queries share a semaphore, so no
+    more than max_concurrent queries are send to the EFD at once. Failed
+    queries are retried with exponential backoff. Query statistics are used
+    to size chunks, so a chunk query takes roughly target_duration.
+
+    Parameters
+    ----------
+    efd_client : `EfdClient`
+        EFD client. Anything providing select_time_series coroutine can be
+        used, e.g. MockEfdClient.
+    max_concurrent : `int`, optional
+        Maximal number of parallel queries. Defaults to 4.
+    retries : `int`, optional
+        Number of retries of a failed query. Defaults to 3.
+    backoff : `float`, optional
+        Delay before the first retry (seconds). Doubled for every next retry.
+        Defaults to 0.5.
+    target_duration : `float`, optional
+        Preferred duration of a single query (seconds). Defaults to 2.
+    min_chunk : `float`, optional
+        Minimal chunk duration (seconds). Defaults to 10.
+
+    Attributes
+    ----------
+    queries : `int`
+        Number of finished queries.
+    retried : `int`
+        Number of retried queries.
+    rows : `int`
+        Number of retrieved rows.
+    """
+
+    def __init__(
+        self,
+        efd_client: Any,
+        max_concurrent: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        target_duration: float = 2,
+        min_chunk: float = 10,
+    ):
+        self.efd_client = efd_client
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.retries = retries
+        self.backoff = backoff
+        self.target_duration = target_duration
+        self.min_chunk = min_chunk
+
+        self.queries = 0
+        self.retried = 0
+        self.rows = 0
+
+        # topic => (rows per second of data, rows per second of query)
+        self._rates: dict[str, tuple[float, float]] = {}
+
+    def chunk_duration(self, topic: str, max_chunk: TimeDelta) -> TimeDelta:
+        """Returns duration of the next chunk for the topic.
+
+        Parameters
+        ----------
+        topic : `str`
+            Topic name, as stored in EFD.
+        max_chunk : `TimeDelta`
+            Maximal chunk duration.
+
+        Returns
+        -------
+        chunk : `TimeDelta`
+            Chunk duration. Chunk queries shall take about target_duration.
+            Equals max_chunk for topics without statistics.
+        """
+        try:
+            data_rate, query_rate = self._rates[topic]
+        except KeyError:
+            return max_chunk
+
+        if data_rate <= 0:
+            return max_chunk
+
+        duration = self.target_duration * query_rate / data_rate
+        return TimeDelta(min(max(duration, self.min_chunk), max_chunk.sec), format="sec")
+
+    async def select(self, csc_name: str, topic: str, start: Time, end: Time) -> pd.DataFrame:
+        """Query EFD for topic data. Retries failed queries.
+
+        Parameters
+        ----------
+        csc_name : `str`
+            CSC name.
+        topic : `str`
+            Topic name, as stored in EFD.
+        start : `Time`
+            Interval start.
+        end : `Time`
+            Interval end.
+
+        Returns
+        -------
+        data : `pd.DataFrame`
+            Retrieved data.
+
+        Raises
+        ------
+        ValueError
+            When topic isn't in the EFD. Not retried.
+        """
+        delay = self.backoff
+        retry = 0
+        while True:
+            try:
+                return await self._select(csc_name, topic, start, end)
+            except ValueError:
+                raise
+            except Exception as ex:
+                if retry >= self.retries:
+                    raise
+                logging.warning(
+                    "Fetching %s %s to %s failed, retrying in %.1f seconds: %s",
+                    topic,
+                    start.isot,
+                    end.isot,
+                    delay,
+                    str(ex),
+                )
+                retry += 1
+                self.retried += 1
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _select(self, csc_name: str, topic: str, start: Time, end: Time) -> pd.DataFrame:
+        async with self.semaphore:
+            logging.debug(
+                "Fetching %s - %s to %s.",
+                topic,
+                start.isot,
+                end.isot,
+            )
+            query_start = monotonic()
+            data = await self.efd_client.select_time_series(
+                f"lsst.sal.{csc_name}.{topic}",
+                "*, private_sndStamp",
+                start,
+                end,
+            )
+            duration = monotonic() - query_start
+
+        data_len = len(data.index)
+        logging.info(
+            "Fetched %d rows from %s in %.3f seconds - %.2f rows/second.",
+            data_len,
+            topic,
+            duration,
+            data_len / duration,
+        )
+
+        self.queries += 1
+        self.rows += data_len
+
+        span = (end - start).sec
+        if data_len > 0 and span > 0 and duration > 0:
+            data_rate = data_len / span
+            query_rate = data_len / duration
+            if topic in self._rates:
+                # smooth the estimates
+                old_data, old_query = self._rates[topic]
+                data_rate = (old_data + data_rate) / 2
+                query_rate = (old_query + query_rate) / 2
+            self._rates[topic] = (data_rate, query_rate)
+
+        return data
@@ -23,79 +23,174 @@ __all__ = ["EfdTopicCache"]
 
 import asyncio
 import logging
-from typing import Any
 
+import numpy as np
 import pandas as pd
 from astropy.time import Time, TimeDelta
 
 
+def time_ns(timepoint: Time) -> int:
+    """Converts time to nanoseconds since Unix epoch. Rounds to microseconds,
+    so float imprecision doesn't exclude row at the exact timepoint.
+
+    Parameters
+    ----------
+    timepoint : `Time`
+        Time to convert.
+
+    Returns
+    -------
+    ns : `int`
+        Nanoseconds since Unix epoch (UTC).
+    """
+    return round(timepoint.unix * 1e6) * 1000
+
+
+class EfdTopicLayout:
+    """
+    Maps topic fields to columns of 2-D blocks holding the topic data. EFD
+    stores arrays as columns named name0, name1,... Those are placed into a
+    contiguous range of columns in a block of the array dtype, so an array
+    field of a row is a NumPy view into the block. Scalar fields occupy a
+    single block column.
+
+    Parameters
+    ----------
+    data : `pd.DataFrame`
+        EFD data. Layout is calculated from the data columns.
+
+    Attributes
+    ----------
+    columns : `tuple[str]`
+        Data columns the layout was calculated for.
+    scalars : `{str: ([str], numpy.ndarray)}`
+        Scalar fields. Keyed by block key, names of the fields and columns in
+        the block.
+    arrays : `[(str, str, int, int)]`
+        Array fields - name, block key, first and after the last column in
+        the block.
+    sources : `{str: [str | None]}`
+        For every block key, data columns copied into block columns. None
+        marks missing array members.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.columns = tuple(data.columns)
+
+        def dtype(column: str) -> np.dtype:
+            try:
+                return np.dtype(data[column].dtype)
+            except TypeError:
+                return np.dtype(object)
+
+        # array members, from the shortest array name
+        members: dict[str, dict[int, str]] = {}
+        claimed: set[str] = set()
+        for prefix in sorted({c[:-1] for c in self.columns if c.endswith("0") and len(c) > 1}, key=len):
+            if prefix + "0" in claimed:
+                continue
+            indices = {}
+            for c in self.columns:
+                suffix = c[len(prefix) :]
+                if c not in claimed and c.startswith(prefix) and suffix.isdigit():
+                    if suffix == "0" or not suffix.startswith("0"):
+                        indices[int(suffix)] = c
+            members[prefix] = indices
+            claimed.update(indices.values())
+
+        self.scalars: dict[str, tuple[list[str], np.ndarray]] = {}
+        self.arrays: list[tuple[str, str, int, int]] = []
+        self.sources: dict[str, list[str | None]] = {}
+
+        for c in self.columns:
+            if c in claimed:
+                continue
+            key = dtype(c).str
+            block = self.sources.setdefault(key, [])
+            names, columns = self.scalars.get(key, ([], np.empty(0, dtype=int)))
+            self.scalars[key] = (names + [c], np.append(columns, len(block)))
+            block.append(c)
+
+        for name, indices in members.items():
+            length = max(indices.keys()) + 1
+            array_dtype = np.result_type(*[dtype(c) for c in indices.values()])
+            if len(indices) != length:
+                logging.warning(
+                    "Uncomplete array in EFD data - %s map %s",
+                    name,
+                    indices,
+                )
+                if array_dtype != np.dtype(object):
+                    array_dtype = np.result_type(array_dtype, np.float64)
+            block = self.sources.setdefault(array_dtype.str, [])
+            self.arrays.append((name, array_dtype.str, len(block), len(block) + length))
+            block.extend([indices.get(i) for i in range(length)])
+
+    def blocks(self, data: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Copy data into blocks.
+
+        Parameters
+        ----------
+        data : `pd.DataFrame`
+            EFD data, with the same columns as used to calculate the layout.
+
+        Returns
+        -------
+        blocks : `{str: numpy.ndarray}`
+            Read-only 2-D arrays, keyed by dtype. Rows match data rows.
+        """
+        ret = {}
+        for key, sources in self.sources.items():
+            dtype = np.dtype(key)
+            block = np.empty((len(data), len(sources)), dtype=dtype)
+            for i, c in enumerate(sources):
+                if c is None:
+                    block[:, i] = None if dtype == np.dtype(object) else np.nan
+                else:
+                    block[:, i] = data[c].to_numpy()
+            block.setflags(write=False)
+            ret[key] = block
+        return ret
+
+
 class EfdTopic:
     """
     Contains single topic data. The constructor sets class attributes, so
-    the EFD row (pandas.Series) si transformed to SAL Topic-like structure.
-    This class objects can be passed to emit function to send data around as
-    SAL signal.  Assuming SAL triggered updates are disabled (see the
-    `MetaSAL.freeze` method), this highjack the SAL topics to send to EUI
-    historic data instead of the latest observatory telemetry.
+    the EFD row is transformed to SAL Topic-like structure. This class
+    objects can be passed to emit function to send data around as SAL signal.
+    Assuming SAL triggered updates are disabled (see the `MetaSAL.freeze`
+    method), this highjack the SAL topics to send to EUI historic data
+    instead of the latest observatory telemetry.
 
     Attributes
     ----------
-    topic_name.. : `float | int | str | list[float] | list[int]`
-        Topics extracted from EFD row data. Created dynamically as encountred
-        in the passed row parametr to the constructor.
+    topic_name.. : `float | int | str | numpy.ndarray`
+        Topics extracted from EFD row data. Created dynamically from the
+        layout. Arrays are read-only views into the cached data blocks.
 
     Parameters
     ----------
-    row : `pd.Series`
-        Data serie representing EFD row. This is transformed to SAL Topic-like
-        structure, with EFD columns-stored arrays turned into array attributes.
+    layout : `EfdTopicLayout`
+        Topic layout.
+    blocks : `{str: numpy.ndarray}`
+        Topic data, as returned by layout.blocks.
+    row : `int`
+        Row of the blocks to transform.
     changed : `bool`
         If True, data were changed from tha last call. This is stored as
         _changed attribute.
     """
 
-    def __init__(self, row: pd.Series, changed: bool):
+    def __init__(self, layout: EfdTopicLayout, blocks: dict[str, np.ndarray], row: int, changed: bool):
         self._changed = changed
         self.private_sndStamp = None
 
-        last = None
-        last_len = 0
-        current_map: dict[int, Any] = {}
+        for key, (names, columns) in layout.scalars.items():
+            # tolist converts NumPy scalars to Python types
+            self.__dict__.update(zip(names, blocks[key][row, columns].tolist()))
 
-        def add_map(last: str) -> None:
-            arr = [None] * len(current_map)
-            for i in range(len(current_map)):
-                if i in current_map.keys():
-                    arr[i] = current_map[i]
-                else:
-                    arr[i] = None
-                    logging.warning(
-                        "Uncomplete array in EFD data - %s map %s",
-                        last,
-                        current_map,
-                    )
-            setattr(self, last, arr)
-
-        for c in row.columns.values:
-            v = row[c].item()
-            # see if an array shall be created, appended or this is a new
-            # attribute
-            if last is not None and c.startswith(last) and c[last_len:].isnumeric():
-                current_map[int(c[last_len:])] = v
-            else:
-                if last is not None:
-                    add_map(last)
-
-                if c[-1] == "0":
-                    last = c[:-1]
-                    last_len = len(last)
-                    current_map = {0: v}
-                else:
-                    last = None
-                    setattr(self, c, v)
-
-        if last is not None:
-            add_map(last)
+        for name, key, start, end in layout.arrays:
+            setattr(self, name, blocks[key][row, start:end])
 
 
 class EfdTopicCache:
@@ -115,6 +210,12 @@ class EfdTopicCache:
         Cache start time. Used to record cache extend.
     end : `Time | none`
         Cache end time. Included for the same reason as start time.
+    nbytes : `int`
+        Memory (bytes) used by the cached data.
+    hits : `int`
+        Number of accesses (see record_access) to cached data.
+    misses : `int`
+        Number of accesses to data not in the cache.
     """
 
     data: pd.DataFrame | None = None
@@ -125,6 +226,16 @@ class EfdTopicCache:
     def __init__(self) -> None:
         super().__init__()
         self.lock = asyncio.Lock()
+        # data index as nanoseconds since Unix epoch, sorted
+        self._index = np.empty(0, dtype=np.int64)
+        # nanoseconds index of current_data row
+        self._current_ns: int | None = None
+        self._layout: EfdTopicLayout | None = None
+        self._blocks: dict[str, np.ndarray] | None = None
+
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
 
     def interval(
         self, timepoint: Time, min_duration: TimeDelta, max_span: TimeDelta
@@ -215,31 +326,58 @@ class EfdTopicCache:
             The cache topic entry will be set to mimics SAL topic at the given
             time.
         """
+        self.set_current_ns(time_ns(timepoint))
+
+    def set_current_ns(self, timepoint: int) -> None:
+        """
+        Sets current timepoint in historical data. Faster version of
+        set_current_time, for timepoint already converted with time_ns.
+
+        Parameters
+        ----------
+        timepoint : `int`
+            Nanoseconds since Unix epoch.
+        """
         if self.empty:
             self.current_data = None
+            self._current_ns = None
             return
 
         assert self.data is not None
-        timestr = timepoint.iso + "+00:00"
 
-        row = self.data.loc[:timestr].tail(n=1)
-        if row.empty:
+        pos = int(np.searchsorted(self._index, timepoint, side="right")) - 1
+        if pos < 0:
             self.current_data = None
+            self._current_ns = None
             return
 
-        changed = True
+        row_ns = int(self._index[pos])
+        if self.current_data is not None and self._current_ns == row_ns:
+            self.current_data._changed = False
+            return
 
-        if self.current_data is not None:
-            if self.current_data.private_sndStamp == row["private_sndStamp"].item():
-                changed = False
+        if self._blocks is None:
+            if self._layout is None or self._layout.columns != tuple(self.data.columns):
+                self._layout = EfdTopicLayout(self.data)
+            self._blocks = self._layout.blocks(self.data)
+            self._update_nbytes()
 
-        self.current_data = EfdTopic(row, changed)
+        assert self._layout is not None
+        self.current_data = EfdTopic(self._layout, self._blocks, pos, True)
+        self._current_ns = row_ns
 
     def clear(self) -> None:
         """
         Clear cached data.
         """
         self.data = None
+        self.start = None
+        self.end = None
+        self.current_data = None
+        self._current_ns = None
+        self._index = np.empty(0, dtype=np.int64)
+        self._blocks = None
+        self.nbytes = 0
 
     def merge(self, data: pd.DataFrame) -> None:
         """
@@ -265,6 +403,86 @@ class EfdTopicCache:
             except Exception as er:
                 logging.error("Exception when merging two DataFrames: %", str(er))
 
+        self._blocks = None
+        if self.data is None or self.data.empty:
+            self._index = np.empty(0, dtype=np.int64)
+            self.nbytes = 0
+            return
+
+        if not self.data.index.is_monotonic_increasing:
+            self.data.sort_index(inplace=True)
+        self._index = self.data.index.values.astype("datetime64[ns]").astype(np.int64)
+        self._update_nbytes()
+
+    def _update_nbytes(self) -> None:
+        if self.data is None:
+            self.nbytes = 0
+            return
+        self.nbytes = int(self.data.memory_usage(index=True).sum()) + self._index.nbytes
+        if self._blocks is not None:
+            self.nbytes += sum(block.nbytes for block in self._blocks.values())
+
+    def covers(self, timepoint: int) -> bool:
+        """Returns True if the timepoint is within the cached interval.
+
+        Parameters
+        ----------
+        timepoint : `int`
+            Nanoseconds since Unix epoch.
+        """
+        if self.start is None or self.end is None:
+            return False
+        return time_ns(self.start) <= timepoint <= time_ns(self.end)
+
+    def record_access(self, timepoint: int) -> None:
+        """Records access to data at the timepoint, counting hits and
+        misses.
+
+        Parameters
+        ----------
+        timepoint : `int`
+            Nanoseconds since Unix epoch.
+        """
+        if self.covers(timepoint):
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def trim(self, keep_start: int, keep_end: int) -> None:
+        """Removes data outside of the interval, to free memory. The last row
+        before keep_start is kept, so the topic value at keep_start is known.
+
+        Parameters
+        ----------
+        keep_start : `int`
+            Kept interval start, nanoseconds since Unix epoch.
+        keep_end : `int`
+            Kept interval end, nanoseconds since Unix epoch.
+        """
+        if self.empty or self.start is None or self.end is None:
+            return
+
+        assert self.data is not None
+
+        if keep_start > time_ns(self.start):
+            self.start = Time(keep_start // 1000 / 1e6, format="unix", scale="utc")
+        if keep_end < time_ns(self.end):
+            self.end = Time(keep_end // 1000 / 1e6, format="unix", scale="utc")
+
+        first = max(int(np.searchsorted(self._index, keep_start, side="left")) - 1, 0)
+        last = int(np.searchsorted(self._index, keep_end, side="right"))
+        if first == 0 and last == len(self._index):
+            return
+
+        # copy, so the original data are freed
+        self.data = self.data.iloc[first:last].copy()
+        self._index = self._index[first:last].copy()
+        if self._blocks is not None:
+            self._blocks = {key: block[first:last].copy() for key, block in self._blocks.items()}
+            for block in self._blocks.values():
+                block.setflags(write=False)
+        self._update_nbytes()
+
     def update(self, start: Time, end: Time) -> None:
         """
         Updates cache start and end times. Data retrieved from the EFD for the
@@ -24,6 +24,7 @@ import sys
 
 from .. import ExitErrorCodes
 from .efd_cache import EfdCache
+from .signal_coalescer import SignalCoalescer
 
 try:
     qt_api = os.environ["QT_API"]
@@ -85,6 +86,10 @@ class MetaSAL(type(QObject)):  # type: ignore
     disconnect_callbacks()
         Disconnet SAL topic callbacks. Qt Signals will not be emitted when new
         telemetry is received. This is called in freeze method.
+    coalesced(topic)
+        Returns signal emitted with the latest topic data at most
+        coalesce_rate times per second. Shall be used by consumers showing
+        only the current value.
     """
 
     def __new__(cls, classname, bases, dictionary):  # type: ignore
@@ -125,6 +130,9 @@ class MetaSAL(type(QObject)):  # type: ignore
         dictionary["remote"] = dictionary["sal_remote"]
         dictionary["freezed_cache"] = None
 
+        dictionary["coalesce_rate"] = dictionary.get("_coalesce_rate", 20)
+        dictionary["coalescer"] = None
+
         def freeze(self, cache: EfdCache) -> None:  # type: ignore
             if self.remote == cache:
                 return
@@ -170,6 +178,13 @@ class MetaSAL(type(QObject)):  # type: ignore
             for t in [evttel for evttel in dir(self.sal_remote) if _filter_evt_tel(evttel)]:
                 getattr(self.sal_remote, t).callback = None
 
+        def coalesced(self, topic: str) -> Signal:  # type: ignore
+            """Returns signal emitted with the latest topic data, at most
+            coalesce_rate times per second. The topic signal stays lossless."""
+            if self.coalescer is None:
+                self.coalescer = SignalCoalescer(self, self.coalesce_rate)
+            return self.coalescer.signal(topic)
+
         newclass = super(MetaSAL, cls).__new__(cls, classname, bases, dictionary)
 
         # creates class methods
@@ -185,10 +200,17 @@ class MetaSAL(type(QObject)):  # type: ignore
         setattr(newclass, connect_callbacks.__name__, connect_callbacks)
         setattr(newclass, disconnect_callbacks.__name__, disconnect_callbacks)
 
+        setattr(newclass, coalesced.__name__, coalesced)
+
         return newclass
 
 
-def create(name: str, manual: None | dict[str, typing.Any] = None, **kwargs: typing.Any) -> MetaSAL:
+def create(
+    name: str,
+    manual: None | dict[str, typing.Any] = None,
+    coalesce_rate: float = 20,
+    **kwargs: typing.Any,
+) -> MetaSAL:
     """Creates SALComm instance for given remote(s).
 
     The returned object contains PySide6.QtCore.Signal class variables. Those
@@ -206,6 +228,9 @@ def create(name: str, manual: None | dict[str, typing.Any] = None, **kwargs: typ
     manual : `hash`
         Events and telemetry topics created with optional arguments. Keys are
         events and telemetry names, values is a hash of additional arguments.
+    coalesce_rate : `float`, optional
+        Maximal rate (Hz) of coalesced signals, returned by the coalesced
+        method. Defaults to 20.
 
     **kwargs : `dict`
         Optional parameters passed to remote.
@@ -244,6 +269,9 @@ def create(name: str, manual: None | dict[str, typing.Any] = None, **kwargs: typ
        my_mount.azimuth.connect(update_labels_azimuth)
        my_vms.data.connect(update_data)
 
+       # emitted with the latest data, at most 20 times per second
+       my_mount.coalesced("azimuth").connect(update_labels_azimuth)
+
        ...
 
        @asyncSlot()
@@ -268,6 +296,7 @@ def create(name: str, manual: None | dict[str, typing.Any] = None, **kwargs: typ
         _args = kwargs
         _args["name"] = name
         _manual = manual
+        _coalesce_rate = coalesce_rate
 
         def __init__(self) -> None:
             super().__init__()
@@ -0,0 +1,283 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["MOCK_TOPICS", "MockEfdClient"]
+
+import asyncio
+import glob
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+from astropy.time import Time
+
+M1M3_FORCES = [("fx", None), ("fy", None), ("fz", None), ("mx", None), ("my", None), ("mz", None)]
+
+MOCK_TOPICS: dict[str, dict[str, tuple[float, list[tuple[str, int | None]]]]] = {
+    "MTM1M3": {
+        "forceActuatorData": (
+            50,
+            [
+                ("xForce", 12),
+                ("yForce", 100),
+                ("zForce", 156),
+                ("primaryCylinderForce", 156),
+                ("secondaryCylinderForce", 112),
+                *M1M3_FORCES,
+                ("forceMagnitude", None),
+            ],
+        ),
+        "appliedForces": (
+            50,
+            [("xForces", 12), ("yForces", 100), ("zForces", 156), *M1M3_FORCES, ("forceMagnitude", None)],
+        ),
+        "hardpointActuatorData": (
+            50,
+            [
+                ("stepsQueued", 6),
+                ("stepsCommanded", 6),
+                ("measuredForce", 6),
+                ("encoder", 6),
+                ("displacement", 6),
+                *M1M3_FORCES,
+                ("xPosition", None),
+                ("yPosition", None),
+                ("zPosition", None),
+                ("xRotation", None),
+                ("yRotation", None),
+                ("zRotation", None),
+            ],
+        ),
+        "logevent_detailedState": (0.01, [("detailedState", None)]),
+    },
+    "MTVMS": {
+        "data": (20, [("sensor", None), ("accelerationX", 50), ("accelerationY", 50), ("accelerationZ", 50)]),
+    },
+    "MTM1M3TS": {
+        "thermalData": (
+            1,
+            [
+                ("ilcFault", 96),
+                ("heaterDisabled", 96),
+                ("fanBreaker", 96),
+                ("heaterPWM", 96),
+                ("fanRPM", 96),
+                ("absoluteTemperature", 96),
+                ("differentialTemperature", 96),
+            ],
+        ),
+        "glycolLoopTemperature": (
+            1,
+            [
+                ("aboveMirrorTemperature", None),
+                ("insideCellTemperature1", None),
+                ("insideCellTemperature2", None),
+                ("insideCellTemperature3", None),
+                ("telescopeCoolantSupplyTemperature", None),
+                ("telescopeCoolantReturnTemperature", None),
+                ("mirrorCoolantSupplyTemperature", None),
+                ("mirrorCoolantReturnTemperature", None),
+            ],
+        ),
+        "mixingValve": (1, [("rawValvePosition", None), ("valvePosition", None)]),
+    },
+}
+"""Topics served with realistic schemas. CSC name => topic name => (rate,
+fields). Rate is in rows per second, fields are (name, array length) tuples,
+array length None for scalars. Arrays are stored as name0, name1,.. columns,
+as in the EFD."""
+
+
+class MockEfdClient:
+    """
+    Local EFD client stub. Generates synthetic data for select_time_series
+    queries, or serves recorded data, simulating query latency and bandwidth.
+    Can be used to test and benchmark EFD access offline.
+
+    Topics listed in MOCK_TOPICS are generated with their schema and rate.
+    Other topics have columns value columns, generated with rate.
+
+    Parameters
+    ----------
+    rate : `float`, optional
+        Data rate (rows per second) of topics not in MOCK_TOPICS. Defaults to
+        50.
+    columns : `int`, optional
+        Number of value columns of topics not in MOCK_TOPICS, named value0,
+        value1,... Defaults to 1.
+    latency : `float`, optional
+        Query latency (seconds). Defaults to 0.1.
+    failures : `int`, optional
+        Number of initial queries which fail with ConnectionError. Used to
+        test retries. Defaults to 0.
+    bandwidth : `float`, optional
+        Transfer speed (bytes per second). Query takes latency + size of the
+        returned data / bandwidth. Defaults to None - unlimited.
+    recorded : `dict[str, pd.DataFrame]`, optional
+        Recorded data, keyed by full topic name (lsst.sal.CSC.topic). Indices
+        shall be UTC timestamps. Served instead of synthetic data. Defaults to
+        None.
+
+    Attributes
+    ----------
+    queries : `int`
+        Number of received queries.
+    max_parallel : `int`
+        Maximal number of queries processed in parallel.
+    transferred : `int`
+        Number of bytes returned by queries.
+    """
+
+    def __init__(
+        self,
+        rate: float = 50,
+        columns: int = 1,
+        latency: float = 0.1,
+        failures: int = 0,
+        bandwidth: float | None = None,
+        recorded: dict[str, pd.DataFrame] | None = None,
+    ):
+        self.rate = rate
+        self.columns = columns
+        self.latency = latency
+        self.failures = failures
+        self.bandwidth = bandwidth
+        self.recorded = {} if recorded is None else recorded
+
+        self.queries = 0
+        self.max_parallel = 0
+        self.transferred = 0
+        self._parallel = 0
+
+    @classmethod
+    def from_parquet(cls, directory: str, **kwargs: typing.Any) -> "MockEfdClient":
+        """Creates client serving recorded data. Requires pyarrow.
+
+        Parameters
+        ----------
+        directory : `str`
+            Directory with Parquet files. Files shall be named by the full
+            topic name, e.g. lsst.sal.MTM1M3.forceActuatorData.parquet.
+        **kwargs : `dict`
+            Passed to the constructor.
+
+        Returns
+        -------
+        client : `MockEfdClient`
+            Client serving the recorded data.
+        """
+        recorded = {}
+        for filename in sorted(glob.glob(os.path.join(directory, "*.parquet"))):
+            recorded[os.path.basename(filename)[: -len(".parquet")]] = pd.read_parquet(filename)
+        return cls(recorded=recorded, **kwargs)
+
+    def generate(self, topic_name: str, start: Time, end: Time) -> pd.DataFrame:
+        """Returns synthetic data with rows at multiples of 1/rate seconds.
+
+        Parameters
+        ----------
+        topic_name : `str`
+            Full topic name (lsst.sal.CSC.topic). Selects schema and rate.
+        start : `Time`
+            Interval start.
+        end : `Time`
+            Interval end.
+
+        Returns
+        -------
+        data : `pd.DataFrame`
+            Data indexed by UTC timestamps. Includes private_sndStamp column.
+        """
+        _, _, csc_name, topic = topic_name.split(".", 3)
+        try:
+            rate, fields = MOCK_TOPICS[csc_name][topic]
+            names = [
+                name if length is None else f"{name}{i}"
+                for name, length in fields
+                for i in range(1 if length is None else length)
+            ]
+        except KeyError:
+            rate = self.rate
+            names = [f"value{c}" for c in range(self.columns)]
+
+        # integer nanoseconds, so timestamps are exact multiples of the period
+        period = round(1_000_000_000 / rate)
+        first = -(-round(start.unix * 1e6) * 1000 // period)
+        last = round(end.unix * 1e6) * 1000 // period
+        nanoseconds = np.arange(first, last + 1, dtype=np.int64) * period
+        index = pd.to_datetime(nanoseconds, unit="ns", utc=True)
+        stamps = nanoseconds / 1e9
+        data = {name: np.sin(stamps + c) for c, name in enumerate(names)}
+        data["private_sndStamp"] = stamps
+        return pd.DataFrame(data, index=index)
+
+    async def select_time_series(
+        self, topic_name: str, fields: str | list[str], start: Time, end: Time, **kwargs: object
+    ) -> pd.DataFrame:
+        """Returns recorded or synthetic data. Mimics
+        EfdClient.select_time_series.
+
+        Parameters
+        ----------
+        topic_name : `str`
+            Full topic name (lsst.sal.CSC.topic).
+        fields : `str | [str]`
+            Fields to retrieve. Unused, all columns are returned.
+        start : `Time`
+            Interval start.
+        end : `Time`
+            Interval end.
+
+        Returns
+        -------
+        data : `pd.DataFrame`
+            Data indexed by UTC timestamps. Includes private_sndStamp column.
+
+        Raises
+        ------
+        ConnectionError
+            For the first failures queries.
+        """
+        self.queries += 1
+        self._parallel += 1
+        self.max_parallel = max(self.max_parallel, self._parallel)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.failures > 0:
+                self.failures -= 1
+                raise ConnectionError("Simulated EFD failure")
+
+            if topic_name in self.recorded:
+                recorded = self.recorded[topic_name]
+                s = pd.Timestamp(start.utc.isot, tz="UTC")
+                e = pd.Timestamp(end.utc.isot, tz="UTC")
+                data = recorded.loc[(recorded.index >= s) & (recorded.index <= e)]
+            else:
+                data = self.generate(topic_name, start, end)
+
+            size = int(data.memory_usage(index=True).sum())
+            self.transferred += size
+            if self.bandwidth is not None:
+                await asyncio.sleep(size / self.bandwidth)
+            return data
+        finally:
+            self._parallel -= 1
@@ -24,11 +24,13 @@ __all__ = ["Player"]
 import asyncio
 import logging
 import time
+import typing
 
 from astropy.time import Time, TimeDelta
 from PySide6.QtCore import QObject, Signal
 
 from .efd_cache import EfdCache, EfdCacheRequest, EfdTopicCache
+from .efd_topic_cache import time_ns
 from .meta_sal import MetaSAL
 
 
@@ -37,6 +39,15 @@ class Player(QObject):
     Queries EFD for telemetry and events, build up a cache and replay the
     events.
 
+    Data needed for the replayed timepoint are loaded before the cache
+    content is emitted. Windows ahead of the timepoint, in the playback
+    direction, are prefetched in the background, so playback doesn't stall on
+    the cache boundaries. Window length is predicted from the playback speed,
+    and is at most the cache max_span. Only windows adjoining the topic cache
+    are prefetched, so prefetch never drops the replayed data. Replay steps
+    longer than the prefetch horizon are seeks, and don't count into the
+    playback speed. Topics are emitted as soon as their data are available.
+
     Signals
     -------
     downloadStarted
@@ -49,6 +60,9 @@ class Player(QObject):
         Emmited when request processign is terminated (stopped).
     requestFinished(request, worker)
         Emmited when request processing is finished.
+    stalled(stalls)
+        Emmited when replay had to wait for data. Carries number of stalls
+        since the player creation.
 
     Parameters
     ----------
@@ -56,6 +70,28 @@ class Player(QObject):
         SAL objects to replay. The topics in this fields are used to query EFD.
     num_tasks: `int`, optional
         Number of allowed parallel tasks. Defaults to 10.
+    cache_dir : `str`, optional
+        Directory for persistent EFD data cache. Defaults to None - data are
+        always retrieved from the EFD.
+    prefetch_windows : `int`, optional
+        Number of windows kept loaded ahead of the replayed timepoint.
+        Defaults to 2.
+    lead_time : `float`, optional
+        Expected time (seconds) to load a window. Prefetched window is at
+        least as long as the replay advances in lead_time. Defaults to 10.
+    efd_client : `EfdClient`, optional
+        EFD client passed to EfdCache. Defaults to None - EfdClient is
+        created for the replayed EFD.
+    memory_budget : `int`, optional
+        Maximal memory (bytes) used by cached data, passed to EfdCache.
+        Defaults to 1 GiB.
+
+    Attributes
+    ----------
+    stalls : `int`
+        Number of replay calls which waited for data.
+    prefetched : `int`
+        Number of finished prefetch requests.
     """
 
     downloadStarted = Signal()
@@ -65,16 +101,46 @@ class Player(QObject):
     requestTerminated = Signal(EfdCacheRequest, int)
     requestFinished = Signal(EfdCacheRequest, int)
 
-    def __init__(self, sal: MetaSAL, num_tasks: int = 10):
+    stalled = Signal(int)
+
+    def __init__(
+        self,
+        sal: MetaSAL,
+        num_tasks: int = 10,
+        cache_dir: str | None = None,
+        prefetch_windows: int = 2,
+        lead_time: float = 10,
+        efd_client: typing.Any = None,
+        memory_budget: int | None = 1024**3,
+    ):
         super().__init__()
 
         self.downloads = 0
         self.num_tasks = num_tasks
         self.sal = sal
+        self.cache_dir = cache_dir
+        self.prefetch_windows = prefetch_windows
+        self.lead_time = lead_time
+        self.efd_client = efd_client
+        self.memory_budget = memory_budget
 
         self.cache: EfdCache | None = None
 
-        self.worker_queue: asyncio.Queue[tuple[EfdCacheRequest, Time]] = asyncio.Queue()
+        self.stalls = 0
+        self.prefetched = 0
+
+        # replayed timepoint, used by workers to emit fresh data
+        self._timepoint_ns: int | None = None
+        # last replay timepoint and wall time, to predict playback speed
+        self._last_replay: tuple[Time, float] | None = None
+        self._direction = 1
+        self._speed = 0.0
+        # how far (seconds) ahead of the timepoint the last prefetch reached
+        self._horizon = 0.0
+        # topics with running prefetch requests
+        self._prefetching: dict[str, tuple[EfdCacheRequest, asyncio.Future]] = {}
+
+        self.worker_queue: asyncio.Queue[tuple[EfdCacheRequest, asyncio.Future]] = asyncio.Queue()
         self.create_workers()
 
     async def worker(self, number: int) -> None:
@@ -87,18 +153,21 @@ class Player(QObject):
             Worker internal number.
         """
         while True:
-            request, timepoint = await self.worker_queue.get()
+            request, done = await self.worker_queue.get()
             try:
                 assert self.cache is not None
 
                 self.requestStarted.emit(request, number)
 
                 await self.cache.load(request)
-                request.cache.set_current_time(timepoint)
-                self.send_cache(request.topic, request.cache)
+                if self._timepoint_ns is not None:
+                    request.cache.set_current_ns(self._timepoint_ns)
+                    # signals are named without logevent_ prefix
+                    self.send_cache(request.topic[9:] if request.is_event() else request.topic, request.cache)
                 self.requestFinished.emit(request, number)
             except asyncio.CancelledError:
                 self.requestTerminated.emit(request, number)
+                raise
             except Exception as ex:
                 logging.warning(
                     "While loading %s (%s to %s): %s.",
@@ -109,10 +178,13 @@ class Player(QObject):
                 )
                 self.requestTerminated.emit(request, number)
             finally:
-                if request.topic == "logevent_ilcWarning":
-                    print("ILC warning fin")
-
-                self.downloads += 1
+                if self._prefetching.get(request.topic, (None, None))[1] is done:
+                    del self._prefetching[request.topic]
+                    self.prefetched += 1
+                else:
+                    self.downloads += 1
+                if not done.done():
+                    done.set_result(None)
                 self.worker_queue.task_done()
 
     def create_workers(self) -> None:
@@ -141,6 +213,65 @@ class Player(QObject):
         if send is not None and send._changed:
             getattr(self.sal, topic).emit(send)
 
+    def predict(self, timepoint: Time, duration: TimeDelta, max_span: TimeDelta) -> list[Time]:
+        """
+        Predicts timepoints of the upcoming windows. Playback direction and
+        speed are estimated from the previous replay calls. Steps longer than
+        the prefetch horizon are seeks, which reset the speed.
+
+        Parameters
+        ----------
+        timepoint : `Time`
+            Replayed timepoint.
+        duration : `TimeDelta`
+            Minimal window length.
+        max_span : `TimeDelta`
+            Maximal window length.
+
+        Returns
+        -------
+        timepoints : `[Time]`
+            Timepoints which shall be loaded in the cache, ordered by the
+            expected replay.
+        """
+        now = time.monotonic()
+        if self._last_replay is not None:
+            last_timepoint, last_time = self._last_replay
+            step = (timepoint - last_timepoint).sec
+            if abs(step) > self._horizon:
+                self._speed = 0.0
+            elif step != 0:
+                self._direction = 1 if step > 0 else -1
+                if now > last_time:
+                    self._speed = abs(step) / (now - last_time)
+        self._last_replay = (timepoint, now)
+
+        window = TimeDelta(min(max(duration.sec, self._speed * self.lead_time), max_span.sec), format="sec")
+        self._horizon = window.sec * self.prefetch_windows
+        return [timepoint + self._direction * window * w for w in range(1, self.prefetch_windows + 1)]
+
+    def prefetch(self, timepoint: Time, duration: TimeDelta) -> None:
+        """
+        Queues requests for the predicted windows. Topics with running
+        prefetch and requests not adjoining the topic cache are skipped.
+
+        Parameters
+        ----------
+        timepoint : `Time`
+            Replayed timepoint.
+        duration : `TimeDelta`
+            Minimal window length.
+        """
+        assert self.cache is not None
+
+        for predicted in self.predict(timepoint, duration, self.cache.max_span):
+            for request in self.cache.new_requests(predicted, duration):
+                if request.topic in self._prefetching or not request.adjoins():
+                    continue
+                done = asyncio.get_running_loop().create_future()
+                self._prefetching[request.topic] = (request, done)
+                self.worker_queue.put_nowait((request, done))
+
     async def replay(self, efd: str, timepoint: Time, duration: TimeDelta) -> None:
         """
         Load data into cache. Starts multiple tasks to load data to speed up
@@ -159,7 +290,13 @@ class Player(QObject):
         """
 
         async def create_efd_cache(efd: str) -> None:
-            self.cache = EfdCache(self.sal, efd)
+            self.cache = EfdCache(
+                self.sal,
+                efd,
+                cache_dir=self.cache_dir,
+                efd_client=self.efd_client,
+                memory_budget=self.memory_budget,
+            )
 
         if self.cache is None or self.cache.efd != efd:
             logging.info("Initializing the EFD connection client to %s.", efd)
@@ -171,51 +308,73 @@ class Player(QObject):
 
         start_time = time.monotonic()
         self.downloads = 0
+        self._timepoint_ns = time_ns(timepoint)
 
-        reported_ranges: list[tuple[Time, Time]] = []
+        # First, the cached topics must be updated to contain actual new data.
+        # Topics with data covering the timepoint are emitted, other topics
+        # are emitted by workers as soon as loaded.
+        self.cache.set_current_ns(self._timepoint_ns, self._direction, duration)
 
-        for request in self.cache.new_requests(timepoint, duration):
-            await self.worker_queue.put((request, timepoint))
-            if self.downloads == 0:
-                self.downloadStarted.emit()
-            if (request.start, request.end) not in reported_ranges:
-                logging.info("Loading %s - %s.", request.start.isot, request.end.isot)
-                reported_ranges.append((request.start, request.end))
+        for topics in (self.cache.telemetry, self.cache.events):
+            for topic, cache in topics.items():
+                if cache.covers(self._timepoint_ns):
+                    self.send_cache(topic, cache)
 
-        await self.worker_queue.join()
+        reported_ranges: list[tuple[Time, Time]] = []
+        download_started = False
+
+        # the first pass waits for running prefetch covering the timepoint,
+        # which might not load all needed data - the second pass loads the
+        # remaining data
+        for attempt in range(2):
+            pending: list[asyncio.Future] = []
+            for request in self.cache.new_requests(timepoint, duration):
+                prefetch = self._prefetching.get(request.topic)
+                if prefetch is not None and prefetch[0].start <= timepoint <= prefetch[0].end:
+                    pending.append(prefetch[1])
+                    continue
+
+                done = asyncio.get_running_loop().create_future()
+                await self.worker_queue.put((request, done))
+                pending.append(done)
+                if not download_started:
+                    download_started = True
+                    self.downloadStarted.emit()
+                if (request.start, request.end) not in reported_ranges:
+                    logging.info("Loading %s - %s.", request.start.isot, request.end.isot)
+                    reported_ranges.append((request.start, request.end))
+
+            if len(pending) == 0:
+                break
+
+            if attempt == 0:
+                self.stalls += 1
+                self.stalled.emit(self.stalls)
+
+            await asyncio.gather(*pending)
 
         if self.downloads > 0:
-            duration = time.monotonic() - start_time
+            elapsed = time.monotonic() - start_time
             logging.info(
                 "Downloaded %d topics in %.2f seconds (%.2f topics/second).",
                 self.downloads,
-                duration,
-                self.downloads / duration,
+                elapsed,
+                self.downloads / elapsed,
             )
             self.downloadFinished.emit()
 
-        # First, the cached topics must be updated to contain actual new data.
-        for topic, cache in self.cache.telemetry.items():
-            cache.set_current_time(timepoint)
-
-        for topic, cache in self.cache.events.items():
-            cache.set_current_time(timepoint)
-
-        # When data are update, signals are distributed
-
-        for topic, cache in self.cache.telemetry.items():
-            self.send_cache(topic, cache)
-
-        for topic, cache in self.cache.events.items():
-            self.send_cache(topic, cache)
+        self.prefetch(timepoint, duration)
 
     def stop(self) -> None:
         """
         Stops all requests.
         """
         while not self.worker_queue.empty():
-            self.worker_queue.get_nowait()
+            _, done = self.worker_queue.get_nowait()
+            if not done.done():
+                done.set_result(None)
             self.worker_queue.task_done()
+        self._prefetching.clear()
 
         for worker in self.workers:
             worker.cancel("Requested to stop download.")
@@ -0,0 +1,245 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["BenchmarkSAL", "ReplayResult", "benchmark_replay", "benchmark_memory"]
+
+import asyncio
+import time
+import tracemalloc
+import types
+import typing
+from dataclasses import dataclass
+
+from astropy.time import Time, TimeDelta
+
+from .player import Player
+
+
+class _BenchmarkTopic:
+    """Replayed topic. Counts emitted data."""
+
+    def __init__(self, sal: "BenchmarkSAL"):
+        self.sal = sal
+        self.emitted = 0
+
+    def emit(self, data: typing.Any) -> None:
+        self.emitted += 1
+        self.sal.emitted += 1
+        if self.sal.first_emit is None:
+            self.sal.first_emit = time.monotonic()
+
+
+class BenchmarkSAL:
+    """
+    Replay target. Provides the parts of MetaSAL interface used by Player, so
+    replay can be measured without SAL.
+
+    Parameters
+    ----------
+    csc_name : `str`
+        Replayed CSC name.
+    telemetry : `[str]`
+        Replayed telemetry topics.
+    events : `[str]`
+        Replayed events, without logevent_ prefix.
+
+    Attributes
+    ----------
+    emitted : `int`
+        Number of emitted topics data.
+    first_emit : `float | None`
+        Monotonic time of the first emit, None before anything is emitted.
+    """
+
+    def __init__(self, csc_name: str, telemetry: list[str], events: list[str]):
+        self.remote = types.SimpleNamespace(salinfo=types.SimpleNamespace(name=csc_name))
+        self._telemetry = telemetry
+        self._events = events
+        self.emitted = 0
+        self.first_emit: float | None = None
+
+        for topic in telemetry + events:
+            setattr(self, topic, _BenchmarkTopic(self))
+
+    def telemetry(self) -> list[str]:
+        return self._telemetry
+
+    def events(self) -> list[str]:
+        return self._events
+
+
+@dataclass
+class ReplayResult:
+    """Replay benchmark results."""
+
+    topics: int
+    """Number of replayed topics."""
+    time_to_first_frame: float
+    """Time (seconds) from the first replay call to the first emitted data."""
+    first_frame: float
+    """Duration (seconds) of the first replay call, until all topics were
+    loaded."""
+    frames: int
+    """Number of replayed frames after the first frame."""
+    fps: float
+    """Steady state frames per second, measured after the first frame."""
+    stalls: int
+    """Number of replay calls which had to wait for data."""
+    emitted: int
+    """Number of emitted topics data."""
+    queries: int
+    """Number of EFD queries."""
+    memory: int
+    """Memory (bytes) allocated during the benchmark and still in use. Zero
+    unless trace_memory was requested."""
+
+    def __str__(self) -> str:
+        return (
+            f"{self.topics} topics: first frame {self.time_to_first_frame:.3f} s"
+            f" (loaded in {self.first_frame:.3f} s), {self.frames} frames at {self.fps:.1f} FPS,"
+            f" {self.stalls} stalls, {self.emitted} emits, {self.queries} queries,"
+            f" {self.memory / 1024**2:.1f} MiB"
+        )
+
+
+async def _stop(player: Player) -> None:
+    for worker in player.workers:
+        worker.cancel()
+    await asyncio.gather(*player.workers, return_exceptions=True)
+
+
+async def benchmark_replay(
+    csc_name: str,
+    topics: list[str],
+    efd_client: typing.Any,
+    start: Time,
+    frames: int = 200,
+    step: float = 0.1,
+    duration: float = 60,
+    num_tasks: int = 10,
+    trace_memory: bool = False,
+) -> ReplayResult:
+    """Measures replay of the topics. Replays frames frames, advancing step
+    seconds per frame, as fast as possible.
+
+    Parameters
+    ----------
+    csc_name : `str`
+        Replayed CSC.
+    topics : `[str]`
+        Replayed topics, as named in the EFD - events with logevent_ prefix.
+    efd_client : `EfdClient`
+        EFD client, usually MockEfdClient.
+    start : `Time`
+        Replay start.
+    frames : `int`, optional
+        Number of replayed frames after the first frame. Defaults to 200.
+    step : `float`, optional
+        Replay step (seconds of data). Defaults to 0.1.
+    duration : `float`, optional
+        Loaded window duration (seconds). Defaults to 60.
+    num_tasks : `int`, optional
+        Number of player tasks. Defaults to 10.
+    trace_memory : `bool`, optional
+        Measure memory allocated during the benchmark. Slows the benchmark
+        down. Defaults to False.
+
+    Returns
+    -------
+    result : `ReplayResult`
+        Benchmark results.
+    """
+    telemetry = [t for t in topics if not t.startswith("logevent_")]
+    events = [t[9:] for t in topics if t.startswith("logevent_")]
+
+    if trace_memory:
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+
+    sal = BenchmarkSAL(csc_name, telemetry, events)
+    queries = getattr(efd_client, "queries", 0)
+    player = Player(sal, num_tasks=num_tasks, efd_client=efd_client)  # type: ignore[arg-type]
+    window = TimeDelta(duration, format="sec")
+    try:
+        first_start = time.monotonic()
+        await player.replay("benchmark", start, window)
+        first_frame = time.monotonic() - first_start
+        first_emit = first_frame if sal.first_emit is None else sal.first_emit - first_start
+
+        stalls = player.stalls
+        steady_start = time.monotonic()
+        for frame in range(1, frames + 1):
+            await player.replay("benchmark", start + TimeDelta(frame * step, format="sec"), window)
+        elapsed = time.monotonic() - steady_start
+
+        memory = 0
+        if trace_memory:
+            memory = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        await _stop(player)
+        if trace_memory:
+            tracemalloc.stop()
+
+    return ReplayResult(
+        topics=len(topics),
+        time_to_first_frame=first_emit,
+        first_frame=first_frame,
+        frames=frames,
+        fps=frames / elapsed if elapsed > 0 else 0,
+        stalls=player.stalls - stalls,
+        emitted=sal.emitted,
+        queries=getattr(efd_client, "queries", 0) - queries,
+        memory=memory,
+    )
+
+
+async def benchmark_memory(
+    csc_name: str,
+    topics: list[str],
+    client_factory: typing.Callable[[], typing.Any],
+    start: Time,
+    **kwargs: typing.Any,
+) -> list[ReplayResult]:
+    """Measures memory growth per replayed topic count. Replays the first
+    topic, the first two topics, .. up to all topics.
+
+    Parameters
+    ----------
+    csc_name : `str`
+        Replayed CSC.
+    topics : `[str]`
+        Replayed topics.
+    client_factory : `typing.Callable[[], EfdClient]`
+        Creates EFD client for a benchmark run.
+    start : `Time`
+        Replay start.
+    **kwargs : `dict`
+        Passed to benchmark_replay.
+
+    Returns
+    -------
+    results : `[ReplayResult]`
+        Results for increasing topic count.
+    """
+    return [
+        await benchmark_replay(csc_name, topics[:count], client_factory(), start, trace_memory=True, **kwargs)
+        for count in range(1, len(topics) + 1)
+    ]
@@ -0,0 +1,117 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["SignalCoalescer"]
+
+import functools
+import typing
+
+from PySide6.QtCore import QObject, QTimer, Signal, SignalInstance, Slot
+
+
+class _CoalescedTopic(QObject):
+    """Holds signal emitted with coalesced topic data."""
+
+    data = Signal(map)
+
+
+class SignalCoalescer(QObject):
+    """
+    Re-emits topic signals at a limited rate. Only the latest data received
+    since the last emit are emitted, older data are dropped. Suitable for
+    displays which show only the current value, as those don't need to be
+    updated faster than the screen refresh. All topics are emitted from a
+    single timer, running only when new data are pending.
+
+    Topics are coalesced on request - signal method connects the original
+    (lossless) signal. The original signals stay available for consumers
+    which need every sample.
+
+    Parameters
+    ----------
+    sal : `MetaSAL`
+        SAL object providing topic signals.
+    rate : `float`, optional
+        Maximal emit rate (Hz). Defaults to 20.
+    """
+
+    def __init__(self, sal: typing.Any, rate: float = 20):
+        super().__init__()
+        self.sal = sal
+
+        self._topics: dict[str, _CoalescedTopic] = {}
+        self._pending: dict[str, typing.Any] = {}
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float) -> None:
+        """Sets maximal emit rate.
+
+        Parameters
+        ----------
+        rate : `float`
+            Maximal emit rate (Hz).
+        """
+        self.rate = rate
+        self._timer.setInterval(max(1, round(1000 / rate)))
+
+    def signal(self, topic: str) -> SignalInstance:
+        """Returns coalesced signal of the topic.
+
+        Parameters
+        ----------
+        topic : `str`
+            Topic name, as SAL signal (without tel_ or evt_ prefix).
+
+        Returns
+        -------
+        signal : `SignalInstance`
+            Signal emitted with the latest topic data, at most rate times per
+            second.
+
+        Raises
+        ------
+        AttributeError
+            When topic isn't provided by SAL.
+        """
+        if topic not in self._topics:
+            getattr(self.sal, topic).connect(functools.partial(self._store, topic))
+            self._topics[topic] = _CoalescedTopic()
+        return self._topics[topic].data
+
+    def _store(self, topic: str, data: typing.Any) -> None:
+        self._pending[topic] = data
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        """Emits pending data. Stops the timer if nothing is pending."""
+        if len(self._pending) == 0:
+            self._timer.stop()
+            return
+
+        pending = self._pending
+        self._pending = {}
+        for topic, data in pending.items():
+            self._topics[topic].data.emit(data)
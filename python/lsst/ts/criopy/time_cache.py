@@ -21,11 +21,25 @@
 
 __all__ = ["TimeCache"]
 
+import ast
+import os
 import typing
 
 import h5py
 import numpy as np
 
+HEADER_MAGIC = b"TCACHE01"
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("size", "<i8"),
+        ("current_index", "<i8"),
+        ("filled", "<i8"),
+        ("descr", "S4064"),
+    ]
+)
+"""Memory mapped file header. Occupies first page of the file, data follow."""
+
 
 class TimeCache:
     """Cache for large float data. Holds rolling time window of records. Act as
@@ -50,12 +64,131 @@ class TimeCache:
         Cache size.
     items : [(`str`,`str`)]
         Items stored in the cache.
+    filename : `str`, optional
+        If provided, cache data are stored in memory mapped file. The file
+        header persists current_index and filled, so cache content survives
+        process restart and can be read by other processes (see
+        open_readonly). If the file exists and holds the same items, its
+        content is reused (and resized if needed). Defaults to None - data
+        are kept in process memory.
+
+    Raises
+    ------
+    ValueError
+        When existing file doesn't match items.
     """
 
-    def __init__(self, size: int, items: list[tuple[str, str]]):
+    def __init__(self, size: int, items: list[tuple[str, str]], filename: str | None = None):
         self._size = size
-        self.data = np.zeros((self._size), items, order="F")
-        self.clear()
+        self._filename = filename
+        self._header: np.memmap | None = None
+        self._current_index = 0
+        self._filled = False
+
+        if filename is None:
+            self.data = np.zeros((self._size), items, order="F")
+            self.clear()
+            return
+
+        dtype = np.dtype(items)
+        if os.path.exists(filename) and os.path.getsize(filename) > 0:
+            self._map(filename, "r+")
+            if self.data.dtype != dtype:
+                raise ValueError(
+                    f"Memory mapped cache {filename} holds {self.data.dtype} rows,"
+                    f" but {dtype} were requested."
+                )
+            current_index, filled = self.current_index, self.filled
+            self.clear()
+            self.current_index, self.filled = current_index, filled
+            if self._size != size:
+                self.resize(size)
+        else:
+            self._create_map(filename, size, dtype)
+            self.clear()
+
+    @staticmethod
+    def open_readonly(filename: str) -> "TimeCache":
+        """Open memory mapped cache read only. Current index and filled status
+        are read from the file header, so changes made by the process writing
+        the cache are immediately visible. The writer shall not resize the
+        cache while the file is opened.
+
+        Parameters
+        ----------
+        filename : `str`
+            Memory mapped cache file, created by constructor with filename
+            parameter.
+
+        Returns
+        -------
+        cache : `TimeCache`
+            Read only cache.
+
+        Raises
+        ------
+        ValueError
+            When file isn't valid cache file.
+        """
+        cache = TimeCache.__new__(TimeCache)
+        cache._filename = filename
+        cache._current_index = 0
+        cache._filled = False
+        cache._map(filename, "r")
+        return cache
+
+    def _create_map(self, filename: str, size: int, dtype: np.dtype) -> None:
+        with open(filename, "wb"):
+            pass
+        self._header = np.memmap(filename, HEADER_DTYPE, "r+", shape=(1,))
+        self._header["magic"] = HEADER_MAGIC
+        self._header["size"] = size
+        self._header["descr"] = repr(np.lib.format.dtype_to_descr(dtype)).encode()
+        self.data = np.memmap(filename, dtype, "r+", offset=HEADER_DTYPE.itemsize, shape=(size,))
+        self._size = size
+
+    def _map(self, filename: str, mode: typing.Literal["r", "r+"]) -> None:
+        header = np.memmap(filename, HEADER_DTYPE, mode, shape=(1,))
+        if header["magic"][0] != HEADER_MAGIC:
+            raise ValueError(f"{filename} isn't memory mapped TimeCache file.")
+        dtype = np.lib.format.descr_to_dtype(ast.literal_eval(header["descr"][0].decode()))
+        self._size = int(header["size"][0])
+        self.data = np.memmap(filename, dtype, mode, offset=HEADER_DTYPE.itemsize, shape=(self._size,))
+        self._header = header
+
+    @property
+    def current_index(self) -> int:
+        if self._header is None:
+            return self._current_index
+        return int(self._header["current_index"][0])
+
+    @current_index.setter
+    def current_index(self, index: int) -> None:
+        if self._header is None:
+            self._current_index = index
+        else:
+            self._header["current_index"] = index
+
+    @property
+    def filled(self) -> bool:
+        if self._header is None:
+            return self._filled
+        return bool(self._header["filled"][0])
+
+    @filled.setter
+    def filled(self, filled: bool) -> None:
+        if self._header is None:
+            self._filled = filled
+        else:
+            self._header["filled"] = filled
+
+    def flush(self) -> None:
+        """Flush memory mapped data to disk. Does nothing if the cache isn't
+        memory mapped."""
+        if self._header is not None:
+            assert isinstance(self.data, np.memmap)
+            self.data.flush()
+            self._header.flush()
 
     def clear(self) -> None:
         """Clear cache."""
@@ -72,21 +205,23 @@ class TimeCache:
             New size.
         """
         clength = len(self)
-        if size == clength:
+        if size == self._size:
             return
-        newdata = np.zeros(size, self.data.dtype)
-        n_current = r = min(clength, size)
-        for s in self.rows_reverse():
-            r -= 1
-            newdata[r] = s
-            if r == 0:
-                break
+        n_current = min(clength, size)
+        rows = self.rows()[clength - n_current :].copy()
+        if self._filename is None:
+            self.data = np.zeros(size, self.data.dtype)
+            self._size = size
+        else:
+            dtype = self.data.dtype
+            del self.data
+            self._header = None
+            self._create_map(self._filename, size, dtype)
+
+        self.data[:n_current] = rows
         self.filled = (n_current == size) and (clength > 0)
         self.current_index = n_current
 
-        self.data = newdata
-        self._size = size
-
     def append(self, data: tuple[float, ...]) -> None:
         """Append new row to end of data.
 
@@ -101,6 +236,117 @@ class TimeCache:
         self.data[self.current_index] = data
         self.current_index += 1
 
+    def append_block(self, block: np.ndarray | dict[str, typing.Any]) -> None:
+        """Append block of rows to end of data. The block is copied into the
+        underlying array with at most two slice assignments. If block is
+        larger than the cache size, only the most recent rows are kept.
+
+        Parameters
+        ----------
+        block : `numpy.ndarray` or `{str: numpy.ndarray}`
+            Block of rows. Either structured array with the same fields as the
+            cache, or dictionary with column names as keys and arrays of the
+            same length as values.
+
+        Raises
+        ------
+        KeyError
+            When a cache column is missing in the dictionary.
+        ValueError
+            When block columns have different lengths, or a cache column is
+            missing in the structured array.
+        """
+        if isinstance(block, np.ndarray):
+            columns = {n: block[n] for n in self.data.dtype.names}
+        else:
+            columns = {n: np.asarray(block[n]) for n in self.data.dtype.names}
+
+        lengths = set(len(c) for c in columns.values())
+        if len(lengths) != 1:
+            raise ValueError(f"Block columns have different lengths: {lengths}.")
+        rows = lengths.pop()
+        if rows == 0:
+            return
+
+        def copy(start: int, end: int, src_start: int, src_end: int) -> None:
+            for n, c in columns.items():
+                self.data[n][start:end] = c[src_start:src_end]
+
+        start = self.current_index if self.current_index < self._size else 0
+        wraps = self.current_index + rows > self._size
+
+        if rows >= self._size:
+            # only the most recent _size rows survive; the first one of those
+            # lands where sequential appends would put it
+            start = (self.current_index + rows - self._size) % self._size
+            src = rows - self._size
+            copy(start, self._size, src, src + self._size - start)
+            copy(0, start, src + self._size - start, rows)
+            self.current_index = start if start > 0 else self._size
+        else:
+            first = min(rows, self._size - start)
+            copy(start, start + first, 0, first)
+            if first < rows:
+                copy(0, rows - first, first, rows)
+                self.current_index = rows - first
+            else:
+                self.current_index = start + first
+
+        if wraps:
+            self.filled = True
+
+    def column(self, key: str) -> np.ndarray:
+        """Returns column values ordered from the oldest to the newest.
+
+        Parameters
+        ----------
+        key : `str`
+            Column name.
+
+        Returns
+        -------
+        column : `numpy.ndarray`
+            View into the cache array. If the cache rolled over, contiguous
+            copy of the column data is returned. The view shall not be
+            modified, and is valid only until the next cache modification.
+        """
+        return self._ordered(self.data[key])
+
+    def rows(self) -> np.ndarray:
+        """Returns all rows ordered from the oldest to the newest.
+
+        Returns
+        -------
+        rows : `numpy.ndarray`
+            Structured array, view into the cache array or contiguous copy if
+            the cache rolled over. See column() for details.
+        """
+        return self._ordered(self.data)
+
+    def snapshot(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Returns copy of columns values ordered from the oldest to the
+        newest. Unlike column(), the copy isn't modified by later cache
+        updates, so it can be passed to another thread.
+
+        Parameters
+        ----------
+        keys : `[str]`
+            Columns names.
+
+        Returns
+        -------
+        snapshot : `{str: numpy.ndarray}`
+            Copies of the columns values, keys are column names.
+        """
+        return {key: np.array(self.column(key)) for key in keys}
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        if self.filled:
+            if self.current_index >= self._size:
+                return array
+            return np.concatenate((array[self.current_index :], array[: self.current_index]))
+        return array[: self.current_index]
+
     def start_time(self) -> float:
         """Return timestamp of the last data point.
 
@@ -242,26 +488,13 @@ class TimeCache:
         if size is None:
             size = len(self)
 
-        new_data = np.array(self.data)
-
-        remaining = len(self) - size
+        np.savetxt(filename, self.pop_rows(size), **kwargs)
 
-        for n in self.data.dtype.names:
-            new_data[n][:remaining] = self[n][size:]
-
-        if self.filled:
-            data = list(self.data[self.current_index + 1 :]) + list(self.data[: self.current_index])
-        else:
-            data = list(self.data)
-
-        self.filled = False
-        self.data = new_data
-        self.current_index = remaining
-
-        np.savetxt(filename, data[:size], **kwargs)
-
-    def create_hdf5_datasets(self, size: int, group: h5py.Group, **group_args: typing.Any) -> None:
-        """Creates HDF5 datasets.
+    def create_hdf5_datasets(
+        self, size: int, group: h5py.Group, **group_args: typing.Any
+    ) -> dict[str, h5py.Dataset]:
+        """Creates HDF5 datasets. Datasets are created empty, and are resized
+        as data are saved, up to size records.
 
         Parameters
         ----------
@@ -273,13 +506,21 @@ class TimeCache:
             Keyword arguments passed to create_group call. It is recommended to
             pass at least chunks=True. Please See h5py.Group.create_dataset for
             details.
+
+        Returns
+        -------
+        datasets : `{str: h5py.Dataset}`
+            Created datasets, keys are column names.
         """
         self._hdf5_datasets = {}
 
         for n in self.data.dtype.names:
-            self._hdf5_datasets[n] = group.create_dataset(n, (size), self.data.dtype.base[n], **group_args)
+            self._hdf5_datasets[n] = group.create_dataset(
+                n, (0,), self.data.dtype.base[n], maxshape=(size,), **group_args
+            )
         self.hdf5_index = 0
         self._hdf5_size = size
+        return self._hdf5_datasets
 
     def h5_filled(self) -> bool:
         """Returns True if HDF5 file is filled."""
@@ -293,23 +534,86 @@ class TimeCache:
         size : `int`
             Size of data to store.
         """
-        new_data = np.array(self.data)
-        if self.hdf5_index + size > self._hdf5_size:
-            size = self._hdf5_size - self.hdf5_index
+        self.write_hdf5_block(*self.pop_hdf5_block(size))
 
-        remaining = len(self) - size
+    def pop_hdf5_block(self, size: int) -> tuple[dict[str, h5py.Dataset], int, np.ndarray]:
+        """Remove oldest rows, reserving space for them in HDF5 datasets
+        created with create_hdf5_datasets. Rows shall be written with
+        write_hdf5_block. This split allows rows to be written outside of
+        thread filling the cache.
 
-        for n in self.data.dtype.names:
-            d = self[n]
-            self._hdf5_datasets[n][self.hdf5_index : self.hdf5_index + size] = d[:size]
-            new_data[n][:remaining] = d[size:]
+        Parameters
+        ----------
+        size : `int`
+            Size of data to store.
 
-        self.filled = False
-        self.data = new_data
-        self.current_index = remaining
+        Returns
+        -------
+        datasets : `{str: h5py.Dataset}`
+            HDF5 datasets, keys are column names.
+        index : `int`
+            Index of the first row in datasets.
+        rows : `numpy.ndarray`
+            Structured array with removed rows.
+        """
+        size = min(size, len(self), self._hdf5_size - self.hdf5_index)
 
+        rows = self.pop_rows(size)
+
+        index = self.hdf5_index
         self.hdf5_index += size
 
+        return (self._hdf5_datasets, index, rows)
+
+    @staticmethod
+    def write_hdf5_block(datasets: dict[str, h5py.Dataset], index: int, rows: np.ndarray) -> None:
+        """Write rows to HDF5 datasets, growing them as needed.
+
+        Parameters
+        ----------
+        datasets : `{str: h5py.Dataset}`
+            HDF5 datasets, keys are column names.
+        index : `int`
+            Index of the first row in datasets.
+        rows : `numpy.ndarray`
+            Structured array with rows to write.
+        """
+        end = index + len(rows)
+        for n, dataset in datasets.items():
+            if dataset.shape[0] < end:
+                dataset.resize((end,))
+            dataset[index:end] = rows[n]
+
+    def pop_rows(self, size: int) -> np.ndarray:
+        """Remove and return the oldest rows.
+
+        Parameters
+        ----------
+        size : `int`
+            Number of rows to remove.
+
+        Returns
+        -------
+        rows : `numpy.ndarray`
+            Structured array with removed rows.
+        """
+        rows = self.rows()[:size].copy()
+        self._forget(size)
+        return rows
+
+    def _forget(self, size: int) -> None:
+        """Remove oldest rows. Remaining rows are moved to the array start.
+
+        Parameters
+        ----------
+        size : `int`
+            Number of rows to remove.
+        """
+        remaining = self.rows()[size:].copy()
+        self.data[: len(remaining)] = remaining
+        self.filled = False
+        self.current_index = len(remaining)
+
     def columns(self) -> list[str]:
         """Returns column names.
 
@@ -321,10 +625,7 @@ class TimeCache:
         return self.data.dtype.names
 
     def __getitem__(self, key: str) -> list[float]:
-        if self.filled:
-            return list(self.data[self.current_index :][key]) + list(self.data[: self.current_index][key])
-        else:
-            return list(self.data[: self.current_index][key])
+        return self.column(key).tolist()
 
     def __len__(self) -> int:
         return self._size if self.filled else self.current_index
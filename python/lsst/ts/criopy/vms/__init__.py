@@ -7,7 +7,10 @@ from .collector import VMS_DEVICES, Collector
 from .csc_psd_widget import CSCPSDWidget
 from .displacement_widget import DisplacementWidget
 from .miscellaneous_widget import MiscellaneousWidget
+from .output import HDF5Output, Output, ParquetOutput, ZarrOutput, output_class
+from .output_writer import OutputWriter
 from .psd_widget import PSDWidget
 from .raw_acceleration_widget import RawAccelerationWidget
 from .time_box_chart import TimeBoxChart
 from .velocity_widget import VelocityWidget
+from .welch_psd import WelchPSD
@@ -129,11 +129,15 @@ class StatusBar(QStatusBar):
         super().__init__()
         self.sampleTimes = [None] * len(systems)
         self.cacheStatus = []
+        self.lostStatus = []
         for system in systems:
             self.addWidget(QLabel(system))
             label = QLabel("Size: 0 --- - ---")
             self.cacheStatus.append(label)
             self.addWidget(label)
+            lost = QLabel()
+            self.lostStatus.append(lost)
+            self.addWidget(lost)
 
     @Slot()
     def cacheUpdated(self, index: int, length: int, start: float, end: float) -> None:
@@ -159,3 +163,18 @@ class StatusBar(QStatusBar):
                 f" {datetime.fromtimestamp(end).strftime('%H:%M:%S.%f')}"
                 f" {end - start + self.sampleTimes[index] * u.ms.to(u.s):.03f}s"
             )
+
+    @Slot()
+    def chunksLost(self, index: int, dropped: int, late: int) -> None:
+        """Emitted when incomplete or late data chunks were dropped.
+
+        Parameters
+        ----------
+        index : `int`
+            VMS index (1 - M1M3, 2 - M2, 3 - CameraRotator)
+        dropped : `int`
+            Number of incomplete chunks dropped from receiving window.
+        late : `int`
+            Number of chunks arriving too late.
+        """
+        self.lostStatus[index].setText(f"<font color='red'>Dropped: {dropped} Late: {late}</font>")
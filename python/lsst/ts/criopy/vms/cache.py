@@ -21,6 +21,7 @@
 
 __all__ = ["Cache"]
 
+import heapq
 import typing
 
 import numpy as np
@@ -35,6 +36,15 @@ class Cache(TimeCache):
     dictionary, where keys are accelerometer number and axis
     (1X,1Y,1Z,..,<sensors>Z). [] and len operators are supported.
 
+    Attributes
+    ----------
+    dropped_chunks : `int`
+        Number of incomplete chunks removed from receiving window.
+    late_chunks : `int`
+        Number of sensor chunks arriving after data with newer timestamp were
+        added to the cache (or their timestamp was dropped). Such chunks are
+        ignored.
+
     Parameters
     ----------
     size : `int`
@@ -43,23 +53,33 @@ class Cache(TimeCache):
         Number of sensors.
     window : `int`, optional
         Receiving window size. Defaults to 3.
+    filename : `str`, optional
+        Memory mapped file backing the cache. See TimeCache for details.
+        Defaults to None - cache is kept in memory.
     """
 
-    def __init__(self, size: int, sensors: int, window: int = 3):
+    def __init__(self, size: int, sensors: int, window: int = 3, filename: str | None = None):
         self._sensors = sensors
         self._window = window
         self.interval: float = 1
         self.sampleTime: float = 1
+        self.dropped_chunks = 0
+        self.late_chunks = 0
+        self._all_received = (1 << sensors) - 1
         items = [("timestamp", "f8")] + [
             (f"{s} {a}", "f8") for s in range(1, self._sensors + 1) for a in ["X", "Y", "Z"]
         ]
 
-        super().__init__(size, items)
+        super().__init__(size, items, filename)
 
     def clear(self) -> None:
         """Clear cache."""
         super().clear()
-        self._receiving: list[tuple[float, list[typing.Any]]] = []
+        # timestamp -> [received sensors bitmask, sensors data]
+        self._receiving: dict[float, list[typing.Any]] = {}
+        # min-heap of timestamps in _receiving
+        self._pending: list[float] = []
+        self._last_timestamp: float | None = None
 
     def sensors(self) -> int:
         """Returns number of sensors stored in cache."""
@@ -92,59 +112,63 @@ class Cache(TimeCache):
             received with this chunk).
         chunk_removed : `bool`
             True if chunk was removed (indicating network problem, as sensor(s)
-            chunks were missing for too long)."""
-        added = False
-        found = False
-        for r in self._receiving:
-            if r[0] == data.timestamp:
-                r[1][data.sensor - 1] = data
-                found = True
-                break
-        if found is False:
-            self._receiving.append((data.timestamp, [None] * self._sensors))
-            self._receiving[-1][1][data.sensor - 1] = data
-            self._receiving.sort(key=lambda x: x[0])
-
-        # all data for given timestamp received
-        while len(self._receiving) > 0:
-            r = self._receiving[0]
-            if r[1].count(None) > 0:
-                break
-            dl = len(data.accelerationX)
-            timestamps = np.arange(r[0], r[0] + self.sampleTime * dl, self.sampleTime)
-
-            def copy_data(start: int, lenght: int) -> None:
-                self.data["timestamp"][self.current_index : self.current_index + lenght] = timestamps[
-                    start : start + lenght
-                ]
-                for s in range(1, self._sensors + 1):
-                    self.data[f"{s} X"][self.current_index : self.current_index + lenght] = r[1][
-                        s - 1
-                    ].accelerationX[start : start + lenght]
-                    self.data[f"{s} Y"][self.current_index : self.current_index + lenght] = r[1][
-                        s - 1
-                    ].accelerationY[start : start + lenght]
-                    self.data[f"{s} Z"][self.current_index : self.current_index + lenght] = r[1][
-                        s - 1
-                    ].accelerationZ[start : start + lenght]
-
-            lenght = min(dl, self._size - self.current_index)
-            if lenght > 0:
-                copy_data(0, lenght)
-                self.current_index += lenght
-                dl -= lenght
-
-            if dl > 0:
-                self.current_index = 0
-                self.filled = True
-                copy_data(lenght, dl)
-                self.current_index = dl
-
-            self._receiving.remove(r)
-            added = True
+            chunks were missing for too long). Late chunks are ignored and
+            counted in late_chunks, without setting this flag."""
+        if self._last_timestamp is not None and data.timestamp <= self._last_timestamp:
+            self.late_chunks += 1
+            return (False, False)
+
+        received = self._receiving.get(data.timestamp)
+        if received is None:
+            received = [0, [None] * self._sensors]
+            self._receiving[data.timestamp] = received
+            heapq.heappush(self._pending, data.timestamp)
+        received[0] |= 1 << (data.sensor - 1)
+        received[1][data.sensor - 1] = data
+
+        added = self._append_received()
 
         chunk_removed = False
-        if len(self._receiving) > self._window:
-            self._receiving = self._receiving[1:]
+        while len(self._pending) > self._window:
+            timestamp = heapq.heappop(self._pending)
+            del self._receiving[timestamp]
+            self._last_timestamp = timestamp
+            self.dropped_chunks += 1
             chunk_removed = True
+
+        if chunk_removed:
+            added = self._append_received() or added
+
         return (added, chunk_removed)
+
+    def _append_received(self) -> bool:
+        """Append to cache data with the oldest timestamps, if all sensors
+        data for the timestamp were received.
+
+        Returns
+        -------
+        added : `bool`
+            True if any data were added.
+        """
+        added = False
+        while len(self._pending) > 0:
+            timestamp = self._pending[0]
+            mask, chunks = self._receiving[timestamp]
+            if mask != self._all_received:
+                break
+            dl = len(chunks[0].accelerationX)
+            block = {"timestamp": timestamp + np.arange(dl) * self.sampleTime}
+            for s in range(1, self._sensors + 1):
+                chunk = chunks[s - 1]
+                block[f"{s} X"] = chunk.accelerationX
+                block[f"{s} Y"] = chunk.accelerationY
+                block[f"{s} Z"] = chunk.accelerationZ
+
+            self.append_block(block)
+
+            heapq.heappop(self._pending)
+            del self._receiving[timestamp]
+            self._last_timestamp = timestamp
+            added = True
+
+        return added
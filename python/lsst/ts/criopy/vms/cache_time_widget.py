@@ -19,11 +19,13 @@
 
 __all__ = ["CacheTimeWidget"]
 
-import time
+import typing
 
+import numpy as np
 from PySide6.QtCharts import QDateTimeAxis, QLogValueAxis, QValueAxis
-from PySide6.QtCore import QDateTime, QPointF, Qt, Slot
+from PySide6.QtCore import QDateTime, Qt, Slot
 
+from ..gui import min_max_decimate, replace_points
 from .bars import ToolBar
 from .cache import Cache
 from .cache_widget import CacheWidget
@@ -96,39 +98,69 @@ class CacheTimeWidget(CacheWidget):
             " all child classes implements getPoints method."
         )
 
-    def plotAll(self) -> None:
-        """Plot all signals. Run as task in a thread."""
-
-        min_value = []
-        max_value = []
-        min_timestamps = []
-        max_timestamps = []
-        for s in self.chart.series():
-            signal = self.cache[s.name()]
-            timestamps = [1000 * t for t in self.cache["timestamp"]]
+    def calculateAll(
+        self,
+        data: dict[str, np.ndarray],
+        names: list[str],
+        width: int,
+        xRange: tuple[typing.Any, typing.Any] | None,
+    ) -> list[tuple[str, np.ndarray, np.ndarray, float, float, float, float]]:
+        """Calculate and decimate values of all signals. Run in the render
+        executor thread.
+
+        Returns
+        -------
+        calculated : `[(str, numpy.ndarray, numpy.ndarray, float, float, float, float)]`
+            Serie name, decimated times and values, values minimum and maximum,
+            and times range.
+        """
+        calculated = []
+        timestamps = 1000 * data["timestamp"]
+        for name in names:
+            signal = data[name]
 
             (result_times, values) = self.calculateValues(timestamps, signal)
-            if result_times is None or values is None:
+            if result_times is None or values is None or len(values) == 0:
                 continue
 
-            s.replace([QPointF(result_times[r], values[r]) for r in range(len(values))])
+            result_times = np.asarray(result_times)
+            values = np.asarray(values)
+
+            x, y = min_max_decimate(result_times, values, width)
+            calculated.append(
+                (
+                    name,
+                    np.array(x, dtype=np.float64),
+                    np.array(y, dtype=np.float64),
+                    values.min(),
+                    values.max(),
+                    result_times[0],
+                    result_times[-1],
+                )
+            )
 
-            min_value.append(min(values))
-            max_value.append(max(values))
+        return calculated
 
-            min_timestamps.append(result_times[0])
-            max_timestamps.append(result_times[-1])
+    def plotCalculated(
+        self, calculated: list[tuple[str, np.ndarray, np.ndarray, float, float, float, float]]
+    ) -> None:
+        """Plot calculated values. Run in Qt thread."""
+        for name, x, y, _, _, _, _ in calculated:
+            serie = self.chart.find_serie(name)
+            if serie is not None:
+                replace_points(serie, x, y)
 
-        if len(min_value) > 0:
+        if len(calculated) > 0:
             if len(self.chart.axes(Qt.Vertical)) == 0:
                 self.callSetupAxes = True
             else:
-                self.chart.axes(Qt.Vertical)[0].setRange(min(min_value), max(max_value))
+                self.chart.axes(Qt.Vertical)[0].setRange(
+                    min(c[3] for c in calculated), max(c[4] for c in calculated)
+                )
                 self.chart.axes(Qt.Horizontal)[0].setRange(
-                    QDateTime.fromMSecsSinceEpoch(int(min(min_timestamps))),
-                    QDateTime.fromMSecsSinceEpoch(int(max(max_timestamps))),
+                    QDateTime.fromMSecsSinceEpoch(int(min(c[5] for c in calculated))),
+                    QDateTime.fromMSecsSinceEpoch(int(max(c[6] for c in calculated))),
                 )
-        self.update_after = time.monotonic() + 0.5
 
     @Slot()
     def integralBinningChanged(self, newIntegralBinning: int) -> None:
@@ -19,15 +19,14 @@
 
 __all__ = ["CacheWidget"]
 
-import concurrent.futures
+import functools
 import time
+import typing
 
 from PySide6.QtCharts import QLineSeries
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Qt, Slot
 
-from lsst.ts.utils import make_done_future
-
-from ..gui import AbstractChart, DockWindow
+from ..gui import AbstractChart, DockWindow, RenderExecutor
 from .bars import ToolBar
 from .cache import Cache
 from .chart_view import ChartView
@@ -35,8 +34,10 @@ from .unit import coefficients, units
 
 
 class CacheWidget(DockWindow):
-    """Display signal. Child classes shall override plotAll and possibly
-    frequencyChanged and integralBinningChanged.
+    """Display signal. Child classes shall override calculateAll and
+    plotCalculated, and possibly snapshot, frequencyChanged and
+    integralBinningChanged. Calculations run in the shared RenderExecutor, on
+    a copy of the cache data taken by snapshot.
 
     Parameters
     ----------
@@ -63,8 +64,6 @@ class CacheWidget(DockWindow):
 
         self.chart = AbstractChart()
 
-        self.update_task = make_done_future()
-
         self.update_after: float = 0.0
 
         self.cache = cache
@@ -100,19 +99,85 @@ class CacheWidget(DockWindow):
             " method is implemented in all child classes"
         )
 
-    def _plotAll(self) -> None:
-        try:
-            self.plotAll()
-        except Exception as ex:
-            print(str(ex))
-
     def plotAll(self) -> None:
-        """Plot all signals. Run as task in a thread. Should be overriden."""
+        """Submit calculation and plot of all signals to the render
+        executor."""
+        axes = self.chart.axes(Qt.Horizontal)
+        names = [s.name() for s in self.chart.series()]
+        RenderExecutor.instance().submit(
+            self,
+            functools.partial(
+                self.calculateAll,
+                self.snapshot(names),
+                names,
+                int(self.chart.plotArea().width()),
+                (axes[0].min(), axes[0].max()) if len(axes) > 0 else None,
+            ),
+            self._plotCalculated,
+        )
+
+    def snapshot(self, names: list[str]) -> typing.Any:
+        """Copy cache data needed for calculation. Run in Qt thread, which
+        modifies the cache.
+
+        Parameters
+        ----------
+        names : `[str]`
+            Names of series to calculate.
+
+        Returns
+        -------
+        data : `typing.Any`
+            Data passed to calculateAll. Copy of timestamps and series
+            columns (TimeCache.snapshot).
+        """
+        return self.cache.snapshot(["timestamp"] + names)
+
+    def calculateAll(
+        self, data: typing.Any, names: list[str], width: int, xRange: tuple[typing.Any, typing.Any] | None
+    ) -> typing.Any:
+        """Calculate data for all signals. Run in the render executor thread,
+        so it shall access neither Qt objects nor the cache. Should be
+        overriden.
+
+        Parameters
+        ----------
+        data : `typing.Any`
+            Data returned by snapshot.
+        names : `[str]`
+            Names of series to calculate.
+        width : `int`
+            Plot area width (pixels).
+        xRange : `(min, max)` or `None`
+            Horizontal axis range. None if axis wasn't yet created.
+
+        Returns
+        -------
+        calculated : `typing.Any`
+            Data passed to plotCalculated.
+        """
         raise NotImplementedError(
-            "Abstract CacheWidget.plotAll called - please make sure the method"
-            " is implemented in all child classes"
+            "Abstract CacheWidget.calculateAll called - please make sure the"
+            " method is implemented in all child classes"
         )
 
+    def plotCalculated(self, calculated: typing.Any) -> None:
+        """Plot calculated data. Run in Qt thread. Should be overriden.
+
+        Parameters
+        ----------
+        calculated : `typing.Any`
+            Data returned by calculateAll.
+        """
+        raise NotImplementedError(
+            "Abstract CacheWidget.plotCalculated called - please make sure the"
+            " method is implemented in all child classes"
+        )
+
+    def _plotCalculated(self, calculated: typing.Any) -> None:
+        self.plotCalculated(calculated)
+        self.update_after = time.monotonic() + 0.5
+
     @Slot()
     def cacheUpdated(self, index: int, length: int, start_time: float, end_time: float) -> None:
         """Process and plot data. Signaled when new data become available.
@@ -132,9 +197,8 @@ class CacheWidget(DockWindow):
             self.setupAxes()
             self.update_after = 0
 
-        if self.update_after < time.monotonic() and self.update_task.done():
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                self.update_task = pool.submit(self._plotAll)
+        if self.update_after < time.monotonic():
+            self.plotAll()
 
     @Slot()
     def frequencyChanged(self, lowFrequency: float, highFrequency: float) -> None:
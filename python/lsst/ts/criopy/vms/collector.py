@@ -25,12 +25,13 @@ import typing
 from datetime import datetime
 
 import click
-import h5py
 import numpy as np
 
 from lsst.ts.salobj import BaseMsgType, Domain, Remote
 
 from .cache import Cache
+from .output import Output, output_class
+from .output_writer import OutputWriter
 
 __all__ = ["Collector", "VMS_DEVICES"]
 
@@ -51,7 +52,8 @@ class Collector:
     fn_template : `str`
         Template for filename. Can contain % for datetime.strftime expansion,
         and ${...} for variable expansion (e.g. ${ext} get expanded to filename
-        extension).
+        extension). If the template ends with .parquet, .zarr or .hdf
+        extension, matching output is used regardless of file_type.
     size : `int`, optional
         File size in bytes.
     file_type : `str`, optional
@@ -68,6 +70,10 @@ class Collector:
     rotate_offset : `float`, optional
         Rotate offset. Defaults to None. If provided, start new file every n *
         rotate + rotate_offset ctime (from 1-1-1970) seconds.
+    cache_file : `str`, optional
+        Memory mapped file backing the cache. ${name} is expanded to device
+        name. Data not yet written survive collector restart. Defaults to None
+        - cache is kept in memory.
     """
 
     def __init__(
@@ -81,6 +87,7 @@ class Collector:
         daemonized: bool = False,
         rotate: float | None = None,
         rotate_offset: float = 0,
+        cache_file: str | None = None,
     ):
         self.log = logging.getLogger("VMSlogger")
 
@@ -96,7 +103,10 @@ class Collector:
         self.rotate = rotate
         self.rotate_offset = rotate_offset
         self.next_rotate: float | None = None
-        self.h5file = None
+        self.output: Output | None = None
+        self.output_class = output_class(fn_template, file_type)
+        self.writer = OutputWriter()
+        self._data_ready = asyncio.Event()
 
         self._bar_index = 0
         self._last_bar = 0
@@ -111,7 +121,11 @@ class Collector:
 
         self.cache_size = self.configured_chunk_size + 50000
 
-        self.cache = Cache(self.cache_size, device_sensors[self.index])
+        if cache_file is not None:
+            cache_file = cache_file.replace("${name}", VMS_DEVICES[self.index])
+            self.log.info(f"Using memory mapped cache {cache_file}")
+
+        self.cache = Cache(self.cache_size, device_sensors[self.index], filename=cache_file)
 
     def __calculate_next_rotate(self, timestamp: float) -> float:
         # calleres qurantee self.rotate is not None
@@ -141,7 +155,11 @@ class Collector:
             ("name", VMS_DEVICES[self.index]),
             (
                 "ext",
-                ("hdf" if "5" in self.file_type else "csv.gz" if "z" in self.file_type else "csv"),
+                (
+                    self.output_class.EXTENSION
+                    if self.output_class is not None
+                    else "csv.gz" if "z" in self.file_type else "csv"
+                ),
             ),
         ]
         for name, value in repl:
@@ -159,15 +177,13 @@ class Collector:
         except FileExistsError:
             pass
 
-        if "5" in self.file_type:
-            self.h5file = h5py.File(self.filename, "a")
-            group_args: dict[str, str | int] = {"chunks": (self.chunk_size)}
-            if "z" in self.file_type:
-                group_args["compression"] = "gzip"
-            self.cache.create_hdf5_datasets(self.size, self.h5file, **group_args)
+        if self.output_class is not None:
+            self.output = self.output_class(
+                self.filename, self.cache, self.size, self.chunk_size, "z" in self.file_type
+            )
 
-    def _save_hdf5(self) -> bool:
-        if self.h5file is None:
+    async def _save_output(self) -> bool:
+        if self.output is None:
             return False
         count = self.chunk_size
         if self.rotate is None:
@@ -189,25 +205,40 @@ class Collector:
         if count > 0:
             self.log.debug(
                 f"Saving device {VMS_DEVICES[self.index]} data to"
-                f" {self.h5file.file.filename} from {self.cache.hdf5_index},"
+                f" {self.output.filename} from {self.output.index},"
                 f" {count} rows"
             )
-            self.cache.savehdf5(count)
-            self.h5file.flush()
+            await self.writer.write(self.cache, count, self.output)
         return True
 
     def close(self) -> None:
-        if self.h5file is not None:
-            self.log.info(f"Closing HDF5 {self.h5file.file.filename}")
-            self.h5file.close()
+        self.writer.close()
+        self.cache.flush()
+        if self.output is not None:
+            self.log.info(f"Closing {self.output.filename}")
+            self.output.close()
+
+    def _ready_to_save(self) -> bool:
+        if len(self.cache) >= self.chunk_size:
+            return True
+        return self.next_rotate is not None and self.cache.end_time() >= self.next_rotate
 
-    def _h5_filled(self) -> bool:
+    def _output_filled(self) -> bool:
         if self.cache.empty():
             return False
         et = self.cache.end_time()
         if et is not None and self._need_rotate(et):
             return True
-        return self.cache.h5_filled()
+        assert self.output is not None
+        return self.output.filled()
+
+    async def _wait_data(self, timeout: float) -> None:
+        """Wait for data ready to be saved (or timeout)."""
+        try:
+            await asyncio.wait_for(self._data_ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._data_ready.clear()
 
     async def _sample_daemon(self) -> None:
         saved_len = 0
@@ -216,17 +247,20 @@ class Collector:
             self.log.debug(
                 f"Waiting {VMS_DEVICES[self.index]}.."
                 f" {100 * (current_len) / self.size:.02f}% {current_len} of"
-                f" {self.size}"
+                f" {self.size}, dropped {self.cache.dropped_chunks} late"
+                f" {self.cache.late_chunks} chunks, writer backlog"
+                f" {self.writer.backlog_rows} rows, last latency"
+                f" {self.writer.last_latency:.03f}s max {self.writer.max_latency:.03f}s"
             )
-            if self.h5file is None:
+            if self.output is None:
                 if current_len >= self.size:
                     break
             else:
-                if self._save_hdf5():
+                if await self._save_output():
                     saved_len += self.chunk_size
-                if self._h5_filled():
+                if self._output_filled():
                     break
-            await asyncio.sleep(0.5)
+            await self._wait_data(5)
 
     async def _sample_cli(self) -> None:
         async def collect_it(bar: typing.Any) -> None:
@@ -237,8 +271,8 @@ class Collector:
                 cache_len = len(self.cache)
                 if cache_len >= self.size:
                     break
-                await asyncio.sleep(0.1)
-                if self._save_hdf5():
+                await self._wait_data(0.1)
+                if await self._save_output():
                     break
 
         bar_size: float = 0
@@ -259,12 +293,12 @@ class Collector:
             show_percent=True,
             width=0,
         ) as bar:
-            if self.h5file is None:
+            if self.output is None:
                 await collect_it(bar)
             else:
                 while True:
                     await collect_it(bar)
-                    if self._h5_filled():
+                    if self._output_filled():
                         break
 
             bar.update(self.size)
@@ -275,7 +309,7 @@ class Collector:
         else:
             await self._sample_cli()
 
-        if self.h5file is not None:
+        if self.output is not None:
             return
 
         self.log.info(f"Saving CSV to {self.filename}")
@@ -306,6 +340,9 @@ class Collector:
                     if self.next_rotate is not None and self.rotate is not None:
                         self._current_file_date = self.next_rotate - self.rotate
                     ts = time.localtime(self._current_file_date)
+                    await self.writer.drain()
+                    if self.output is not None:
+                        self.output.close()
                     self._create_file(datetime(*ts[:6]))
                     await self._sample_file()
                     if single_shot:
@@ -315,7 +352,14 @@ class Collector:
             self.log.exception(f"Cannot collect data for {VMS_DEVICES[self.index]}")
 
     async def _data(self, data: BaseMsgType) -> None:
-        self.cache.newChunk(data)
+        added, chunk_removed = self.cache.newChunk(data)
+        if added and self._ready_to_save():
+            self._data_ready.set()
+        if chunk_removed:
+            self.log.warning(
+                f"{VMS_DEVICES[self.index]} incomplete data chunk dropped,"
+                f" {self.cache.dropped_chunks} dropped so far"
+            )
         if data.sensor == 1:
             self._bar_index += len(data.accelerationX)
 
@@ -324,7 +368,7 @@ class Collector:
         freq = 1000 if data is None else int(np.ceil(1000.0 / period))
         self.log.info(f"{VMS_DEVICES[self.index]} frequency {freq}, period {period}")
         self.cache.setSampleTime(period / 1000.0)
-        if "5" in self.file_type:
+        if self.output_class is not None:
             if self.configured_size < 0:
                 if self.rotate is None:
                     self.size = 86400 * freq
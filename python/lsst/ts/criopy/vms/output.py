@@ -0,0 +1,229 @@
+# Save VMS data to a file.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org). See the COPYRIGHT file at the top - level directory
+# of this distribution for details of code ownership.
+#
+# This program is free software : you can redistribute it and / or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import typing
+
+import h5py
+import numpy as np
+
+from ..time_cache import TimeCache
+
+__all__ = ["Output", "HDF5Output", "ParquetOutput", "ZarrOutput", "output_class"]
+
+
+class Output:
+    """Output file for collected data. Rows are removed from the cache with
+    reserve, and written with write. Write can be called from a different
+    thread than reserve, but calls shall be serialized and made in the order
+    rows were reserved.
+
+    Parameters
+    ----------
+    filename : `str`
+        Output filename.
+    cache : `TimeCache`
+        Cache holding data. Defines output columns.
+    size : `int`
+        Maximal number of rows stored in the file.
+    chunk_size : `int`
+        Number of rows written at once. Used to size output chunks.
+    compress : `bool`
+        True if data shall be compressed.
+    """
+
+    EXTENSION = ""
+    """Filename extension, expanded in ${ext}."""
+
+    def __init__(self, filename: str, cache: TimeCache, size: int, chunk_size: int, compress: bool):
+        self.filename = filename
+        self.size = size
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.index = 0
+
+    def filled(self) -> bool:
+        """Returns True if the output cannot accept more rows."""
+        return self.index >= self.size
+
+    def reserve(self, cache: TimeCache, size: int) -> tuple[int, np.ndarray]:
+        """Remove the oldest rows from the cache, reserving space for them in
+        the output.
+
+        Parameters
+        ----------
+        cache : `TimeCache`
+            Cache holding data.
+        size : `int`
+            Number of rows to reserve.
+
+        Returns
+        -------
+        index : `int`
+            Index of the first reserved row in the output.
+        rows : `numpy.ndarray`
+            Structured array with reserved rows.
+        """
+        size = min(size, len(cache), self.size - self.index)
+        index = self.index
+        self.index += size
+        return index, cache.pop_rows(size)
+
+    def write(self, index: int, rows: np.ndarray) -> None:
+        """Write reserved rows to the output.
+
+        Parameters
+        ----------
+        index : `int`
+            Index of the first row in the output.
+        rows : `numpy.ndarray`
+            Structured array with rows to write.
+        """
+        raise NotImplementedError("Output.write shall be implemented in child class")
+
+    def close(self) -> None:
+        """Close the output. All writes shall be finished before closing."""
+        pass
+
+
+class HDF5Output(Output):
+    """Save data to HDF5 file. Uses datasets created by
+    TimeCache.create_hdf5_datasets.
+    """
+
+    EXTENSION = "hdf"
+
+    def __init__(self, filename: str, cache: TimeCache, size: int, chunk_size: int, compress: bool):
+        super().__init__(filename, cache, size, chunk_size, compress)
+        self.h5file = h5py.File(filename, "a")
+        group_args: dict[str, str | int] = {"chunks": (chunk_size)}
+        if compress:
+            group_args["compression"] = "gzip"
+        self._datasets = cache.create_hdf5_datasets(size, self.h5file, **group_args)
+
+    def reserve(self, cache: TimeCache, size: int) -> tuple[int, np.ndarray]:
+        datasets, index, rows = cache.pop_hdf5_block(size)
+        self.index = cache.hdf5_index
+        return index, rows
+
+    def write(self, index: int, rows: np.ndarray) -> None:
+        TimeCache.write_hdf5_block(self._datasets, index, rows)
+        self.h5file.flush()
+
+    def close(self) -> None:
+        self.h5file.close()
+
+
+class ParquetOutput(Output):
+    """Save data to Apache Parquet file. Every write creates a row group, so
+    row groups are chunk_size rows. Requires pyarrow.
+
+    Parquet files cannot be appended. If the file exists, data are saved into
+    a new file, with .1, .2,.. inserted before the extension.
+    """
+
+    EXTENSION = "parquet"
+
+    def __init__(self, filename: str, cache: TimeCache, size: int, chunk_size: int, compress: bool):
+        super().__init__(filename, cache, size, chunk_size, compress)
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._names = list(cache.columns())
+        schema = pa.schema([(n, pa.from_numpy_dtype(cache.data.dtype[n])) for n in self._names])
+        root, extension = os.path.splitext(filename)
+        number = 0
+        while os.path.exists(self.filename):
+            number += 1
+            self.filename = f"{root}.{number}{extension}"
+        self._writer = pq.ParquetWriter(self.filename, schema, compression="zstd" if compress else "none")
+
+    def write(self, index: int, rows: np.ndarray) -> None:
+        table = self._pa.Table.from_arrays([rows[n] for n in self._names], names=self._names)
+        self._writer.write_table(table, row_group_size=self.chunk_size)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ZarrOutput(Output):
+    """Save data to Zarr group, with an array per column. Arrays are chunked
+    in chunk_size rows. Requires zarr.
+
+    Data are appended to arrays of an existing group.
+    """
+
+    EXTENSION = "zarr"
+
+    def __init__(self, filename: str, cache: TimeCache, size: int, chunk_size: int, compress: bool):
+        super().__init__(filename, cache, size, chunk_size, compress)
+
+        import zarr
+
+        group = zarr.open_group(filename, mode="a")
+        kwargs: dict[str, typing.Any] = {} if compress else {"compressors": None}
+        self._arrays = {
+            n: (
+                group[n]
+                if n in group
+                else group.create_array(
+                    n, shape=(0,), dtype=cache.data.dtype[n], chunks=(chunk_size,), **kwargs
+                )
+            )
+            for n in cache.columns()
+        }
+        # number of rows stored by the previous runs
+        self._offset = min(array.shape[0] for array in self._arrays.values())
+
+    def write(self, index: int, rows: np.ndarray) -> None:
+        start = self._offset + index
+        end = start + len(rows)
+        for n, array in self._arrays.items():
+            array.resize((end,))
+            array[start:end] = rows[n]
+
+
+OUTPUTS: list[type[Output]] = [HDF5Output, ParquetOutput, ZarrOutput]
+
+
+def output_class(template: str, file_type: str) -> type[Output] | None:
+    """Returns output class for filename template.
+
+    Parameters
+    ----------
+    template : `str`
+        Filename template. If it ends with one of the known extensions
+        (parquet, zarr, hdf), the matching output is used.
+    file_type : `str`
+        File type. HDF5 output is used if it contains 5.
+
+    Returns
+    -------
+    output : `type[Output] | None`
+        Output class. None when data shall be stored in CSV.
+    """
+    extension = os.path.splitext(template)[1][1:]
+    for output in OUTPUTS:
+        if output.EXTENSION == extension:
+            return output
+    if "5" in file_type:
+        return HDF5Output
+    return None
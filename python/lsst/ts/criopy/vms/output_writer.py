@@ -0,0 +1,143 @@
+# Save VMS data to a file.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org). See the COPYRIGHT file at the top - level directory
+# of this distribution for details of code ownership.
+#
+# This program is free software : you can redistribute it and / or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import collections
+import concurrent.futures
+import time
+
+import numpy as np
+
+from ..time_cache import TimeCache
+from .output import Output
+
+__all__ = ["OutputWriter"]
+
+
+class OutputWriter:
+    """Writes cache data into output file in a dedicated thread.
+
+    Rows are removed from the cache on the event loop thread, and the filled
+    buffer is handed to the writer thread. Ingestion continues into the cache
+    while the buffer is being written. At most max_pending buffers are queued;
+    when the writer falls behind, write waits (without blocking the event
+    loop) for the oldest buffer to be written.
+
+    Parameters
+    ----------
+    max_pending : `int`, optional
+        Maximal number of buffers waiting to be written. Defaults to 2 (double
+        buffering).
+
+    Attributes
+    ----------
+    last_latency : `float`
+        Time in seconds from submitting the last written buffer till its data
+        were flushed to the file.
+    max_latency : `float`
+        Maximal recorded latency.
+    written_rows : `int`
+        Number of rows written.
+    """
+
+    def __init__(self, max_pending: int = 2):
+        self.max_pending = max_pending
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.written_rows = 0
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="OutputWriter"
+        )
+        self._pending: collections.deque[tuple[asyncio.Future, int]] = collections.deque()
+
+    @property
+    def backlog(self) -> int:
+        """Number of buffers waiting to be written."""
+        self._collect_done()
+        return len(self._pending)
+
+    @property
+    def backlog_rows(self) -> int:
+        """Number of rows waiting to be written."""
+        self._collect_done()
+        return sum(rows for future, rows in self._pending)
+
+    async def write(self, cache: TimeCache, size: int, output: Output) -> int:
+        """Remove the oldest rows from cache and schedule them to be written
+        into the output.
+
+        Parameters
+        ----------
+        cache : `TimeCache`
+            Cache holding data.
+        size : `int`
+            Number of rows to write.
+        output : `Output`
+            Output receiving the data.
+
+        Returns
+        -------
+        rows : `int`
+            Number of rows scheduled to be written.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while writing previous buffers.
+        """
+        while self.backlog >= self.max_pending:
+            await asyncio.shield(self._pending[0][0])
+
+        index, rows = output.reserve(cache, size)
+        if len(rows) == 0:
+            return 0
+        future = asyncio.wrap_future(
+            self._executor.submit(self._write, output, index, rows, time.monotonic())
+        )
+        self._pending.append((future, len(rows)))
+        return len(rows)
+
+    async def drain(self) -> None:
+        """Wait for all pending buffers to be written.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while writing buffers.
+        """
+        while len(self._pending) > 0:
+            future, rows = self._pending.popleft()
+            await future
+
+    def close(self) -> None:
+        """Wait for pending writes and stop the writer thread."""
+        self._executor.shutdown(wait=True)
+
+    def _collect_done(self) -> None:
+        while len(self._pending) > 0 and self._pending[0][0].done():
+            future, rows = self._pending.popleft()
+            future.result()
+
+    def _write(self, output: Output, index: int, rows: np.ndarray, submitted: float) -> None:
+        output.write(index, rows)
+
+        self.last_latency = time.monotonic() - submitted
+        self.max_latency = max(self.max_latency, self.last_latency)
+        self.written_rows += len(rows)
@@ -19,19 +19,22 @@
 
 __all__ = ["PSDWidget"]
 
-import time
+import typing
 
 import numpy as np
-from PySide6.QtCharts import QLineSeries, QLogValueAxis, QValueAxis
-from PySide6.QtCore import QPointF, Qt, Slot
+from PySide6.QtCharts import QLogValueAxis, QValueAxis
+from PySide6.QtCore import Qt, Slot
 
+from ..gui import replace_points
 from .bars import ToolBar
 from .cache import Cache
 from .cache_widget import CacheWidget
+from .welch_psd import WelchPSD
 
 
 class PSDWidget(CacheWidget):
-    """Display signal PSD.
+    """Display signal PSD. PSD is estimated with Welch's method, only spectra
+    of new segments are calculated as data arrive into the cache.
 
     Parameters
     ----------
@@ -53,6 +56,7 @@ class PSDWidget(CacheWidget):
         channels: list[tuple[int, int]] | None = None,
     ):
         super().__init__(title, cache, toolBar, channels)
+        self._engines: dict[str, WelchPSD] = {}
 
     def setupAxes(self) -> None:
         for a in self.chart.axes():
@@ -90,98 +94,104 @@ class PSDWidget(CacheWidget):
 
         self.callSetupAxes = False
 
-    def plotAll(self) -> None:
-        """Plot all signals. Run as task in a thread."""
+    def snapshot(self, names: list[str]) -> tuple[dict[str, np.ndarray], float, int]:
+        """Copy cache data, sample time and cache size."""
+        return (super().snapshot(names), self.cache.sampleTime, len(self.cache.data))
 
-        def downsample(psd: list[float], N: int) -> tuple[list[float], list[float]]:
+    def calculateAll(
+        self,
+        data: tuple[dict[str, np.ndarray], float, int],
+        names: list[str],
+        width: int,
+        xRange: tuple[typing.Any, typing.Any] | None,
+    ) -> list[tuple[str, np.ndarray, np.ndarray]]:
+        """Calculates PSD - Power Spectral Density - of all signals. Run in
+        the render executor thread. Downsamples the calculated PSD so
+        reasonable number of points is displayed.
+
+        Returns
+        -------
+        calculated : `[(str, numpy.ndarray, numpy.ndarray)]`
+            Serie name, frequencies and PSD.
+        """
+
+        def downsample(psd: np.ndarray, frequencies: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
             """Downsample PSD so no too many points are plot. Replace PSD with
             max of subarray and frequency with mean frequency.
+
             Parameters
             ----------
-            psd : `[float]`
-                Original, full scale PSD. len(psd) ~= N // 2
-            N : `int`
-                Size of original signal.
+            psd : `numpy.ndarray`
+                Original, full scale PSD.
+            frequencies : `numpy.ndarray`
+                PSD frequencies.
             """
-            fMin = self.chart.axes(Qt.Horizontal)[0].min()
-            fMax = self.chart.axes(Qt.Horizontal)[0].max()
-
-            frequencies = np.fft.rfftfreq(N, self.cache.sampleTime)
-
-            f = iter(frequencies)
-            rMin = 0
-            try:
-                while next(f) < fMin:
-                    rMin += 1
-                rMax = rMin
-                try:
-                    while next(f) < fMax:
-                        rMax += 1
-                except StopIteration:
-                    pass
+            if xRange is not None:
+                rMin = int(np.searchsorted(frequencies, xRange[0]))
+                if rMin >= len(frequencies):
+                    return (psd[-2:-1], frequencies[-2:-1])
+                rMax = int(np.searchsorted(frequencies, xRange[1]))
                 rMin = max(0, rMin - 2)
                 rMax = min(len(frequencies) - 1, rMax + 2)
-            except StopIteration:
-                return (psd[-2:-1], frequencies[-2:-1])
 
-            psd = psd[rMin:rMax]
-            frequencies = frequencies[rMin:rMax]
-            dataPerPixel = len(psd) / self.chart.plotArea().width()
+                psd = psd[rMin:rMax]
+                frequencies = frequencies[rMin:rMax]
+
+            dataPerPixel = len(psd) / max(width, 1)
             # downsample if points are less than 2 pixels apart, so the points
             # are at least 2 pixels apart
             if dataPerPixel > 0.5:
                 s = int(np.floor(dataPerPixel * 2.0))
                 N = len(psd)
-                psd = [max(psd[i : i + s]) for i in range(0, N, s)]
+                starts = np.arange(0, N, s)
+                psd = np.maximum.reduceat(psd, starts)
                 # frequencies are monotonic constant step. So to calculate
                 # average, only took boundary members and divide by two
-                frequencies = [(frequencies[i] + frequencies[min(i + s, N - 1)]) / 2 for i in range(0, N, s)]
+                frequencies = (frequencies[starts] + frequencies[np.minimum(starts + s, N - 1)]) / 2
             return (psd, frequencies)
 
-        def plot(serie: QLineSeries, signal: list[float]) -> tuple[float, float]:
-            """Calculates and plot PSD - Power Spectral Density. Downsamples
-            the calculated PSD so reasonable number of points is displayed.
-
-            Parameters
-            ----------
-            serie : `QLineSeries`
-                Line serie.
-            signal : `[float]`
-                Input signal.
-
-            Returns
-            -------
-            min : `float`
-                PSD subplot minimum value.
-            max : `float`
-                PSD subplot maximum value.
-            """
-            N = len(signal)
-            if N < 10:
-                return 0, 0
-            # as input is real only, fft is symmetric; rfft is enough
-            psd = np.abs(np.fft.rfft(np.array(signal) * self.coefficient)) ** 2
+        for name in list(self._engines.keys()):
+            if name not in names:
+                del self._engines[name]
 
-            (psd, frequencies) = downsample(psd, N)
+        columns, sample_time, capacity = data
+        calculated = []
+        timestamps = columns["timestamp"]
+        for name in names:
+            engine = self._engines.setdefault(name, WelchPSD())
+            signal = columns[name]
+            psd = engine.update(timestamps, signal, sample_time, capacity)
+            if psd is None:
+                calculated.append((name, np.empty(0), np.empty(0)))
+                continue
 
-            points = [QPointF(frequencies[r], psd[r]) for r in range(len(psd))]
-            serie.replace(points)
+            (psd, frequencies) = downsample(psd * self.coefficient**2, engine.frequencies)
+            calculated.append((name, frequencies, psd))
 
-            return min(psd), max(psd)
+        return calculated
 
+    def plotCalculated(self, calculated: list[tuple[str, np.ndarray, np.ndarray]]) -> None:
+        """Plot calculated PSDs. Run in Qt thread."""
         min_psd = []
         max_psd = []
-        for s in self.chart.series():
-            min_p, max_p = plot(s, self.cache[s.name()])
-            min_psd.append(min_p)
-            max_psd.append(max_p)
+        for name, frequencies, psd in calculated:
+            if len(psd) == 0:
+                min_psd.append(0)
+                max_psd.append(0)
+                continue
+
+            serie = self.chart.find_serie(name)
+            if serie is not None:
+                replace_points(serie, frequencies, psd)
+
+            min_psd.append(psd.min())
+            max_psd.append(psd.max())
 
         if len(min_psd) > 0:
             if len(self.chart.axes(Qt.Vertical)) == 0:
                 self.callSetupAxes = True
             else:
                 self.chart.axes(Qt.Vertical)[0].setRange(min(min_psd), max(max_psd))
-        self.update_after = time.monotonic() + 0.5
 
     @Slot()
     def frequencyChanged(self, lowFrequency: float, highFrequency: float) -> None:
@@ -0,0 +1,149 @@
+# This file is part of cRIO/VMS GUI.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top - level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software : you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["WelchPSD"]
+
+import collections
+
+import numpy as np
+
+
+class WelchPSD:
+    """Incremental Welch's Power Spectral Density estimator.
+
+    Signal is split into Hann windowed segments overlapping by half of their
+    length. Segments spectra are keyed by segment start timestamp, so when new
+    data arrive only spectra of the new segments are calculated. Spectra of
+    segments which left the signal window are removed. PSD is the average of
+    the remaining segments spectra.
+
+    Parameters
+    ----------
+    segment_length : `int`, optional
+        Maximal number of samples in a segment. Shorter segments (the largest
+        power of 2 fitting into the signal) are used for shorter signals.
+        Defaults to 4096.
+    """
+
+    def __init__(self, segment_length: int = 4096):
+        self.segment_length = segment_length
+        self.reset(0, 0)
+
+    def reset(self, nperseg: int, sample_time: float) -> None:
+        """Forget all calculated segments.
+
+        Parameters
+        ----------
+        nperseg : `int`
+            Number of samples in a segment.
+        sample_time : `float`
+            Signal sample time (seconds).
+        """
+        self.nperseg = nperseg
+        self.sample_time = sample_time
+        self._segments: collections.OrderedDict[float, np.ndarray] = collections.OrderedDict()
+        self._sum: np.ndarray | None = None
+        self._next_start: float | None = None
+
+        if nperseg > 0:
+            self._window = np.hanning(nperseg)
+            # density scaling, as scipy.signal.welch
+            self._scale = 2.0 * sample_time / np.sum(self._window**2)
+            self.frequencies = np.fft.rfftfreq(nperseg, sample_time)
+        else:
+            self.frequencies = np.empty(0)
+
+    def segments(self) -> int:
+        """Returns number of segments averaged into PSD."""
+        return len(self._segments)
+
+    def update(
+        self, timestamps: np.ndarray, signal: np.ndarray, sample_time: float, capacity: int
+    ) -> np.ndarray | None:
+        """Calculates spectra of new segments, and returns PSD.
+
+        Parameters
+        ----------
+        timestamps : `numpy.ndarray`
+            Signal timestamps, sorted.
+        signal : `numpy.ndarray`
+            Signal values.
+        sample_time : `float`
+            Signal sample time (seconds).
+        capacity : `int`
+            Maximal length of the signal (cache size). Used to select segment
+            length.
+
+        Returns
+        -------
+        psd : `numpy.ndarray` or `None`
+            Power Spectral Density at frequencies. None if there isn't enough
+            data for a single segment.
+        """
+        nperseg = min(self.segment_length, 1 << max(int(np.log2(max(capacity, 1))), 0))
+        if nperseg != self.nperseg or sample_time != self.sample_time:
+            self.reset(nperseg, sample_time)
+
+        if len(signal) < nperseg or nperseg < 2:
+            return None
+
+        step = nperseg // 2
+
+        # cache was cleared or restarted with older data
+        if self._next_start is not None and (
+            self._next_start < timestamps[0] - sample_time / 2 or len(self._segments) == 0
+        ):
+            self.reset(nperseg, sample_time)
+
+        # remove segments which left the cache
+        while len(self._segments) > 0:
+            start, spectrum = next(iter(self._segments.items()))
+            if start >= timestamps[0] - sample_time / 2:
+                break
+            self._segments.popitem(last=False)
+            self._sum -= spectrum
+        if len(self._segments) == 0:
+            self._sum = None
+
+        if self._next_start is None:
+            first = 0
+        else:
+            first = int(np.searchsorted(timestamps, self._next_start - sample_time / 2))
+
+        if first + nperseg <= len(signal):
+            frames = np.lib.stride_tricks.sliding_window_view(signal[first:], nperseg)[::step]
+            spectra = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2 * self._scale
+            spectra[:, 0] /= 2
+            if nperseg % 2 == 0:
+                spectra[:, -1] /= 2
+
+            starts = timestamps[first : first + len(frames) * step : step]
+            for start, spectrum in zip(starts, spectra):
+                self._segments[start] = spectrum
+
+            new_sum = spectra.sum(axis=0)
+            self._sum = new_sum if self._sum is None else self._sum + new_sum
+            self._next_start = starts[-1] + step * sample_time
+
+        if len(self._segments) == 0 or self._sum is None:
+            return None
+
+        return self._sum / len(self._segments)
@@ -50,6 +50,7 @@ class EUI(QMainWindow):
     SYSTEMS = ["M1M3", "M2", "Rotator"]
 
     cacheUpdated = Signal(int, int, float, float)
+    chunksLost = Signal(int, int, int)
 
     def __init__(self, *comms: MetaSAL):
         super().__init__()
@@ -108,6 +109,7 @@ class EUI(QMainWindow):
 
         self.statusBar: StatusBar = StatusBar(self.SYSTEMS)
         self.cacheUpdated.connect(self.statusBar.cacheUpdated)
+        self.chunksLost.connect(self.statusBar.chunksLost)
         self.setStatusBar(self.statusBar)
 
         self.addDockWidget(Qt.BottomDockWidgetArea, logDock)
@@ -181,7 +183,10 @@ class EUI(QMainWindow):
     @Slot()
     def data(self, data: BaseMsgType) -> None:
         cache = self.caches[data.salIndex - 1]
+        late = cache.late_chunks
         added, chunk_removed = cache.newChunk(data)
+        if chunk_removed or cache.late_chunks != late:
+            self.chunksLost.emit(data.salIndex - 1, cache.dropped_chunks, cache.late_chunks)
         if added:
             self.cacheUpdated.emit(
                 data.salIndex - 1,
@@ -32,7 +32,7 @@ import typing
 from lsst.ts.m1m3.utils import parse_duration
 
 from . import ExitErrorCodes
-from .vms import VMS_DEVICES, Collector
+from .vms import VMS_DEVICES, Collector, ParquetOutput, ZarrOutput, output_class
 
 try:
     importlib.import_module("h5py")
@@ -42,7 +42,7 @@ except ModuleNotFoundError:
 
 
 parser = argparse.ArgumentParser(
-    description="Save VMS data to a file, either HDF5 or CSV.",
+    description="Save VMS data to a file, either HDF5, Parquet, Zarr or CSV.",
     epilog=(
         "Data are read as they arrive in DDS messages, matched by timestamps. "
         "Only complete (from all accelerometers the device provides) records "
@@ -111,7 +111,23 @@ parser.add_argument(
         " performed (see man strftime for details, %%Y for full (4 digit) year,"
         " %%m for calendar month,..) together with custom ${xx} expansion"
         " (${name} for device name, ${ext} for extension - hd5, cvs or cvs.gz)."
-        " Directories in expanded file path are created as needed."
+        " Directories in expanded file path are created as needed. Templates"
+        " ending with .parquet or .zarr store data in Apache Parquet (requires"
+        " pyarrow) or Zarr (requires zarr) format, with row groups or chunks"
+        " of --chunk-size rows."
+    ),
+)
+parser.add_argument(
+    "--cache-file",
+    action="store",
+    dest="cache_file",
+    default=None,
+    type=str,
+    help=(
+        "keep receiving cache in memory mapped file. ${name} is expanded to"
+        " device name. Data not yet written to output file survive logger"
+        " restart, and can be read by other processes. Default to keep cache"
+        " in memory."
     ),
 )
 parser.add_argument(
@@ -222,9 +238,21 @@ async def main(args: typing.Any, pipe: typing.Any = None) -> None:
         f.write(f"{os.getpid()}\n")
         f.close()
 
+    output = output_class(args.template, file_type)
+    for module, output_type in (("pyarrow", ParquetOutput), ("zarr", ZarrOutput)):
+        if output == output_type:
+            try:
+                importlib.import_module(module)
+            except ModuleNotFoundError:
+                logger.error(
+                    f"Python is missing {module} module, saving {output_type.EXTENSION} file is not"
+                    f" supported. Please install {module} first (pip install {module})."
+                )
+                sys.exit(ExitErrorCodes.VMSLOGGER_MISSING_MODULE)
+
     if args.rotate is not None:
-        if not args.h5py:
-            raise RuntimeError("--rotate option works only with HDF5 files")
+        if output is None:
+            raise RuntimeError("--rotate option works only with HDF5, Parquet or Zarr files")
 
     for d in args.devices:
         logger.info(f"Collecting {d} - template {args.template}")
@@ -238,6 +266,7 @@ async def main(args: typing.Any, pipe: typing.Any = None) -> None:
             args.daemon,
             args.rotate,
             args.rotate_offset,
+            args.cache_file,
         )
         collectors.append(c)
         tasks.append(asyncio.create_task(c.collect_data(args.single_shot)))
@@ -19,8 +19,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+import tempfile
 import unittest
 
+import h5py
+import numpy as np
+
 from lsst.ts.criopy import TimeCache
 
 
@@ -174,6 +179,134 @@ class TimeCacheTestCase(unittest.TestCase):
         self.assertEqual(cache.timestampIndex(11.0), 9)
         self.assertEqual(cache.timestampIndex(11.1), None)
 
+    def test_append_block(self) -> None:
+        cache = TimeCache(10, [("timestamp", "f8"), ("data1", "i4"), ("data2", "i4")])
+        reference = TimeCache(10, [("timestamp", "f8"), ("data1", "i4"), ("data2", "i4")])
+
+        start = 0
+        for rows in [3, 0, 4, 5, 10, 1, 23, 7]:
+            values = np.arange(start, start + rows)
+            block = np.zeros(rows, cache.data.dtype)
+            block["timestamp"] = values
+            block["data1"] = values * 2
+            block["data2"] = values * 3
+            cache.append_block(block)
+            for v in values:
+                reference.append((v, v * 2, v * 3))
+            start += rows
+
+            self.assertEqual(len(cache), len(reference))
+            self.assertEqual(cache.current_index, reference.current_index)
+            self.assertEqual(cache.filled, reference.filled)
+            for c in cache.columns():
+                np.testing.assert_array_equal(cache.column(c), reference.column(c))
+                self.assertEqual(cache[c], reference[c])
+
+        cache.append_block({"timestamp": [100, 101], "data1": [1, 2], "data2": [3, 4]})
+        np.testing.assert_array_equal(cache.column("timestamp")[-3:], [start - 1, 100, 101])
+        np.testing.assert_array_equal(cache.column("data2")[-2:], [3, 4])
+
+        with self.assertRaises(KeyError):
+            cache.append_block({"timestamp": [1], "data1": [2]})
+
+        with self.assertRaises(ValueError):
+            cache.append_block({"timestamp": [1, 2], "data1": [2], "data2": [3]})
+
+    def test_column(self) -> None:
+        cache = TimeCache(5, [("timestamp", "f8"), ("data1", "f8")])
+
+        self.assertEqual(len(cache.column("data1")), 0)
+
+        for i in range(3):
+            cache.append((i, i * 2))
+
+        column = cache.column("data1")
+        self.assertTrue(np.shares_memory(column, cache.data))
+        np.testing.assert_array_equal(column, [0, 2, 4])
+
+        for i in range(3, 7):
+            cache.append((i, i * 2))
+
+        np.testing.assert_array_equal(cache.column("timestamp"), [2, 3, 4, 5, 6])
+        np.testing.assert_array_equal(cache.rows()["data1"], [4, 6, 8, 10, 12])
+
+    def test_snapshot(self) -> None:
+        cache = TimeCache(5, [("timestamp", "f8"), ("data1", "f8"), ("data2", "f8")])
+        for i in range(3):
+            cache.append((i, i * 2, i * 3))
+
+        snapshot = cache.snapshot(["timestamp", "data1"])
+        self.assertEqual(list(snapshot.keys()), ["timestamp", "data1"])
+        self.assertFalse(np.shares_memory(snapshot["data1"], cache.data))
+
+        # snapshot isn't modified by later appends
+        for i in range(3, 7):
+            cache.append((i, i * 2, i * 3))
+
+        np.testing.assert_array_equal(snapshot["timestamp"], [0, 1, 2])
+        np.testing.assert_array_equal(snapshot["data1"], [0, 2, 4])
+        np.testing.assert_array_equal(cache.snapshot(["data2"])["data2"], [6, 9, 12, 15, 18])
+
+    def test_memmap(self) -> None:
+        items = [("timestamp", "f8"), ("data1", "i4")]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "cache.bin")
+            cache = TimeCache(10, items, filename)
+            reader = TimeCache.open_readonly(filename)
+
+            self.assertEqual(len(reader), 0)
+
+            for i in range(13):
+                cache.append((i, i * 2))
+
+            self.assertEqual(len(reader), 10)
+            self.assertTrue(reader.filled)
+            np.testing.assert_array_equal(reader.column("timestamp"), np.arange(3, 13))
+
+            cache.flush()
+            del cache
+
+            restored = TimeCache(10, items, filename)
+            self.assertEqual(len(restored), 10)
+            np.testing.assert_array_equal(restored.column("data1"), np.arange(3, 13) * 2)
+
+            restored.resize(5)
+            restored.append((13, 26))
+            np.testing.assert_array_equal(restored.column("timestamp"), np.arange(9, 14))
+
+            del restored
+
+            resized = TimeCache(20, items, filename)
+            self.assertEqual(len(resized), 5)
+            self.assertEqual(resized.data.shape, (20,))
+            np.testing.assert_array_equal(resized.column("data1"), np.arange(9, 14) * 2)
+
+            with self.assertRaises(ValueError):
+                TimeCache(20, [("timestamp", "f8")], filename)
+
+    def test_savehdf5(self) -> None:
+        cache = TimeCache(200, [("timestamp", "f8"), ("data1", "i4")])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with h5py.File(os.path.join(tmpdir, "test.hdf"), "w") as h5file:
+                cache.create_hdf5_datasets(250, h5file, chunks=(50,))
+                self.assertEqual(h5file["timestamp"].shape, (0,))
+
+                for i in range(4):
+                    cache.append_block({"timestamp": np.arange(i * 80, (i + 1) * 80), "data1": np.arange(80)})
+                    cache.savehdf5(70)
+                    self.assertEqual(len(cache), (i + 1) * 10 if i < 3 else 70)
+
+                self.assertTrue(cache.h5_filled())
+                self.assertEqual(cache.hdf5_index, 250)
+                self.assertEqual(len(cache), 70)
+                self.assertEqual(h5file["timestamp"].shape, (250,))
+                np.testing.assert_array_equal(h5file["timestamp"], np.arange(250))
+                np.testing.assert_array_equal(cache.column("timestamp"), np.arange(250, 320))
+
+                datasets, index, rows = cache.pop_hdf5_block(10)
+                self.assertEqual(index, 250)
+                self.assertEqual(len(rows), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import types
+import unittest
+
+import pytest
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+from lsst.ts.criopy.gui import Force, MaxMilliSeconds, WarningLabel, flush_labels, label_update_counters
+
+
+@pytest.mark.usefixtures("qapp")
+class CustomLabelsTestCase(unittest.TestCase):
+    def test_suppressed(self) -> None:
+        window = QWidget()
+        layout = QVBoxLayout(window)
+        force = Force()
+        warning = WarningLabel()
+        layout.addWidget(force)
+        layout.addWidget(warning)
+
+        for value in [1.0, 1.0, 1.001, 2.0, float("nan"), float("nan")]:
+            force.setValue(value)
+            warning.setValue(value > 1)
+
+        self.assertEqual(force.text(), "---")
+        flush_labels()
+        self.assertEqual(force.text(), "--- N")
+        self.assertEqual(force.applied, 3)
+        self.assertEqual(force.suppressed, 3)
+
+        counters = label_update_counters(window)
+        self.assertEqual(counters.applied, 6)
+        self.assertEqual(counters.suppressed, 6)
+
+    def test_reset(self) -> None:
+        maximum = MaxMilliSeconds("duration")
+        for value in [0.1, 0.2, 0.2, 0.05]:
+            maximum.new_data(types.SimpleNamespace(duration=value))
+        flush_labels()
+        self.assertEqual(maximum.text(), "200.0 ms")
+        self.assertEqual(maximum.applied, 2)
+
+        maximum.resetFormat.emit()
+        maximum.new_data(types.SimpleNamespace(duration=0.05))
+        flush_labels()
+        self.assertEqual(maximum.text(), "50.0 ms")
+
+    def test_set_text(self) -> None:
+        # actuator deselected and selected again with the same warning state
+        warning = WarningLabel()
+        warning.setValue(False)
+        flush_labels()
+        warning.setText("")
+        warning.setValue(False)
+        flush_labels()
+        self.assertIn("OK", warning.text())
+
+        # deselected before the batch was applied
+        warning.setValue(True)
+        warning.setText("")
+        flush_labels()
+        self.assertEqual(warning.text(), "")
+
+        warning.setValue(True)
+        flush_labels()
+        self.assertIn("WARNING", warning.text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy as np
+from PySide6.QtCharts import QLineSeries
+
+from lsst.ts.criopy.gui import min_max_decimate, replace_points
+
+
+class DecimationTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.x = np.arange(1000) * 0.1
+        self.y = rng.standard_normal(1000)
+
+    def test_min_max(self) -> None:
+        x, y = min_max_decimate(self.x, self.y, 100)
+
+        self.assertEqual(len(x), 200)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        np.testing.assert_array_equal(y, self.y[np.searchsorted(self.x, x)])
+        for bucket in range(100):
+            values = self.y[bucket * 10 : (bucket + 1) * 10]
+            self.assertEqual(sorted(y[bucket * 2 : bucket * 2 + 2]), [values.min(), values.max()])
+
+    def test_tail(self) -> None:
+        # 1000 points into 300 buckets - 250 buckets of 4 points, no tail
+        x, y = min_max_decimate(self.x, self.y, 300)
+        self.assertEqual(len(x), 500)
+
+        x, y = min_max_decimate(self.x[:998], self.y[:998], 100)
+        # 99 buckets of 10 points and a tail of 8 points
+        self.assertEqual(len(x), 200)
+        self.assertEqual(sorted(y[-2:]), [self.y[990:998].min(), self.y[990:998].max()])
+
+    def test_short(self) -> None:
+        # 200 points fit into 100 buckets (two points per bucket)
+        for buckets in (100, 500, 1000):
+            x, y = min_max_decimate(self.x[:200], self.y[:200], buckets)
+            np.testing.assert_array_equal(x, self.x[:200])
+            np.testing.assert_array_equal(y, self.y[:200])
+
+        x, y = min_max_decimate(self.x[:200], self.y[:200], 50)
+        self.assertEqual(len(x), 100)
+
+        x, y = min_max_decimate(self.x[:0], self.y[:0], 10)
+        self.assertEqual(len(x), 0)
+
+    def test_width(self) -> None:
+        for buckets in (0, -1):
+            x, y = min_max_decimate(self.x, self.y, buckets)
+            np.testing.assert_array_equal(x, self.x)
+            np.testing.assert_array_equal(y, self.y)
+
+        # single bucket keeps global minimum and maximum, in original order
+        x, y = min_max_decimate(self.x, self.y, 1)
+        indices = np.sort([self.y.argmin(), self.y.argmax()])
+        np.testing.assert_array_equal(x, self.x[indices])
+        np.testing.assert_array_equal(y, self.y[indices])
+
+    def test_nan(self) -> None:
+        y = self.y.copy()
+        y[5] = np.nan
+        y[10:20] = np.nan
+
+        x, decimated = min_max_decimate(self.x, y, 100)
+
+        self.assertEqual(len(x), 200)
+        # NaN isn't selected as minimum or maximum
+        values = y[0:10]
+        self.assertEqual(sorted(decimated[0:2]), [np.nanmin(values), np.nanmax(values)])
+        # bucket with NaNs only is represented by its first point
+        np.testing.assert_array_equal(x[2:4], [self.x[10], self.x[10]])
+        self.assertTrue(np.all(np.isnan(decimated[2:4])))
+
+    def test_replace_points(self) -> None:
+        serie = QLineSeries()
+
+        replace_points(serie, self.x, self.y)
+        self.assertEqual(serie.count(), 1000)
+
+        replace_points(serie, self.x, self.y, 100)
+        self.assertEqual(serie.count(), 200)
+        x, y = min_max_decimate(self.x, self.y, 100)
+        for i in (0, 99, 199):
+            self.assertEqual(serie.at(i).x(), x[i])
+            self.assertEqual(serie.at(i).y(), y[i])
+
+
+if __name__ == "__main__":
+    unittest.main()
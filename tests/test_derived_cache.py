@@ -0,0 +1,81 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import types
+import unittest
+
+from lsst.ts.criopy.gui.sal import DerivedCache
+
+
+class DerivedCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calculated = 0
+
+    def calculate(self, data: types.SimpleNamespace) -> float:
+        self.calculated += 1
+        return data.value * 2
+
+    def test_shared(self) -> None:
+        cache = DerivedCache()
+        data = types.SimpleNamespace(value=1, private_sndStamp=10.0)
+
+        self.assertEqual(cache.get("double", data, self.calculate), 2)
+        self.assertEqual(cache.get("double", data, self.calculate), 2)
+        self.assertEqual(self.calculated, 1)
+        self.assertEqual(cache.hits, 1)
+
+        cache.get("other", data, self.calculate)
+        cache.get("double", types.SimpleNamespace(value=2, private_sndStamp=11.0), self.calculate)
+        self.assertEqual(self.calculated, 3)
+
+        cache.get("double", types.SimpleNamespace(value=3), self.calculate)
+        cache.get("double", types.SimpleNamespace(value=3), self.calculate)
+        self.assertEqual(self.calculated, 5)
+
+    def test_same_stamp(self) -> None:
+        # replayed messages of different topics are all EfdTopic instances
+        class EfdTopic(types.SimpleNamespace):
+            pass
+
+        cache = DerivedCache()
+        applied = EfdTopic(value=1, private_sndStamp=10.0)
+        measured = EfdTopic(value=5, private_sndStamp=10.0)
+
+        self.assertEqual(cache.get("double", applied, self.calculate), 2)
+        self.assertEqual(cache.get("double", measured, self.calculate), 10)
+        self.assertEqual(cache.get("double", applied, self.calculate), 2)
+        self.assertEqual(self.calculated, 2)
+
+    def test_size(self) -> None:
+        cache = DerivedCache(size=2)
+        data = [types.SimpleNamespace(value=stamp, private_sndStamp=stamp) for stamp in range(3)]
+        for d in data:
+            cache.get("double", d, self.calculate)
+        self.assertEqual(self.calculated, 3)
+
+        cache.get("double", data[2], self.calculate)
+        self.assertEqual(self.calculated, 3)
+        cache.get("double", data[0], self.calculate)
+        self.assertEqual(self.calculated, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,7 +26,8 @@ import unittest
 import vcr
 from astropy.time import Time, TimeDelta
 
-from lsst.ts.criopy.salcomm import EfdCache, create
+from lsst.ts.criopy.salcomm import EfdCache, MockEfdClient, create
+from lsst.ts.criopy.salcomm.efd_topic_cache import time_ns
 from lsst.ts.salobj import set_test_topic_subname
 
 CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
@@ -70,6 +71,32 @@ class EfdCacheTestCase(unittest.IsolatedAsyncioTestCase):
 
             assert len(topics) == 25
 
+    async def test_evict(self) -> None:
+        cache = EfdCache(self.sal, "usdf_efd", efd_client=MockEfdClient(latency=0), memory_budget=None)
+
+        timepoint = Time("2025-05-19T23:40:00", scale="utc")
+        interval = TimeDelta(240, format="sec")
+
+        for request in cache.new_requests(timepoint, interval):
+            await cache.load(request)
+
+        full = cache.nbytes
+        self.assertGreater(full, 0)
+
+        cache.memory_budget = full // 2
+        current = timepoint + TimeDelta(200, format="sec")
+        cache.set_current_ns(time_ns(current), 1, TimeDelta(10, format="sec"))
+
+        self.assertLessEqual(cache.nbytes, full // 2)
+        self.assertGreater(cache.evicted, 0)
+
+        thermal = cache.tel_thermalData
+        # data behind playback were evicted, current data are kept
+        self.assertGreater(thermal.start, timepoint)
+        self.assertTrue(thermal.covers(time_ns(current)))
+        self.assertEqual(thermal.hits, 1)
+        self.assertIsNotNone(thermal.get())
+
 
 if __name__ == "__main__":
     if "RECORD_MODE" not in os.environ:
@@ -0,0 +1,176 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from astropy.time import Time, TimeDelta
+
+from lsst.ts.criopy.salcomm import (
+    EfdCacheRequest,
+    EfdDiskCache,
+    EfdFetcher,
+    EfdTopicCache,
+    MockEfdClient,
+)
+
+
+def efd_data(start: Time, end: Time) -> pd.DataFrame:
+    index = pd.date_range(
+        pd.Timestamp(start.isot, tz="UTC").ceil("s"), pd.Timestamp(end.isot, tz="UTC"), freq="1s"
+    )
+    return pd.DataFrame({"value": np.arange(len(index))}, index=index)
+
+
+class EfdDiskCacheTestCase(unittest.TestCase):
+    def test_coverage(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = EfdDiskCache(directory)
+
+            start = Time("2025-05-19T23:40:00.05", scale="utc")
+            end = start + TimeDelta(1800, format="sec")
+            minute = TimeDelta(60, format="sec")
+
+            self.assertEqual(cache.missing("MTM1M3TS", "thermalData", start, end), [(start, end)])
+
+            cache.write("MTM1M3TS", "thermalData", start, end, efd_data(start, end))
+            self.assertEqual(cache.missing("MTM1M3TS", "thermalData", start, end), [])
+
+            missing = cache.missing("MTM1M3TS", "thermalData", start - minute, end + minute)
+            self.assertEqual(len(missing), 2)
+            self.assertEqual(missing[0][1].isot, start.isot)
+            self.assertEqual(missing[1][0].isot, end.isot)
+
+            data = EfdDiskCache(directory).read("MTM1M3TS", "thermalData", start, end)
+            self.assertEqual(len(data), 1800)
+            self.assertEqual(data.index[0], pd.Timestamp("2025-05-19T23:40:01", tz="UTC"))
+            self.assertEqual(data.index[-1], pd.Timestamp("2025-05-20T00:10:00", tz="UTC"))
+
+            data = cache.read("MTM1M3TS", "thermalData", start + minute, start + 2 * minute)
+            self.assertEqual(len(data), 60)
+
+            # overlapping write doesn't duplicate rows
+            cache.write(
+                "MTM1M3TS",
+                "thermalData",
+                start + minute,
+                end + minute,
+                efd_data(start + minute, end + minute),
+            )
+            self.assertEqual(len(cache.read("MTM1M3TS", "thermalData", start, end + minute)), 1860)
+            self.assertEqual(len(cache.coverage("MTM1M3TS", "thermalData")), 1)
+
+    def test_interval_files(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = EfdDiskCache(directory)
+
+            start = Time("2025-05-19T23:40:00", scale="utc")
+            minute = TimeDelta(60, format="sec")
+            topic_dir = f"{directory}/MTM1M3TS/thermalData"
+
+            cache.write("MTM1M3TS", "thermalData", start, start + minute, efd_data(start, start + minute))
+            first = sorted(os.listdir(topic_dir))
+            self.assertEqual(len(first), 2)
+            mtime = os.stat(f"{topic_dir}/{first[0]}").st_mtime_ns
+
+            # next chunk is written into its own file, the first isn't touched
+            cache.write(
+                "MTM1M3TS",
+                "thermalData",
+                start + minute,
+                start + 2 * minute,
+                efd_data(start + minute, start + 2 * minute),
+            )
+            self.assertEqual(len(os.listdir(topic_dir)), 3)
+            self.assertEqual(os.stat(f"{topic_dir}/{first[0]}").st_mtime_ns, mtime)
+
+            data = cache.read("MTM1M3TS", "thermalData", start + minute / 2, start + 1.5 * minute)
+            self.assertEqual(len(data), 61)
+            self.assertTrue(data.index.is_monotonic_increasing)
+            self.assertEqual(data.index[0], pd.Timestamp("2025-05-19T23:40:30", tz="UTC"))
+
+            self.assertTrue(cache.read("MTM1M3TS", "thermalData", start - 2 * minute, start - minute).empty)
+
+    def test_recent(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = EfdDiskCache(directory, ingest_lag=60)
+
+            end = Time.now()
+            start = end - TimeDelta(600, format="sec")
+
+            cache.write("MTM1M3TS", "thermalData", start, end, efd_data(start, end))
+            self.assertEqual(len(cache.read("MTM1M3TS", "thermalData", start, end)), 600)
+
+            # last minute isn't recorded as retrieved, so it's queried again
+            missing = cache.missing("MTM1M3TS", "thermalData", start, end)
+            self.assertEqual(len(missing), 1)
+            self.assertAlmostEqual((missing[0][0] - start).sec, 540, delta=5)
+            self.assertEqual(missing[0][1], end)
+
+            recent = end - TimeDelta(30, format="sec")
+            cache.write("MTM1M3TS", "thermalData", recent, end, efd_data(recent, end))
+            self.assertEqual(len(cache.coverage("MTM1M3TS", "thermalData")), 1)
+
+            # re-queried rows aren't duplicated
+            self.assertEqual(len(cache.read("MTM1M3TS", "thermalData", start, end)), 600)
+
+
+class EfdDiskCacheConcurrentTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_chunks(self) -> None:
+        start = Time("2025-05-19T23:40:00", scale="utc")
+        end = start + TimeDelta(120, format="sec")
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = MockEfdClient(latency=0.01)
+            expected = len(await client.select_time_series("lsst.sal.MTM1M3TS.thermalData", "*", start, end))
+            disk_cache = EfdDiskCache(directory)
+            fetcher = EfdFetcher(client, max_concurrent=12, min_chunk=1)
+            cache = EfdTopicCache()
+
+            # chunks in the same hour, written in parallel
+            request = EfdCacheRequest(
+                "MTM1M3TS", "thermalData", cache, start, end, TimeDelta(10, format="sec")
+            )
+            self.assertGreaterEqual(len(request.chunks(TimeDelta(10, format="sec"))), 12)
+            await request.load(fetcher, disk_cache)
+
+            assert cache.data is not None
+            self.assertEqual(len(cache.data), expected)
+
+            self.assertEqual(disk_cache.missing("MTM1M3TS", "thermalData", start, end), [])
+            self.assertEqual(len(disk_cache.coverage("MTM1M3TS", "thermalData")), 1)
+
+            reopened = EfdDiskCache(directory)
+            self.assertEqual(len(reopened.coverage("MTM1M3TS", "thermalData")), 1)
+            self.assertEqual(len(reopened.read("MTM1M3TS", "thermalData", start, end)), expected)
+
+            # a file per fetched chunk
+            files = os.listdir(f"{directory}/MTM1M3TS/thermalData")
+            self.assertIn("coverage.json", files)
+            self.assertGreaterEqual(len([f for f in files if f.endswith(".parquet")]), 12)
+            self.assertEqual(len(files), len([f for f in files if f.endswith(".parquet")]) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
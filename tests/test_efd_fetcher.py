@@ -0,0 +1,108 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+from astropy.time import Time, TimeDelta
+
+from lsst.ts.criopy.salcomm import EfdCacheRequest, EfdFetcher, MockEfdClient
+from lsst.ts.criopy.salcomm.efd_topic_cache import EfdTopicCache
+
+
+class EfdFetcherTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_load(self) -> None:
+        client = MockEfdClient(rate=10, latency=0.05)
+        fetcher = EfdFetcher(client, max_concurrent=3, target_duration=0.001)
+
+        start = Time("2025-05-19T23:40:00", scale="utc")
+        cache = EfdTopicCache()
+        request = EfdCacheRequest(
+            "Test",
+            "values",
+            cache,
+            start,
+            start + TimeDelta(600, format="sec"),
+            TimeDelta(120, format="sec"),
+        )
+        await request.load(fetcher)
+
+        self.assertEqual(client.queries, 5)
+        self.assertEqual(client.max_parallel, 3)
+        assert cache.data is not None
+        self.assertEqual(len(cache.data), 6001)
+        self.assertTrue(cache.data.index.is_monotonic_increasing)
+        self.assertEqual(cache.start, request.start)
+        self.assertEqual(cache.end, request.end)
+
+        # 1200 rows per 0.05 s query - 1 ms query shall retrieve about 2.4
+        # seconds of data, which is below min_chunk
+        self.assertEqual(fetcher.chunk_duration("values", request.max_chunk).sec, fetcher.min_chunk)
+
+    async def test_extend(self) -> None:
+        client = MockEfdClient(rate=10, latency=0)
+        fetcher = EfdFetcher(client)
+
+        start = Time("2025-05-19T23:40:00", scale="utc")
+        minute = TimeDelta(60, format="sec")
+        chunk = TimeDelta(120, format="sec")
+        cache = EfdTopicCache()
+
+        await EfdCacheRequest("Test", "values", cache, start, start + minute, chunk).load(fetcher)
+
+        forward = EfdCacheRequest("Test", "values", cache, start + minute, start + 2 * minute, chunk)
+        self.assertTrue(forward.forward())
+        self.assertTrue(forward.adjoins())
+        await forward.load(fetcher)
+
+        backward = EfdCacheRequest("Test", "values", cache, start - minute, start, chunk)
+        self.assertFalse(backward.forward())
+        self.assertTrue(backward.adjoins())
+        await backward.load(fetcher)
+
+        assert cache.data is not None
+        self.assertEqual(len(cache.data), 1801)
+        self.assertEqual(cache.start, start - minute)
+        self.assertEqual(cache.end, start + 2 * minute)
+
+        # not adjacent request replaces cached data
+        distant = EfdCacheRequest("Test", "values", cache, start + 4 * minute, start + 5 * minute, chunk)
+        self.assertFalse(distant.adjoins())
+        await distant.load(fetcher)
+        self.assertEqual(len(cache.data), 601)
+        self.assertEqual(cache.start, start + 4 * minute)
+        self.assertEqual(cache.end, start + 5 * minute)
+
+    async def test_retry(self) -> None:
+        client = MockEfdClient(latency=0, failures=2)
+        fetcher = EfdFetcher(client, retries=2, backoff=0.01)
+
+        start = Time("2025-05-19T23:40:00", scale="utc")
+        data = await fetcher.select("Test", "values", start, start + TimeDelta(1, format="sec"))
+        self.assertEqual(len(data), 51)
+        self.assertEqual(fetcher.retried, 2)
+
+        client.failures = 3
+        with self.assertRaises(ConnectionError):
+            await fetcher.select("Test", "values", start, start + TimeDelta(1, format="sec"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from astropy.time import Time, TimeDelta
+
+from lsst.ts.criopy.salcomm.efd_topic_cache import EfdTopic, EfdTopicCache, EfdTopicLayout, time_ns
+
+
+def efd_data(start: str, periods: int) -> pd.DataFrame:
+    index = pd.date_range(pd.Timestamp(start, tz="UTC"), periods=periods, freq="1s")
+    stamps = index.values.astype("datetime64[ns]").astype(np.int64) / 1e9
+    return pd.DataFrame(
+        {"value0": np.arange(periods), "value1": -np.arange(periods), "private_sndStamp": stamps},
+        index=index,
+    )
+
+
+class EfdTopicCacheTestCase(unittest.TestCase):
+    def test_set_current_time(self) -> None:
+        cache = EfdTopicCache()
+        # merged backward - data shall be sorted
+        cache.merge(efd_data("2025-05-19T23:40:00", 10))
+        cache.merge(efd_data("2025-05-19T23:39:50", 11))
+        assert cache.data is not None
+        self.assertEqual(len(cache.data), 20)
+        self.assertTrue(cache.data.index.is_monotonic_increasing)
+
+        start = Time("2025-05-19T23:39:50", scale="utc")
+
+        cache.set_current_time(start - TimeDelta(0.001, format="sec"))
+        self.assertIsNone(cache.get())
+
+        cache.set_current_time(start + TimeDelta(10, format="sec"))
+        current = cache.get()
+        assert current is not None
+        self.assertTrue(current._changed)
+        self.assertEqual(current.private_sndStamp, start.unix + 10)
+        self.assertEqual(current.value.tolist(), [0, 0])
+
+        # the same row - the same object, unchanged
+        cache.set_current_time(start + TimeDelta(10.5, format="sec"))
+        self.assertIs(cache.get(), current)
+        self.assertFalse(current._changed)
+
+        cache.set_current_time(start + TimeDelta(100, format="sec"))
+        current = cache.get()
+        assert current is not None
+        self.assertTrue(current._changed)
+        self.assertEqual(current.value.tolist(), [9, -9])
+
+    def test_trim(self) -> None:
+        cache = EfdTopicCache()
+        cache.merge(efd_data("2025-05-19T23:40:00", 100))
+        start = Time("2025-05-19T23:40:00", scale="utc")
+        cache.update(start, start + TimeDelta(99.5, format="sec"))
+        full = cache.nbytes
+        self.assertGreater(full, 0)
+
+        self.assertTrue(cache.covers(time_ns(start + TimeDelta(50, format="sec"))))
+        cache.record_access(time_ns(start + TimeDelta(50, format="sec")))
+        cache.record_access(time_ns(start + TimeDelta(150, format="sec")))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.trim(
+            time_ns(start + TimeDelta(20.5, format="sec")),
+            time_ns(start + TimeDelta(60, format="sec")),
+        )
+        assert cache.data is not None
+        # row before keep start is kept
+        self.assertEqual(len(cache.data), 41)
+        self.assertLess(cache.nbytes, full / 2)
+        self.assertEqual(cache.start, start + TimeDelta(20.5, format="sec"))
+        self.assertEqual(cache.end, start + TimeDelta(60, format="sec"))
+
+        cache.set_current_time(start + TimeDelta(20.7, format="sec"))
+        current = cache.get()
+        assert current is not None
+        self.assertEqual(current.value.tolist(), [20, -20])
+
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
+        self.assertIsNone(cache.start)
+
+    def test_layout(self) -> None:
+        data = pd.DataFrame(
+            {
+                "force0": [1.0, 2.0],
+                "force1": [3.0, 4.0],
+                "force10": [5.0, 6.0],
+                "force2": [7.0, 8.0],
+                "force3": [0.0, 0.0],
+                "force4": [0.0, 0.0],
+                "force5": [0.0, 0.0],
+                "force6": [0.0, 0.0],
+                "force7": [0.0, 0.0],
+                "force8": [0.0, 0.0],
+                "force9": [9.0, 10.0],
+                "state0": [1, 2],
+                "state2": [3, 4],
+                "name": ["a", "b"],
+                "private_sndStamp": [1.5, 2.5],
+            }
+        )
+        layout = EfdTopicLayout(data)
+        scalars = [n for names, _ in layout.scalars.values() for n in names]
+        self.assertEqual(sorted(scalars), ["name", "private_sndStamp"])
+        self.assertEqual(sorted(n for n, _, _, _ in layout.arrays), ["force", "state"])
+
+        blocks = layout.blocks(data)
+        topic = EfdTopic(layout, blocks, 1, True)
+        self.assertEqual(topic.name, "b")
+        self.assertEqual(topic.private_sndStamp, 2.5)
+        self.assertEqual(topic.force.tolist(), [2.0, 4.0, 8.0, 0, 0, 0, 0, 0, 0, 10.0, 6.0])
+        # views into the block
+        self.assertTrue(np.shares_memory(topic.force, blocks[topic.force.dtype.str]))
+        self.assertFalse(topic.force.flags.writeable)
+        # incomplete array is padded with NaN
+        self.assertEqual(topic.state[0], 2)
+        self.assertTrue(np.isnan(topic.state[1]))
+        self.assertEqual(topic.state[2], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import types
+import typing
+import unittest
+
+import pytest
+from PySide6.QtCore import QObject, QSettings, Signal
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from lsst.ts.criopy.gui.sal import EUIWindow, TopicCollection, TopicData, TopicField, TopicWindow
+
+
+class Page(QLabel):
+    constructed: list[str] = []
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.constructed.append(name)
+
+
+class MockSAL(QObject):
+    """Remote keeping the latest data, re-emitted on request."""
+
+    detailedState = Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.latest: typing.Any = None
+
+    def publish(self, data: typing.Any) -> None:
+        self.latest = data
+        self.detailedState.emit(data)
+
+    def reemit_remote(self) -> None:
+        if self.latest is not None:
+            self.detailedState.emit(self.latest)
+
+
+class StatePage(QLabel):
+    def __init__(self, comm: MockSAL):
+        super().__init__("---")
+        comm.detailedState.connect(lambda data: self.setText(data.state))
+
+
+class MockSignal:
+    def __init__(self) -> None:
+        self.slots: list[typing.Any] = []
+
+    def connect(self, slot: typing.Any) -> None:
+        self.slots.append(slot)
+
+    def disconnect(self, slot: typing.Any) -> None:
+        self.slots.remove(slot)
+
+
+class MockComm:
+    def __init__(self) -> None:
+        self.signal = MockSignal()
+        self.remote = types.SimpleNamespace(evt_topic=types.SimpleNamespace(get=lambda: None))
+
+    def coalesced(self, topic: str) -> MockSignal:
+        return self.signal
+
+
+class ValuesWindow(TopicWindow):
+    def __init__(self, comm: MockComm):
+        collection = TopicCollection(TopicData("Topic", [TopicField("Value", "value", 0)], "topic"))
+        super().__init__(comm, collection, QWidget())
+
+    def update_values(self, data: typing.Any) -> None:
+        pass
+
+
+@pytest.mark.usefixtures("qapp")
+class EUIWindowTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.settings_dir = tempfile.TemporaryDirectory()
+        QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, self.settings_dir.name)
+        Page.constructed = []
+
+    def tearDown(self) -> None:
+        self.settings_dir.cleanup()
+
+    def create_window(self, current_tab: str, comms: list[MockSAL] | None = None) -> EUIWindow:
+        settings = QSettings("LSST.TS.Test", "MainWindow")
+        settings.setValue("currentTab", current_tab)
+        settings.sync()
+
+        control = QWidget()
+        control.setLayout(QVBoxLayout())
+        window = EUIWindow("Test", [] if comms is None else comms, csc_control_widget=control)
+        for name in ("First", "Second", "Third"):
+            window.add_page(name, Page, name)
+        return window
+
+    def test_lazy_pages(self) -> None:
+        window = self.create_window("Second")
+        window.show()
+        self.assertEqual(Page.constructed, ["Second"])
+        self.assertEqual(window.tab_widget.currentIndex(), 1)
+
+        window.application_pagination.setCurrentRow(2)
+        window.application_pagination.setCurrentRow(1)
+        self.assertEqual(Page.constructed, ["Second", "Third"])
+        window.hide()
+
+    def test_reemit(self) -> None:
+        comm = MockSAL()
+        window = self.create_window("First", [comm])
+        window.add_page("State", StatePage, comm)
+        window.show()
+
+        comm.publish(types.SimpleNamespace(state="Parked"))
+        window.application_pagination.setCurrentRow(3)
+        self.assertEqual(window.tab_widget.currentWidget().layout().itemAt(0).widget().text(), "Parked")
+
+        window.make_window(False)
+        self.assertEqual(window.windows["State"][0].text(), "Parked")
+        window.windows["State"][0].hide()
+        window.hide()
+
+    def test_missing_page(self) -> None:
+        window = self.create_window("Removed")
+        self.assertEqual(Page.constructed, [])
+
+        window.show()
+        self.assertEqual(window.application_pagination.currentRow(), 0)
+        self.assertEqual(Page.constructed, ["First"])
+        window.hide()
+
+
+@pytest.mark.usefixtures("qapp")
+class TopicWindowTestCase(unittest.TestCase):
+    def test_hide(self) -> None:
+        comm = MockComm()
+        window = ValuesWindow(comm)
+        self.assertEqual(comm.signal.slots, [window.data_changed])
+
+        for _ in range(2):
+            window.show()
+            self.assertEqual(comm.signal.slots, [window.data_changed])
+            window.hide()
+            self.assertEqual(comm.signal.slots, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
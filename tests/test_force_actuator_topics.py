@@ -0,0 +1,81 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import types
+import unittest
+
+import numpy as np
+
+try:
+    from lsst.ts.m1m3.utils import ForceCalculator
+    from lsst.ts.xml.tables.m1m3 import FATABLE_XFA, FATABLE_YFA, FATABLE_ZFA
+
+    from lsst.ts.criopy.m1m3.force_actuator.topics import (
+        _far_neighbors_factors,
+        _near_neighbors_differences,
+    )
+
+    has_m1m3_utils = True
+except ImportError:
+    has_m1m3_utils = False
+
+
+@unittest.skipIf(not has_m1m3_utils, "lsst.ts.m1m3.utils not available")
+class NeighborsTestCase(unittest.TestCase):
+    def random_forces(self, rng: np.random.Generator) -> types.SimpleNamespace:
+        data = types.SimpleNamespace(
+            xForces=rng.normal(0, 50, FATABLE_XFA),
+            yForces=rng.normal(0, 50, FATABLE_YFA),
+            zForces=rng.normal(1000, 200, FATABLE_ZFA),
+            mx=0.0,
+            my=0.0,
+            mz=0.0,
+            forceMagnitude=0.0,
+            private_sndStamp=0.0,
+            timestamp=0.0,
+        )
+        data.fx = data.xForces.sum()
+        data.fy = data.yForces.sum()
+        data.fz = data.zForces.sum()
+        return data
+
+    def test_neighbors(self) -> None:
+        rng = np.random.default_rng(42)
+        for _ in range(10):
+            data = self.random_forces(rng)
+            forces = ForceCalculator.SALAppliedForces(data)
+
+            forces.calculate_near_neighbors_forces()
+            np.testing.assert_allclose(
+                _near_neighbors_differences(data),
+                np.subtract(forces.zForces, forces.near_neighbors_forces),
+            )
+
+            forces.calculate_far_neighbors_magnitudes()
+            average = forces.global_average_force
+            np.testing.assert_allclose(
+                _far_neighbors_factors(data),
+                (np.asarray(forces.far_neighbors_magnitudes) - average) / average,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import unittest
+
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt
+
+from lsst.ts.criopy.gui.actuatorsdisplay import DataItemState, GaugeScale, Mirror
+from lsst.ts.criopy.gui.actuatorsdisplay.mirror_benchmark import benchmark_repaint
+
+
+@pytest.mark.usefixtures("qapp")
+class MirrorTestCase(unittest.TestCase):
+    def test_color_indices(self) -> None:
+        scale = GaugeScale()
+        scale.set_range(0, 10)
+        self.assertEqual(
+            scale.color_indices(np.array([0, 5, 10, 20, np.nan])).tolist(),
+            [GaugeScale.LUT_SIZE - 1, GaugeScale.LUT_SIZE // 2, 0, 0, -1],
+        )
+
+        scale.set_range(1, 1)
+        self.assertEqual(scale.color_indices(np.array([1, np.inf])).tolist(), [0, -1])
+
+    def test_get_brush(self) -> None:
+        scale = GaugeScale()
+        scale.set_range(0, 10)
+        self.assertIs(scale.get_brush(4), scale.get_brush(4.001))
+        self.assertEqual(scale.get_brush(10).color(), scale.get_color(0))
+        self.assertEqual(scale.get_brush(0).color(), scale.get_color(1))
+        self.assertIs(scale.get_brush(20), scale.get_brush(10))
+        self.assertEqual(scale.get_brush(np.nan).style(), Qt.Dense5Pattern)
+
+    def test_update_force_actuators(self) -> None:
+        mirror = Mirror(support=True)
+        scale = GaugeScale()
+        scale.set_range(-100, 100)
+        mirror.set_color_scale(scale)
+
+        count = len(mirror.fa)
+        indices = np.arange(count)
+        values = np.linspace(-100, 100, count)
+        states = np.full(count, DataItemState.ACTIVE.value)
+        states[0] = DataItemState.INACTIVE.value
+
+        self.assertEqual(len(mirror.update_force_actuators(indices, values, states)), count)
+        self.assertEqual(mirror.update_force_actuators(indices, values, states), [])
+        self.assertTrue(np.isnan(mirror.fa[0].data))
+        self.assertEqual(mirror.fa[1].data, values[1])
+
+        values[1] += 0.001
+        values[2] += 10
+        states[3] = DataItemState.WARNING.value
+        self.assertEqual(mirror.update_force_actuators(indices, values, states), [2, 3])
+        self.assertEqual(mirror.fa[1].data, values[1])
+
+    def test_benchmark_repaint(self) -> None:
+        for cached in (True, False):
+            result = benchmark_repaint(frames=2, cached=cached)
+            self.assertEqual(result.cached, cached)
+            self.assertGreater(result.full, 0)
+            self.assertGreater(result.update, 0)
+            self.assertGreater(result.pan, 0)
+            self.assertGreater(result.render, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import time
+import unittest
+
+from astropy.time import Time, TimeDelta
+
+from lsst.ts.criopy.salcomm import MockEfdClient
+
+try:
+    import pyarrow  # noqa: F401
+
+    has_pyarrow = True
+except ImportError:
+    has_pyarrow = False
+
+
+class MockEfdClientTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.start = Time("2025-05-19T23:40:00", scale="utc")
+        self.end = self.start + TimeDelta(10, format="sec")
+
+    async def test_schemas(self) -> None:
+        client = MockEfdClient(latency=0)
+
+        data = await client.select_time_series("lsst.sal.MTM1M3.forceActuatorData", "*", self.start, self.end)
+        self.assertEqual(len(data), 501)
+        self.assertIn("zForce155", data.columns)
+        self.assertNotIn("zForce156", data.columns)
+        self.assertIn("fz", data.columns)
+        self.assertIn("private_sndStamp", data.columns)
+
+        data = await client.select_time_series("lsst.sal.MTVMS.data", "*", self.start, self.end)
+        self.assertEqual(len(data), 201)
+        self.assertIn("accelerationZ49", data.columns)
+
+        data = await client.select_time_series("lsst.sal.MTM1M3TS.thermalData", "*", self.start, self.end)
+        self.assertEqual(len(data), 11)
+        self.assertIn("absoluteTemperature95", data.columns)
+
+        data = await client.select_time_series("lsst.sal.Test.values", "*", self.start, self.end)
+        self.assertEqual(list(data.columns), ["value0", "private_sndStamp"])
+        self.assertEqual(client.queries, 4)
+
+    async def test_bandwidth(self) -> None:
+        client = MockEfdClient(latency=0, bandwidth=1e6)
+
+        query_start = time.monotonic()
+        await client.select_time_series("lsst.sal.MTM1M3.forceActuatorData", "*", self.start, self.end)
+        duration = time.monotonic() - query_start
+
+        self.assertGreaterEqual(client.transferred, 501 * 544 * 8)
+        self.assertGreaterEqual(duration, client.transferred / 1e6)
+
+    @unittest.skipIf(not has_pyarrow, "pyarrow not available")
+    async def test_recorded(self) -> None:
+        generated = MockEfdClient(latency=0).generate(
+            "lsst.sal.MTM1M3TS.thermalData", self.start, self.start + TimeDelta(60, format="sec")
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            generated.to_parquet(f"{directory}/lsst.sal.MTM1M3TS.thermalData.parquet")
+            client = MockEfdClient.from_parquet(directory, latency=0)
+
+        data = await client.select_time_series("lsst.sal.MTM1M3TS.thermalData", "*", self.start, self.end)
+        self.assertEqual(len(data), 11)
+        self.assertTrue(data.equals(generated.iloc[:11]))
+
+
+if __name__ == "__main__":
+    unittest.main()
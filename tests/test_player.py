@@ -0,0 +1,100 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import types
+import typing
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from astropy.time import Time, TimeDelta
+
+from lsst.ts.criopy.salcomm import MockEfdClient, Player
+
+
+class RecordingTopic:
+    def __init__(self) -> None:
+        self.stamps: list[float] = []
+
+    def emit(self, data: typing.Any) -> None:
+        self.stamps.append(data.private_sndStamp)
+
+
+class ReplayedSAL:
+    """Provides the parts of MetaSAL interface used by Player."""
+
+    def __init__(self) -> None:
+        self.remote = types.SimpleNamespace(salinfo=types.SimpleNamespace(name="Test"))
+        self.values = RecordingTopic()
+
+    def telemetry(self) -> list[str]:
+        return ["values"]
+
+    def events(self) -> list[str]:
+        return []
+
+
+class PlayerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.sal = ReplayedSAL()
+        self.player = Player(self.sal, efd_client=MockEfdClient(rate=10, latency=0))
+        self.start = Time("2025-05-19T23:40:00", scale="utc")
+
+    async def asyncTearDown(self) -> None:
+        for worker in self.player.workers:
+            worker.cancel()
+        await asyncio.gather(*self.player.workers, return_exceptions=True)
+
+    def test_predict(self) -> None:
+        duration = TimeDelta(10, format="sec")
+        max_span = TimeDelta(600, format="sec")
+
+        def assert_windows(timepoint: Time, expected: list[float]) -> None:
+            predicted = self.player.predict(timepoint, duration, max_span)
+            np.testing.assert_allclose([(p - timepoint).sec for p in predicted], expected, atol=1e-6)
+
+        with patch("time.monotonic", side_effect=[0.0, 0.01, 0.02]):
+            assert_windows(self.start, [10, 20])
+
+            # slider jump results in fast playback, capped at max_span
+            assert_windows(self.start + TimeDelta(5, format="sec"), [600, 1200])
+
+            # seek beyond the prefetch horizon resets the speed
+            assert_windows(self.start + TimeDelta(1, format="jd"), [10, 20])
+
+    async def test_seek(self) -> None:
+        duration = TimeDelta(60, format="sec")
+
+        await self.player.replay("test", self.start, duration)
+        self.assertAlmostEqual(self.sal.values.stamps[-1], self.start.unix)
+        await self.player.worker_queue.join()
+
+        # only data of the new timepoint are emitted after seek
+        self.sal.values.stamps.clear()
+        seek = self.start + TimeDelta(3600, format="sec")
+        await self.player.replay("test", seek, duration)
+        self.assertEqual(len(self.sal.values.stamps), 1)
+        self.assertAlmostEqual(self.sal.values.stamps[0], seek.unix)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import types
+import unittest
+
+import pytest
+
+from lsst.ts.criopy.gui.sal import Messages
+from lsst.ts.criopy.gui.sal.log_benchmark import benchmark_log
+
+
+@pytest.mark.usefixtures("qapp")
+class MessagesTestCase(unittest.TestCase):
+    def message(self, i: int, level: int = 20) -> types.SimpleNamespace:
+        return types.SimpleNamespace(private_sndStamp=1.7e9 + i, level=level, message=f"<message {i}>")
+
+    def test_flush(self) -> None:
+        appended = Messages()
+        batched = Messages()
+        for i, level in enumerate([10, 20, 30, 40, 50]):
+            appended.appendHtml(appended.format(self.message(i, level)))
+            batched.logMessage(self.message(i, level))
+
+        self.assertTrue(batched.document().isEmpty())
+        batched.flush()
+        self.assertEqual(batched.document().blockCount(), 5)
+        self.assertEqual(batched.document().toHtml(), appended.document().toHtml())
+
+    def test_limits(self) -> None:
+        messages = Messages()
+        messages.setMaximumBlockCount(3)
+        for i in range(10):
+            messages.logMessage(self.message(i))
+        messages.flush()
+        self.assertEqual(messages.document().blockCount(), 3)
+        self.assertTrue(messages.toPlainText().endswith("<message 9>"))
+
+        messages.clear()
+        messages.setDisplayLevel(3)
+        messages.logMessage(self.message(0, 20))
+        messages.logMessage(self.message(1, 40))
+        messages.flush()
+        self.assertEqual(messages.document().blockCount(), 1)
+        self.assertIn("<message 1>", messages.toPlainText())
+
+    def test_benchmark_log(self) -> None:
+        for batched in (True, False):
+            result = benchmark_log(messages=200, batched=batched)
+            self.assertEqual(result.batched, batched)
+            self.assertGreater(result.busy, 0)
+            self.assertGreater(result.load, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import unittest
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+from lsst.ts.criopy.salcomm import SignalCoalescer
+
+
+class MockSAL(QObject):
+    forceActuatorData = Signal(map)
+    hardpointActuatorData = Signal(map)
+
+
+@pytest.mark.usefixtures("qapp")
+class SignalCoalescerTestCase(unittest.TestCase):
+    def test_coalesce(self) -> None:
+        sal = MockSAL()
+        coalescer = SignalCoalescer(sal, rate=10)
+
+        forces = []
+        hardpoints = []
+        coalescer.signal("forceActuatorData").connect(forces.append)
+        coalescer.signal("hardpointActuatorData").connect(hardpoints.append)
+
+        for i in range(5):
+            sal.forceActuatorData.emit({"i": i})
+        sal.hardpointActuatorData.emit({"i": 10})
+        self.assertEqual(forces, [])
+
+        coalescer.flush()
+        self.assertEqual(forces, [{"i": 4}])
+        self.assertEqual(hardpoints, [{"i": 10}])
+
+        sal.forceActuatorData.emit({"i": 5})
+        coalescer.flush()
+        coalescer.flush()
+        self.assertEqual(forces, [{"i": 4}, {"i": 5}])
+        self.assertEqual(len(hardpoints), 1)
+
+    def test_signal(self) -> None:
+        sal = MockSAL()
+        coalescer = SignalCoalescer(sal)
+
+        self.assertIs(coalescer.signal("forceActuatorData"), coalescer.signal("forceActuatorData"))
+        with self.assertRaises(AttributeError):
+            coalescer.signal("nonExisting")
+
+        coalescer.set_rate(50)
+        self.assertEqual(coalescer.rate, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+try:
+    from lsst.ts.xml.tables.m1m3 import FCUTable
+
+    from lsst.ts.criopy.m1m3ts.thermal_value_page_widget import CommandWidget
+
+    has_xml = True
+except ImportError:
+    has_xml = False
+
+
+class MockM1M3TS(QObject):
+    engineeringMode = Signal(object)
+
+
+@unittest.skipIf(not has_xml, "lsst.ts.xml not available")
+@pytest.mark.usefixtures("qapp")
+class CommandWidgetTestCase(unittest.TestCase):
+    def test_demands(self) -> None:
+        widget = CommandWidget(MockM1M3TS())
+
+        widget.flat_demand.setValue(50)
+        widget.set_constant()
+        widget.m1_demand.setValue(100)
+        widget.set_m1()
+        widget.m3_demand.setValue(255)
+        widget.set_m3()
+
+        expected = [50] * 96
+        for fcu in FCUTable:
+            if fcu.is_m1():
+                expected[fcu.index] = 100
+            elif fcu.is_m3():
+                expected[fcu.index] = 255
+        self.assertEqual(widget.data_widget.get_values(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import unittest
+
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt
+
+from lsst.ts.criopy.gui import ValueTableModel
+
+
+@pytest.mark.usefixtures("qapp")
+class ValueTableModelTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = ValueTableModel([(0, 1), (0, 2), (2, 0), (3, 3)], 4, 4, fmt=".1f")
+        self.changed: list[tuple[int, int, int, int]] = []
+        self.model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: self.changed.append(
+                (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+            )
+        )
+
+    def text(self, row: int, column: int) -> str | None:
+        return self.model.data(self.model.index(row, column))
+
+    def test_set_values(self) -> None:
+        self.assertEqual(self.text(0, 1), "---")
+        self.assertIsNone(self.text(0, 0))
+
+        self.model.set_values([1, 2, 3, 4.04])
+        self.assertEqual(self.changed, [(0, 0, 3, 3)])
+        self.assertEqual(self.text(0, 2), "2.0")
+        self.assertEqual(self.text(3, 3), "4.0")
+
+        self.changed.clear()
+        self.model.set_values([1.0, 2.5, 3.0, np.nan])
+        self.model.set_values([1.0, 2.5, 3.0, np.nan])
+        self.assertEqual(self.changed, [(0, 2, 3, 3)])
+
+        self.changed.clear()
+        self.model.set_values([1.0, 2.5, 3.5, np.nan])
+        self.model.set_values([1.0, 2.7, 3.5, np.nan])
+        self.assertEqual(self.changed, [(2, 0, 2, 0), (0, 2, 0, 2)])
+        self.assertEqual(self.text(0, 2), "2.7")
+        self.assertEqual(self.text(3, 3), "---")
+
+    def test_edit(self) -> None:
+        self.model.set_values([1, 2, 3, 4])
+        index = self.model.index(2, 0)
+        self.assertFalse(self.model.flags(index) & Qt.ItemIsEditable)
+
+        self.model.set_editable(True)
+        self.assertTrue(self.model.flags(index) & Qt.ItemIsEditable)
+        self.assertTrue(self.model.setData(index, "10"))
+        self.assertFalse(self.model.setData(index, "ten"))
+        self.assertFalse(self.model.setData(self.model.index(0, 0), "10"))
+        self.assertEqual(self.model.values().tolist(), [1, 2, 10, 4])
+
+    def test_strings(self) -> None:
+        self.model.set_values(["50"] * 4)
+        self.model.set_value(1, "100")
+        self.model.set_editable(True)
+        self.assertTrue(self.model.setData(self.model.index(3, 3), "255"))
+        self.assertEqual(self.model.values().tolist(), ["50", "100", "50", "255"])
+
+    def test_background(self) -> None:
+        self.model.mask_background([False, True, False, True], Qt.red)
+        self.assertEqual(self.changed, [(0, 2, 3, 3)])
+        self.assertEqual(self.model.data(self.model.index(0, 2), Qt.BackgroundRole).color(), Qt.red)
+        self.assertIsNone(self.model.data(self.model.index(0, 1), Qt.BackgroundRole))
+
+        self.model.reset_backgrounds()
+        self.assertIsNone(self.model.data(self.model.index(0, 2), Qt.BackgroundRole))
+
+
+if __name__ == "__main__":
+    unittest.main()
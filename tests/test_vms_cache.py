@@ -0,0 +1,150 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import types
+import unittest
+
+import numpy as np
+
+from lsst.ts.criopy.vms import Cache
+
+SAMPLES = 5
+
+
+def chunk(timestamp: float, sensor: int) -> types.SimpleNamespace:
+    """Returns MTVMS data chunk, with values encoding timestamp and sensor."""
+    values = timestamp * 100 + sensor + np.arange(SAMPLES) / 10
+    return types.SimpleNamespace(
+        timestamp=timestamp,
+        sensor=sensor,
+        accelerationX=values,
+        accelerationY=values + 0.01,
+        accelerationZ=values + 0.02,
+    )
+
+
+class VMSCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = Cache(100, 3)
+        self.cache.setSampleTime(0.01)
+
+    def assertChunk(self, index: int, timestamp: float) -> None:
+        rows = slice(index * SAMPLES, (index + 1) * SAMPLES)
+        np.testing.assert_allclose(
+            self.cache.column("timestamp")[rows], timestamp + np.arange(SAMPLES) * 0.01
+        )
+        for sensor in range(1, 4):
+            expected = chunk(timestamp, sensor)
+            np.testing.assert_array_equal(self.cache.column(f"{sensor} X")[rows], expected.accelerationX)
+            np.testing.assert_array_equal(self.cache.column(f"{sensor} Y")[rows], expected.accelerationY)
+            np.testing.assert_array_equal(self.cache.column(f"{sensor} Z")[rows], expected.accelerationZ)
+
+    def test_in_order(self) -> None:
+        self.assertEqual(self.cache.newChunk(chunk(1, 1)), (False, False))
+        self.assertEqual(self.cache.newChunk(chunk(1, 2)), (False, False))
+        self.assertEqual(self.cache.newChunk(chunk(1, 3)), (True, False))
+        for sensor in range(1, 4):
+            self.cache.newChunk(chunk(2, sensor))
+
+        self.assertEqual(len(self.cache), 2 * SAMPLES)
+        self.assertChunk(0, 1)
+        self.assertChunk(1, 2)
+        self.assertEqual(self.cache.dropped_chunks, 0)
+        self.assertEqual(self.cache.late_chunks, 0)
+
+    def test_out_of_order(self) -> None:
+        # chunks of the newer timestamp completed first wait for the older
+        self.cache.newChunk(chunk(1, 3))
+        self.cache.newChunk(chunk(2, 2))
+        self.cache.newChunk(chunk(2, 1))
+        self.assertEqual(self.cache.newChunk(chunk(2, 3)), (False, False))
+        self.assertEqual(len(self.cache), 0)
+
+        self.cache.newChunk(chunk(1, 2))
+        self.assertEqual(self.cache.newChunk(chunk(1, 1)), (True, False))
+
+        self.assertEqual(len(self.cache), 2 * SAMPLES)
+        self.assertChunk(0, 1)
+        self.assertChunk(1, 2)
+        self.assertEqual(self.cache.dropped_chunks, 0)
+
+    def test_duplicate(self) -> None:
+        self.cache.newChunk(chunk(1, 1))
+        self.assertEqual(self.cache.newChunk(chunk(1, 1)), (False, False))
+        self.cache.newChunk(chunk(1, 2))
+        self.assertEqual(self.cache.newChunk(chunk(1, 3)), (True, False))
+        self.assertEqual(len(self.cache), SAMPLES)
+
+        # duplicate of already added chunk is late
+        self.assertEqual(self.cache.newChunk(chunk(1, 2)), (False, False))
+        self.assertEqual(len(self.cache), SAMPLES)
+        self.assertEqual(self.cache.late_chunks, 1)
+        self.assertEqual(self.cache.dropped_chunks, 0)
+
+    def test_missing_sensor(self) -> None:
+        # sensor 2 never arrives for timestamp 1
+        self.cache.newChunk(chunk(1, 1))
+        self.cache.newChunk(chunk(1, 3))
+        for timestamp in (2, 3):
+            for sensor in range(1, 4):
+                self.assertEqual(self.cache.newChunk(chunk(timestamp, sensor)), (False, False))
+
+        self.assertEqual(len(self.cache), 0)
+
+        # the fourth pending timestamp evicts the incomplete chunk, complete
+        # chunks behind it are added
+        self.cache.newChunk(chunk(4, 1))
+        self.assertEqual(self.cache.dropped_chunks, 1)
+        self.assertEqual(len(self.cache), 2 * SAMPLES)
+        self.assertChunk(0, 2)
+        self.assertChunk(1, 3)
+
+    def test_evicted_late(self) -> None:
+        self.cache.newChunk(chunk(1, 1))
+        for timestamp in (2, 3, 4):
+            self.cache.newChunk(chunk(timestamp, 1))
+
+        self.assertEqual(self.cache.dropped_chunks, 1)
+
+        # chunk of the evicted timestamp arrives after eviction
+        self.assertEqual(self.cache.newChunk(chunk(1, 2)), (False, False))
+        self.assertEqual(self.cache.late_chunks, 1)
+
+        # evicting timestamp 2 reports removed chunk
+        self.cache.newChunk(chunk(5, 2))
+        self.assertEqual(self.cache.newChunk(chunk(6, 1)), (False, True))
+        self.assertEqual(self.cache.dropped_chunks, 3)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self) -> None:
+        self.cache.newChunk(chunk(1, 1))
+        self.cache.newChunk(chunk(2, 1))
+        self.cache.clear()
+
+        # after clear, older timestamps are accepted again
+        for sensor in range(1, 4):
+            self.cache.newChunk(chunk(0.5, sensor))
+        self.assertEqual(len(self.cache), SAMPLES)
+        self.assertChunk(0, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# This file is part of criopy package.
+#
+# Developed for the LSST Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import typing
+import unittest
+from datetime import datetime
+
+import h5py
+import numpy as np
+
+from lsst.ts.criopy.vms import (
+    Cache,
+    Collector,
+    HDF5Output,
+    Output,
+    OutputWriter,
+    ParquetOutput,
+    ZarrOutput,
+    output_class,
+)
+
+try:
+    import pyarrow.parquet as pq
+
+    has_pyarrow = True
+except ImportError:
+    has_pyarrow = False
+
+try:
+    import zarr
+
+    has_zarr = True
+except ImportError:
+    has_zarr = False
+
+ROWS = 100
+FILE_SIZE = 60
+CHUNK_SIZE = 20
+
+
+class OutputTestCase(unittest.IsolatedAsyncioTestCase):
+    def create_cache(self) -> Cache:
+        cache = Cache(ROWS + 10, 3)
+        cache.append_block({n: np.arange(ROWS) + 1000 * i for i, n in enumerate(cache.columns())})
+        return cache
+
+    async def write(
+        self, cache: Cache, output_type: type[Output], directory: str, compress: bool
+    ) -> list[str]:
+        """Writes cache rows into files of FILE_SIZE rows, rotating the output
+        when filled."""
+        writer = OutputWriter()
+        filenames = []
+        while len(cache) > 0:
+            filename = os.path.join(directory, f"{len(filenames)}.{output_type.EXTENSION}")
+            output = output_type(filename, cache, FILE_SIZE, CHUNK_SIZE, compress)
+            while not output.filled() and len(cache) > 0:
+                await writer.write(cache, CHUNK_SIZE, output)
+            await writer.drain()
+            output.close()
+            filenames.append(output.filename)
+
+        writer.close()
+        self.assertEqual(writer.written_rows, ROWS)
+        return filenames
+
+    async def roundtrip(
+        self, output_type: type[Output], read: typing.Callable[[str, str], np.ndarray]
+    ) -> None:
+        for compress in (False, True):
+            with self.subTest(compress=compress), tempfile.TemporaryDirectory() as directory:
+                cache = self.create_cache()
+                expected = cache.rows().copy()
+
+                filenames = await self.write(cache, output_type, directory, compress)
+
+                self.assertEqual(len(filenames), 2)
+                self.assertEqual(len(read(filenames[0], "timestamp")), FILE_SIZE)
+                for n in cache.columns():
+                    data = np.concatenate([read(filename, n) for filename in filenames])
+                    np.testing.assert_array_equal(data, expected[n])
+
+    async def rerun(
+        self, output_type: type[Output], directory: str
+    ) -> tuple[list[str], list[str], np.ndarray]:
+        """Writes data twice into the same filenames, as a restarted logger
+        does."""
+        cache = self.create_cache()
+        expected = cache.rows().copy()
+        first = await self.write(cache, output_type, directory, False)
+        second = await self.write(self.create_cache(), output_type, directory, False)
+        return first, second, expected
+
+    async def test_hdf5(self) -> None:
+        def read(filename: str, column: str) -> np.ndarray:
+            with h5py.File(filename, "r") as h5file:
+                return h5file[column][:]
+
+        await self.roundtrip(HDF5Output, read)
+
+    @unittest.skipIf(not has_pyarrow, "pyarrow not available")
+    async def test_parquet(self) -> None:
+        def read(filename: str, column: str) -> np.ndarray:
+            parquet = pq.ParquetFile(filename)
+            self.assertEqual(parquet.metadata.row_group(0).num_rows, CHUNK_SIZE)
+            return parquet.read([column]).column(column).to_numpy()
+
+        await self.roundtrip(ParquetOutput, read)
+
+    @unittest.skipIf(not has_pyarrow, "pyarrow not available")
+    async def test_parquet_rerun(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            first, second, expected = await self.rerun(ParquetOutput, directory)
+
+            self.assertEqual(second, [os.path.join(directory, f"{i}.1.parquet") for i in range(2)])
+            for filenames in (first, second):
+                for n in expected.dtype.names:
+                    data = np.concatenate(
+                        [pq.read_table(f, columns=[n]).column(n).to_numpy() for f in filenames]
+                    )
+                    np.testing.assert_array_equal(data, expected[n])
+
+    @unittest.skipIf(not has_zarr, "zarr not available")
+    async def test_zarr(self) -> None:
+        def read(filename: str, column: str) -> np.ndarray:
+            return zarr.open_group(filename, mode="r")[column][:]
+
+        await self.roundtrip(ZarrOutput, read)
+
+    @unittest.skipIf(not has_zarr, "zarr not available")
+    async def test_zarr_rerun(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            first, second, expected = await self.rerun(ZarrOutput, directory)
+
+            self.assertEqual(first, second)
+            for n in expected.dtype.names:
+                data = [zarr.open_group(f, mode="r")[n][:] for f in first]
+                # first run rows are followed by the second run rows
+                np.testing.assert_array_equal(np.concatenate([d[: len(d) // 2] for d in data]), expected[n])
+                np.testing.assert_array_equal(np.concatenate([d[len(d) // 2 :] for d in data]), expected[n])
+
+
+class OutputClassTestCase(unittest.TestCase):
+    def test_output_class(self) -> None:
+        self.assertEqual(output_class("data/%Y-%m-%d.parquet", "z5"), ParquetOutput)
+        self.assertEqual(output_class("data/%Y-%m-%d.zarr", "csv"), ZarrOutput)
+        self.assertEqual(output_class("data/%Y-%m-%d.hdf", "csv"), HDF5Output)
+        self.assertEqual(output_class("data/%Y-%m-%d.${ext}", "z5"), HDF5Output)
+        self.assertIsNone(output_class("data/%Y-%m-%d.${ext}", "z"))
+
+    def test_collector(self) -> None:
+        date = datetime(2025, 5, 19, 23, 40)
+
+        collector = Collector(0, "vms/%Y-%m-%dT%H-${name}.parquet", file_type="z5")
+        self.assertEqual(collector.output_class, ParquetOutput)
+        self.assertEqual(collector._get_filename(date), "vms/2025-05-19T23-M1M3.parquet")
+
+        collector = Collector(1, "vms/%Y-%m-%dT%H-${name}.${ext}", file_type="z5")
+        self.assertEqual(collector.output_class, HDF5Output)
+        self.assertEqual(collector._get_filename(date), "vms/2025-05-19T23-M2.hdf")
+
+        collector = Collector(2, "vms/%Y-%m-%dT%H-${name}.${ext}", file_type="z")
+        self.assertIsNone(collector.output_class)
+        self.assertEqual(collector._get_filename(date), "vms/2025-05-19T23-Rotator.csv.gz")
+
+
+if __name__ == "__main__":
+    unittest.main()
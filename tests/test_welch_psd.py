@@ -0,0 +1,82 @@
+# This file is part of ts_criopy.
+#
+# Developed for the Rubin Observatory Telescope and Site System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy as np
+
+from lsst.ts.criopy.vms import WelchPSD
+
+
+class WelchPSDTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sample_time = 0.001
+        self.timestamps = 1000 + np.arange(20000) * self.sample_time
+        rng = np.random.default_rng(42)
+        self.signal = np.sin(2 * np.pi * 50 * self.timestamps) + 0.1 * rng.standard_normal(
+            len(self.timestamps)
+        )
+
+    def test_incremental(self) -> None:
+        capacity = 5000
+        welch = WelchPSD(1024)
+
+        self.assertIsNone(welch.update(self.timestamps[:500], self.signal[:500], self.sample_time, capacity))
+
+        for end in range(1000, len(self.timestamps), 333):
+            start = max(0, end - capacity)
+            psd = welch.update(self.timestamps[start:end], self.signal[start:end], self.sample_time, capacity)
+
+        assert psd is not None
+        self.assertEqual(welch.nperseg, 1024)
+        self.assertEqual(len(psd), len(welch.frequencies))
+        self.assertLessEqual(welch.segments(), (capacity - 1024) // 512 + 1)
+        self.assertAlmostEqual(welch.frequencies[np.argmax(psd)], 50, delta=1)
+
+        # the same segments calculated at once
+        fresh = WelchPSD(1024)
+        first = int(np.searchsorted(self.timestamps[start:end], next(iter(welch._segments))))
+        reference = fresh.update(
+            self.timestamps[start + first : end], self.signal[start + first : end], self.sample_time, capacity
+        )
+        assert reference is not None
+        self.assertEqual(fresh.segments(), welch.segments())
+        np.testing.assert_allclose(psd, reference)
+
+    def test_short_capacity(self) -> None:
+        welch = WelchPSD()
+        psd = welch.update(self.timestamps[:1000], self.signal[:1000], self.sample_time, 1000)
+        assert psd is not None
+        self.assertEqual(welch.nperseg, 512)
+        self.assertEqual(welch.segments(), 2)
+
+    def test_parseval(self) -> None:
+        # integral of one sided PSD equals signal variance
+        welch = WelchPSD(1024)
+        psd = welch.update(self.timestamps, self.signal, self.sample_time, len(self.signal))
+        assert psd is not None
+        self.assertAlmostEqual(
+            np.sum(psd) * (welch.frequencies[1] - welch.frequencies[0]), np.var(self.signal), delta=0.02
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()